@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.db.session import get_db
 from app.models.address import AddressLog
-from app.schemas.address import AddressCreate, AddressResponse, NormalizationResult
+from app.schemas.address import AddressCreate, AddressResponse, NormalizationResult, BatchLookupRequest
 import threading
 
 router = APIRouter()
@@ -12,6 +12,14 @@ router = APIRouter()
 from app.services.juso_service import juso_service
 from app.services.llm_service import llm_service
 from app.services.local_search import LocalSearchService
+from app.services.autocomplete import autocomplete_index
+from app.services.address_parser import parse_address
+from app.services.result_cache import result_cache, negative_cache
+from app.services.detail_validator import detail_parts, validate_detail
+from app.services.bulk_worker import normalize_chunks, RESULT_COLUMNS
+from app.core.config import settings
+from app.utils.normalize import normalize_raw_key
+from app.services.reverse_lookup import lookup_mgmt_nos, lookup_zip_nos
 from app.db.session import SessionLocal
 import uuid
 import time
@@ -37,7 +45,13 @@ class BulkJobManager:
                 "current_row": 0,
                 "total_rows": 0,
                 "created_at": time.time(),
-                "results": None,  # Will store the final JSON data
+                "results": None,  # Will store the final summary (count / download link)
+                "result_path": None,  # Result CSV spooled to disk while rows are processed
+                "columns": None,      # Result CSV header
+                "chunk_index": [],    # (first row, byte offset) of every chunk written so far
+                "success_rows": 0,
+                "failed_rows": 0,
+                "normalized_rows": 0,  # distinct inputs actually normalized (the rest were duplicates)
                 "filename": ""    # Original filename
             }
         return job_id
@@ -57,6 +71,17 @@ class BulkJobManager:
                 return True
             return False
     
+    def add_result_chunk(self, job_id: str, byte_offset: int, rows: int, success_rows: int, normalized_rows: int):
+        """Record a chunk appended to the result file (rows become readable through /bulk-results)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job:
+                job["chunk_index"].append((job["current_row"], byte_offset))
+                job["current_row"] += rows
+                job["success_rows"] += success_rows
+                job["failed_rows"] += rows - success_rows
+                job["normalized_rows"] += normalized_rows
+
     def finish_job(self, job_id: str, results=None):
         with self.lock:
             if job_id in self.jobs:
@@ -65,32 +90,71 @@ class BulkJobManager:
                     self.jobs[job_id]["results"] = results
     
     def _cleanup_old_jobs(self):
-        """Remove jobs older than TTL (1 hour)"""
+        """Remove finished jobs older than TTL (1 hour), with their result files"""
+        import os
         now = time.time()
-        expired = [jid for jid, state in self.jobs.items() 
-                   if now - state.get("created_at", 0) > self.job_ttl]
+        # A running job is still writing its result file: it expires once it has finished
+        expired = [jid for jid, state in self.jobs.items()
+                   if not state.get("is_running") and now - state.get("created_at", 0) > self.job_ttl]
         for jid in expired:
+            path = self.jobs[jid].get("result_path")
+            if path and os.path.exists(path):
+                os.remove(path)
             del self.jobs[jid]
 
 # Global job manager instance
 bulk_job_manager = BulkJobManager()
 
 
-def _normalize_logic(raw: str, bulk_mode: bool = False) -> NormalizationResult:
+def _normalize_logic(raw: str, bulk_mode: bool = False, check_detail: bool = True) -> NormalizationResult:
     """
     Local-Only Normalization Logic
     Flow: Local DB -> (fail) -> LLM Correction -> Local DB -> (fail) -> Error
     
     bulk_mode: If True, skip LLM calls for faster processing
+    check_detail: validate 동/층/호 from the input against address_detail
+                  (bulk jobs pass False and validate whole row blocks with validate_details)
     """
+    result = _match_address(raw, bulk_mode)
+    parts = detail_parts(parse_address(raw).detail_parts)
+    if check_detail and result.success and parts:
+        db = SessionLocal()
+        try:
+            result.detail_address, result.detail_status = validate_detail(db, result.bd_mgt_sn, parts)
+        except Exception as e:
+            print(f"Detail Validation Error: {e}")
+        finally:
+            db.close()
+    return result
+
+
+def _match_address(raw: str, bulk_mode: bool = False) -> NormalizationResult:
+    """Building-level match (cached results never carry the input's 동/호)"""
+    # 0. Result cache (keyed by the canonical query, successful results only)
+    parsed = parse_address(raw)
+    cache_key = parsed.canonical
+    cached = result_cache.get(cache_key)
+    if cached:
+        return cached.model_copy(deep=True)
+
+    # 0-1. Known to fail even after AI correction with this model (local search included)
+    negative_key = (llm_service.model, cache_key)
+    if negative_cache.get(negative_key):
+        return NormalizationResult(
+            success=False,
+            is_ai_corrected=False,
+            message="needs_review" if bulk_mode else "Address not found in Local DB. (cached)"
+        )
+
     db = SessionLocal()
     local_service = LocalSearchService(db)
     
     try:
         # 1. First Attempt: Local DB Search
-        local_result = local_service.search(raw)
+        local_result = local_service.search(parsed)
         if local_result:
             print(f"DEBUG: Local Hit! {local_result.refined_address}")
+            result_cache.put(cache_key, local_result.model_copy(deep=True))
             return local_result
 
         # 2. If bulk_mode, skip LLM and return immediately with needs_review status
@@ -113,7 +177,12 @@ def _normalize_logic(raw: str, bulk_mode: bool = False) -> NormalizationResult:
             if retry_result:
                 retry_result.is_ai_corrected = True
                 retry_result.message = f"Matched via Local DB (AI Fixed: {corrected_text})"
+                result_cache.put(cache_key, retry_result.model_copy(deep=True))
                 return retry_result
+
+        # The LLM answered and it still did not resolve (LLM unreachable is not cached)
+        if corrected_text is not None:
+            negative_cache.put(negative_key, True)
                 
     except Exception as e:
         print(f"Normalization Error: {e}")
@@ -157,6 +226,7 @@ def normalize_address(
         emd_nm=result.emd_nm,
         buld_nm=result.buld_nm,
         bd_mgt_sn=result.bd_mgt_sn,
+        detail_addr=result.detail_address,
         
         is_ai_corrected=result.is_ai_corrected,
         status="success" if result.success else "fail",
@@ -192,102 +262,186 @@ def search_address_candidates(query: str, limit: int = 10, db: Session = Depends
         "candidates": candidates
     }
 
-def _run_bulk_processing(job_id: str, df: "pd.DataFrame", target_col: str, filename: str):
-    """Background worker for bulk processing"""
-    import io
+def _stream_ndjson(lookup, keys: list[str]):
+    """One JSON record per line, produced chunk by chunk with its own DB session"""
+    import json
+
+    def generate():
+        db = SessionLocal()
+        try:
+            for record in lookup(db, keys):
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post("/lookup/mgmt-no")
+def lookup_by_mgmt_no(request: BatchLookupRequest):
+    """
+    Batch Reverse Lookup by Management No (관리번호 역조회)
+    - Up to 10,000 bd_mgt_sn values per request, streamed back as NDJSON in input order.
+    - Unknown keys come back as {"key": ..., "found": false}.
+    """
+    return _stream_ndjson(lookup_mgmt_nos, request.keys)
+
+
+@router.post("/lookup/zip")
+def lookup_by_zip(request: BatchLookupRequest):
+    """
+    Batch Reverse Lookup by Zip Code (우편번호 역조회)
+    - Every building of each zip code, streamed back as NDJSON grouped by key.
+    """
+    return _stream_ndjson(lookup_zip_nos, request.keys)
+
+
+@router.get("/autocomplete")
+def autocomplete_address(q: str, limit: int = 10, kind: str | None = None, sido: str | None = None):
+    """
+    Autocomplete (자동완성)
+    - Type-ahead completions for road / building / emd names from the in-memory prefix index.
+    - kind: road | building | emd (optional), sido: 시도명 prefix filter (optional)
+    """
+    if not autocomplete_index.is_ready:
+        return {"query": q, "ready": False, "count": 0, "suggestions": []}
+
+    suggestions = autocomplete_index.complete(q, limit=min(limit, 50), kind=kind, sido=sido)
+    return {
+        "query": q,
+        "ready": True,
+        "count": len(suggestions),
+        "suggestions": suggestions
+    }
+
+def _run_bulk_processing(job_id: str, upload_path: str, encoding: str, target_col: str, filename: str):
+    """
+    Background worker for bulk processing
+    - Input read in chunks, normalized on the bulk worker pool.
+    - Every finished chunk is appended to the job's result CSV, so memory stays bounded
+      by the in-flight chunks, not by the file size. Rows are readable through
+      /bulk-results as soon as their chunk is written.
+    - Duplicate addresses (normalize_raw_key) are normalized once and fanned back out
+      to every row, in the original order.
+    """
+    import os
+    import codecs
+    from collections import deque
     import pandas as pd
+    from app.utils.csv_handler import count_csv_rows, iter_csv_chunks, read_csv_header
     
-    results = []
+    def is_cancelled():
+        job = bulk_job_manager.get_job(job_id)
+        return not job or job.get("is_cancelled")
+
+    # (input chunk, key per row, keys sent to the workers) waiting for results (bounded by the in-flight window)
+    inputs = deque()
+    resolved = {}       # dedup key -> result row, shared by every later duplicate
+    shared_keys = set() # keys whose result goes to `resolved` (at most BULK_DEDUP_MAX_KEYS)
+
+    def address_chunks():
+        for chunk_df in iter_csv_chunks(upload_path, encoding, max(1, settings.BULK_CHUNK_ROWS)):
+            if chunk_df.empty:
+                continue  # header-only file (pandas yields one empty chunk)
+            raws = chunk_df[target_col].tolist()
+            keys = [normalize_raw_key(raw) for raw in raws]
+            sent = {}
+            for raw, key in zip(raws, keys):
+                # Earlier chunks come back first, so a shared key is resolved before this chunk is merged
+                if key in shared_keys or key in sent:
+                    continue
+                sent[key] = raw
+                if len(shared_keys) < settings.BULK_DEDUP_MAX_KEYS:
+                    shared_keys.add(key)
+            inputs.append((chunk_df, keys, list(sent)))
+            yield list(sent.values())
+
+    result_path = os.path.join(settings.BULK_SPOOL_DIR, f"{job_id}.result.csv")
+    bulk_job_manager.update_job(job_id, result_path=result_path)
+    count = 0
+    chunks = address_chunks()
     try:
-        for idx, row in df.iterrows():
-            job = bulk_job_manager.get_job(job_id)
-            if not job or job.get("is_cancelled"):
-                break
-                
-            bulk_job_manager.update_job(job_id, current_row=idx + 1)
-            
-            raw_addr = str(row[target_col])
-            res = _normalize_logic(raw_addr, bulk_mode=False) 
-            
-            if res.success:
-                status_val = "success"
-                err_val = "AI 보정 완료" if res.is_ai_corrected else ""
-            else:
-                status_val = "fail"
-                err_val = res.message if res.message else "검색 실패"
-            
-            results.append({
-                "refined_address": res.refined_address,
-                "road_address": res.road_address,
-                "zip_code": res.zip_code,
-                "si_nm": res.si_nm,
-                "sgg_nm": res.sgg_nm,
-                "buld_nm": res.buld_nm,
-                "status": status_val,
-                "error_info": err_val
-            })
-            
-        # Completion
-        result_df = pd.DataFrame(results)
-        final_df = pd.concat([df.reset_index(drop=True), result_df], axis=1)
-        data_list = final_df.fillna("").to_dict(orient="records")
-        
-        csv_buffer = io.StringIO()
-        final_df.to_csv(csv_buffer, index=False, encoding='utf-8-sig')
-        csv_content = csv_buffer.getvalue()
+        bulk_job_manager.update_job(job_id, total_rows=count_csv_rows(upload_path, encoding))
+        # Binary writes keep exact byte offsets for the results cursor; BOM once for Excel
+        with open(result_path, "wb") as out:
+            out.write(codecs.BOM_UTF8)
+            for sent_results in normalize_chunks(chunks, is_cancelled):
+                input_df, keys, sent_keys = inputs.popleft()
+                local = dict(zip(sent_keys, sent_results))
+                resolved.update((k, r) for k, r in local.items() if k in shared_keys)
+                chunk_results = [local[k] if k in local else resolved[k] for k in keys]
+                chunk_df = pd.concat([input_df.reset_index(drop=True), pd.DataFrame(chunk_results)], axis=1)
+                if count == 0:
+                    out.write(chunk_df.head(0).to_csv(index=False, lineterminator="\n").encode("utf-8"))
+                    bulk_job_manager.update_job(job_id, columns=list(chunk_df.columns))
+                offset = out.tell()
+                out.write(chunk_df.to_csv(index=False, header=False, lineterminator="\n").encode("utf-8"))
+                out.flush()
+                count += len(chunk_df)
+                success = sum(1 for r in chunk_results if r["status"] == "success")
+                bulk_job_manager.add_result_chunk(job_id, offset, len(chunk_df), success, len(sent_keys))
+            if count == 0:
+                # Header-only input: the result is still a CSV with the input + result columns
+                columns = read_csv_header(upload_path, encoding) + list(RESULT_COLUMNS)
+                out.write(pd.DataFrame(columns=columns).to_csv(index=False, lineterminator="\n").encode("utf-8"))
+                bulk_job_manager.update_job(job_id, columns=columns)
 
+        # Completion
         bulk_job_manager.finish_job(job_id, results={
-            "count": len(data_list),
-            "results": data_list,
-            "csv_content": csv_content,
+            "count": count,
+            "download_url": f"{settings.API_V1_STR}/address/bulk-download/{job_id}",
             "filename": f"refined_{filename}"
         })
     except Exception as e:
         print(f"Bulk Background Error: {e}")
         bulk_job_manager.finish_job(job_id)
+    finally:
+        chunks.close()
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
 
 
 @router.post("/bulk-normalize")
-async def bulk_normalize_address(
+def bulk_normalize_address(
     background_tasks: BackgroundTasks, 
     file: UploadFile = File(...), 
     db: Session = Depends(get_db)
 ):
     """
     Bulk Normalize from CSV (Asynchronous)
+    - The upload is spooled to disk and streamed in chunks (no row limit, constant memory).
+    - Encoding: UTF-8 / UTF-8 with BOM / CP949, detected from the file.
     - Returns job_id immediately.
     """
-    from app.utils.csv_handler import read_csv_file
+    from app.utils.csv_handler import spool_upload, detect_encoding, read_csv_header
+    import os
     
-    # 1. Read CSV
+    # 1. Spool the upload and read the header
+    upload_path = os.path.join(settings.BULK_SPOOL_DIR, f"upload_{uuid.uuid4().hex}.csv")
     try:
-        df = read_csv_file(file)
+        spool_upload(file, upload_path)
+        encoding = detect_encoding(upload_path)
+        columns = read_csv_header(upload_path, encoding)
     except Exception as e:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
         raise HTTPException(status_code=400, detail=f"Invalid CSV file: {str(e)}")
     
-    # 1-1. Row Limit Check
-    MAX_ROWS = 1000
-    if len(df) > MAX_ROWS:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"CSV 파일이 너무 큽니다. 최대 {MAX_ROWS:,}건까지 처리 가능합니다."
-        )
-    
     # 2. Identify Address Column
     target_col = None
     candidates = ['address', 'addr', 'juso', '주소', 'raw_text']
-    for col in df.columns:
+    for col in columns:
         if col.lower() in candidates:
             target_col = col
             break
     if not target_col:
-        target_col = df.columns[0]
+        target_col = columns[0]
 
-    # 3. Create Job and Start Background Task
+    # 3. Create Job and Start Background Task (total_rows is counted by the task)
     job_id = bulk_job_manager.create_job()
-    bulk_job_manager.update_job(job_id, total_rows=len(df), filename=file.filename)
+    bulk_job_manager.update_job(job_id, filename=file.filename)
     
-    background_tasks.add_task(_run_bulk_processing, job_id, df, target_col, file.filename)
+    background_tasks.add_task(_run_bulk_processing, job_id, upload_path, encoding, target_col, file.filename)
     
     return {"job_id": job_id, "message": "Bulk processing started."}
 
@@ -309,7 +463,7 @@ def debug_local_db(q: str = "테헤란로", db: Session = Depends(get_db)):
             "id": r.id,
             "road": r.road_nm,
             "main": r.buld_mainsn,
-            "full": r.road_full_addr,
+            "full": r.road_address,
             "sido": r.si_nm
         })
         
@@ -321,9 +475,28 @@ def debug_local_db(q: str = "테헤란로", db: Session = Depends(get_db)):
     }
 
 
+@router.get("/cache-stats")
+def cache_stats():
+    """
+    Cache Statistics (캐시 통계)
+    - Size / hit / miss / eviction counters of the in-process result / negative caches.
+    """
+    return {"result_cache": result_cache.stats(), "negative_cache": negative_cache.stats()}
+
+
+def _dedup_ratio(job: dict) -> float:
+    """Share of processed rows answered from an earlier duplicate (0.0 - 1.0)"""
+    if not job["current_row"]:
+        return 0.0
+    return round(1 - job["normalized_rows"] / job["current_row"], 3)
+
+
 @router.get("/bulk-status/{job_id}")
 async def get_bulk_status(job_id: str):
-    """Get bulk processing status for a specific job"""
+    """
+    Get bulk processing status for a specific job (counters only)
+    - Result rows: /bulk-results/{job_id}, the whole file: /bulk-download/{job_id}
+    """
     job = bulk_job_manager.get_job(job_id)
     if not job:
         return {
@@ -335,19 +508,179 @@ async def get_bulk_status(job_id: str):
             "error": "Job not found"
         }
     
+    summary = job.get("results") or {}
     return {
         "is_running": job["is_running"],
         "is_cancelled": job["is_cancelled"],
         "current_row": job["current_row"],
         "total_rows": job["total_rows"],
+        "success_rows": job["success_rows"],
+        "failed_rows": job["failed_rows"],
+        "normalized_rows": job["normalized_rows"],
+        "dedup_ratio": _dedup_ratio(job),
         "progress_percent": (
             round(job["current_row"] / job["total_rows"] * 100, 1)
             if job["total_rows"] > 0 else 0
         ),
-        "results_data": job.get("results") # This will be present only when is_running is False
+        # Present only when is_running is False
+        "download_url": summary.get("download_url"),
+        "filename": summary.get("filename")
+    }
+
+
+def _read_result_rows(job: dict, offset: int, limit: int) -> tuple[list[dict], int]:
+    """Rows [offset, offset + limit) already written to the job's result file, and the written row count"""
+    from bisect import bisect_right
+    from app.utils.csv_handler import read_csv_rows
+
+    with bulk_job_manager.lock:
+        written = job["current_row"]
+        chunk_index = job["chunk_index"]
+        pos = bisect_right(chunk_index, (offset, float("inf"))) - 1
+        start_row, byte_offset = chunk_index[pos] if pos >= 0 else (0, 0)
+    if offset >= written or not job.get("result_path"):
+        return [], written
+    rows = read_csv_rows(job["result_path"], job.get("columns") or [], byte_offset,
+                         offset - start_row, min(limit, written - offset))
+    return rows, written
+
+
+@router.get("/bulk-results/{job_id}")
+def get_bulk_results(job_id: str, offset: int = 0, limit: int = 100):
+    """
+    Bulk Results Page (결과 페이지 조회)
+    - Rows [offset, offset + limit) of the result file, available while the job is still running.
+    - Poll with offset=next_offset to receive only the rows written since the last call.
+    """
+    job = bulk_job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    offset = max(offset, 0)
+    limit = min(max(limit, 1), 1000)
+    rows, written = _read_result_rows(job, offset, limit)
+
+    next_offset = offset + len(rows)
+    return {
+        "job_id": job_id,
+        "offset": offset,
+        "next_offset": next_offset,
+        "count": len(rows),
+        "rows": rows,
+        "written_rows": written,
+        "has_more": next_offset < written or job["is_running"],
+        "is_running": job["is_running"]
     }
 
 
+@router.get("/bulk-events/{job_id}")
+async def stream_bulk_events(job_id: str, request: Request, rows: bool = True, offset: int = 0,
+                             interval: float = 0.5):
+    """
+    Bulk Progress Stream (Server-Sent Events)
+    - event: progress  {current_row, total_rows, success_rows, failed_rows, dedup_ratio, progress_percent}
+                       (throttled to one per `interval` seconds, only when something changed)
+    - event: rows      {offset, next_offset, rows} result rows as their chunks are written
+                       (id = next_offset, so a reconnect with Last-Event-ID resumes there)
+    - event: done      {is_cancelled, count, download_url, filename}, then the stream ends
+    Reads the job counters without taking the job lock on every tick.
+    """
+    import asyncio
+    import json
+
+    job = bulk_job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    interval = max(interval, 0.2)
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id)
+
+    def event(name: str, data: dict, event_id: int | None = None) -> str:
+        head = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{head}event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    async def generate():
+        nonlocal offset
+        last_progress = None
+        while True:
+            if await request.is_disconnected():
+                return
+            running = job["is_running"]  # read before the rows, so no row is missed at the end
+            progress = {
+                "current_row": job["current_row"],
+                "total_rows": job["total_rows"],
+                "success_rows": job["success_rows"],
+                "failed_rows": job["failed_rows"],
+                "dedup_ratio": _dedup_ratio(job),
+                "progress_percent": (
+                    round(job["current_row"] / job["total_rows"] * 100, 1)
+                    if job["total_rows"] > 0 else 0
+                ),
+            }
+            if progress != last_progress:
+                last_progress = progress
+                yield event("progress", progress)
+
+            while rows and offset < job["current_row"]:
+                block, _ = await asyncio.to_thread(_read_result_rows, job, offset, 1000)
+                if not block:
+                    break
+                yield event("rows", {"offset": offset, "next_offset": offset + len(block), "rows": block},
+                            offset + len(block))
+                offset += len(block)
+
+            if not running:
+                summary = job.get("results") or {}
+                yield event("done", {
+                    "is_cancelled": job["is_cancelled"],
+                    "count": job["current_row"],
+                    "download_url": summary.get("download_url"),
+                    "filename": summary.get("filename"),
+                })
+                return
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/bulk-download/{job_id}")
+def download_bulk_results(job_id: str):
+    """
+    Download Bulk Results (결과 다운로드)
+    - Streams the job's result CSV from disk in 1 MB blocks (UTF-8 with BOM).
+    """
+    import os
+    from urllib.parse import quote
+
+    job = bulk_job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["is_running"]:
+        raise HTTPException(status_code=409, detail="Job is still running")
+    path = job.get("result_path")
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="No results for this job")
+
+    def iter_file():
+        with open(path, "rb") as f:
+            while block := f.read(1024 * 1024):
+                yield block
+
+    download_name = (job.get("results") or {}).get("filename") or f"refined_{job_id}.csv"
+    return StreamingResponse(
+        iter_file(),
+        media_type="text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(download_name)}",
+            "Content-Length": str(os.path.getsize(path)),
+        }
+    )
+
+
 @router.post("/bulk-cancel/{job_id}")
 async def cancel_bulk_processing(job_id: str):
     """Cancel ongoing bulk processing for a specific job"""
@@ -6,7 +6,38 @@ class Settings(BaseSettings):
     
     # Use SQLite for local development without Docker
     # format: sqlite:///./sql_app.db
-    DATABASE_URL: str = "sqlite:///./local_dev_v4.db" 
+    DATABASE_URL: str = "sqlite:///./local_dev_v4.db"
+
+    # Compact address store: no stored full-address strings (rebuilt from the components),
+    # English names once per region / road in the dictionary tables instead of on every row.
+    # The Korean name columns stay on address_master - every search index is keyed on them.
+    # (existing DBs: python -m app.utils.import_address_data --compact)
+    COMPACT_ADDRESS_STORE: bool = True
+
+    # In-memory search indexes (built at startup, cached as snapshot files)
+    MEMORY_INDEX_ENABLED: bool = True
+    INDEX_SNAPSHOT_DIR: str = "./index_snapshots"
+
+    # Where LocalSearchService hydrates candidate rows from:
+    # "columnar" = ids from SQL + mmap column snapshot (SQL rows until it is ready), "sql" = Core select of the row columns
+    SEARCH_ROW_BACKEND: str = "columnar"
+
+    # Normalization result cache (0 disables)
+    RESULT_CACHE_SIZE: int = 50000
+    RESULT_CACHE_TTL: int = 3600  # seconds
+    # Inputs that still failed after AI correction (keyed with the LLM model name)
+    NEGATIVE_CACHE_SIZE: int = 20000
+    NEGATIVE_CACHE_TTL: int = 21600  # seconds
+
+    # Bulk jobs: worker processes (0 = one per CPU, 1 = in the request thread) and rows per task
+    BULK_WORKERS: int = 0
+    BULK_CHUNK_ROWS: int = 200
+    # Distinct addresses remembered per job for dedup across chunks (0 = within a chunk only)
+    BULK_DEDUP_MAX_KEYS: int = 50000
+    # Resolve exact road + building number hits of a chunk with one staging-table join
+    BULK_STAGING_MATCH: bool = True
+    # Job files (spooled uploads)
+    BULK_SPOOL_DIR: str = "./bulk_spool"
 
     class Config:
         case_sensitive = True
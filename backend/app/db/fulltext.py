@@ -0,0 +1,76 @@
+"""
+Building-Name Full-Text Index (건물명 전문검색 인덱스)
+- SQLite : FTS5 external-content table over address_master.buld_nm_key (trigram tokenizer),
+           kept in sync by triggers.
+- PostgreSQL : pg_trgm GIN index on buld_nm_key (LIKE '%..%' uses it directly).
+Substring semantics are the same as buld_nm_key LIKE '%key%'.
+"""
+from sqlalchemy import Integer, column, text
+from app.db.session import engine
+from app.models.local_address import AddressMaster
+from app.utils.normalize import normalize_building_key
+
+FTS_TABLE = "address_building_fts"
+
+_fts_ready = False
+
+
+def ensure_building_fts() -> None:
+    """Create the full-text index if missing (first creation indexes existing rows)"""
+    global _fts_ready
+    try:
+        if engine.dialect.name == "sqlite":
+            with engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE}
+                ).first()
+                if not exists:
+                    print(f"[INIT] Creating {FTS_TABLE} (FTS5 trigram) ...")
+                    conn.execute(text(
+                        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                        f"buld_nm_key, content='address_master', content_rowid='id', tokenize='trigram')"
+                    ))
+                    conn.execute(text(
+                        f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON address_master BEGIN "
+                        f"INSERT INTO {FTS_TABLE}(rowid, buld_nm_key) VALUES (new.id, new.buld_nm_key); END"
+                    ))
+                    conn.execute(text(
+                        f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON address_master BEGIN "
+                        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, buld_nm_key) "
+                        f"VALUES ('delete', old.id, old.buld_nm_key); END"
+                    ))
+                    conn.execute(text(
+                        f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF buld_nm_key ON address_master BEGIN "
+                        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, buld_nm_key) "
+                        f"VALUES ('delete', old.id, old.buld_nm_key); "
+                        f"INSERT INTO {FTS_TABLE}(rowid, buld_nm_key) VALUES (new.id, new.buld_nm_key); END"
+                    ))
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        elif engine.dialect.name == "postgresql":
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_addr_buld_nm_key_trgm "
+                    "ON address_master USING gin (buld_nm_key gin_trgm_ops)"
+                ))
+        _fts_ready = True
+    except Exception as e:
+        print(f"[WARN] Building full-text index unavailable: {e}")
+        _fts_ready = False
+
+
+def building_name_filter(name: str):
+    """
+    WHERE-clause for 'building name contains <name>' (space/case/width-insensitive).
+    Uses the FTS5 index when available and the key is long enough for trigrams.
+    """
+    key = normalize_building_key(name)
+    if _fts_ready and engine.dialect.name == "sqlite" and len(key) >= 3:
+        phrase = '"' + key.replace('"', '""') + '"'
+        fts_ids = text(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :fts_phrase") \
+            .bindparams(fts_phrase=phrase) \
+            .columns(column("rowid", Integer))
+        return AddressMaster.id.in_(fts_ids)
+    # PostgreSQL: served by the pg_trgm index / short keys: plain scan of the key column
+    return AddressMaster.buld_nm_key.like(f"%{key}%")
@@ -0,0 +1,34 @@
+"""
+Lightweight Schema Upgrade (스키마 보강)
+- create_all() never alters existing tables, so columns / indexes added to the models
+  after a database was created are added here (SQLite & PostgreSQL).
+"""
+from sqlalchemy import inspect, text
+from app.db.session import engine, Base
+
+
+def upgrade_schema() -> list[str]:
+    """Add missing nullable columns and missing indexes. Returns the added column names."""
+    import app.models.local_address  # noqa: F401 (register tables on Base.metadata)
+
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"))
+                added.append(f"{table.name}.{column.name}")
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    if added:
+        print(f"[SCHEMA] Added columns: {', '.join(added)}")
+    return added
@@ -26,6 +26,7 @@ class AddressLog(Base):
     rn = Column(String, nullable=True, comment="Road Name (도로명)")
     buld_nm = Column(String, nullable=True, comment="Building Name (건물명)")
     bd_mgt_sn = Column(String, nullable=True, comment="Building Management No (건물관리번호)")
+    detail_addr = Column(String, nullable=True, comment="Validated Detail Address (상세주소 동/층/호)")
     
     # Coordinates (If available from API/Geocoding)
     ent_x = Column(String, nullable=True, comment="X Coordinate (GRS80)")
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Index
 from app.db.session import Base
+from app.utils.address_format import road_address_of, jibun_address_of
 
 class AddressMaster(Base):
     __tablename__ = "address_master"
@@ -7,8 +8,8 @@ class AddressMaster(Base):
     id = Column(Integer, primary_key=True, index=True)
     mgmt_no = Column(String, unique=True, index=True)  # 도로명주소관리번호 (연계키)
     
-    # Core Address Fields (Korean)
-    si_nm = Column(String, index=True)      # 시도 (서울특별시)
+    # Core Address Fields (Korean - plain columns, the search indexes below are keyed on them)
+    si_nm = Column(String)                  # 시도 (서울특별시)
     sgg_nm = Column(String, index=True)     # 시군구 (강남구)
     emd_nm = Column(String, index=True)     # 읍면동 (역삼동)
     
@@ -17,14 +18,26 @@ class AddressMaster(Base):
     buld_subsn = Column(Integer, default=0) # 건물부번 (0)
     
     buld_nm = Column(String, nullable=True, index=True) # 건물명 (강남파이낸스센터)
-    zip_no = Column(String)                 # 우편번호 (06236)
+    buld_nm_key = Column(String, nullable=True)         # 건물명 검색키 (공백 제거/NFKC/소문자, FTS 대상)
+    zip_no = Column(String, index=True)     # 우편번호 (06236)
+    is_basement = Column(String, nullable=True)  # 지하여부 (0:지상, 1:지하)
     
-    # Full Strings for Search (Korean)
-    road_full_addr = Column(String)         # 전체 도로명 주소
-    jibun_full_addr = Column(String)        # 전체 지번 주소
+    # Full Strings (legacy rows only - compact rows rebuild them, see road_address / jibun_address)
+    road_full_addr = Column(String, nullable=True)   # 전체 도로명 주소
+    jibun_full_addr = Column(String, nullable=True)  # 전체 지번 주소
     
-    # English Address Fields
-    si_nm_eng = Column(String, nullable=True, index=True)   # Sido (Seoul)
+    # Structured Jibun Fields (지번 구성요소 - equality lookup)
+    ri_nm = Column(String, nullable=True)       # 법정리 (구억리)
+    jibun_main = Column(Integer, nullable=True) # 지번본번 (1159)
+    jibun_sub = Column(Integer, nullable=True)  # 지번부번 (0)
+    
+    # Region Codes (행정구역 코드 - equality filters, 0 = unknown)
+    sido_cd = Column(Integer, nullable=True)    # 시도코드 (11)
+    sgg_cd = Column(Integer, nullable=True)     # 시군구코드 (11680)
+    emd_cd = Column(Integer, nullable=True)     # 법정동코드 앞 8자리 (11680101)
+    
+    # English Address Fields (legacy rows only - compact rows keep them in AddressRegion / AddressRoad)
+    si_nm_eng = Column(String, nullable=True)               # Sido (Seoul)
     sgg_nm_eng = Column(String, nullable=True)              # Sigungu (Gangnam-gu)
     road_nm_eng = Column(String, nullable=True, index=True) # Road Name (Teheran-ro)
     road_full_addr_eng = Column(String, nullable=True)      # Full English Address
@@ -36,8 +49,55 @@ class AddressMaster(Base):
     __table_args__ = (
         Index('ix_addr_search', 'road_nm', 'buld_mainsn', 'emd_nm'),
         Index('ix_addr_eng_search', 'road_nm_eng', 'buld_mainsn'),
+        Index('ix_addr_jibun', 'sgg_nm', 'emd_nm', 'ri_nm', 'jibun_main', 'jibun_sub'),
+        Index('ix_addr_sido_cd', 'sido_cd', 'road_nm', 'buld_mainsn'),
+        Index('ix_addr_sgg_cd', 'sgg_cd', 'road_nm', 'buld_mainsn'),
+        Index('ix_addr_emd_cd', 'emd_cd', 'road_nm', 'buld_mainsn'),
     )
 
+    @property
+    def road_address(self) -> str:
+        """전체 도로명 주소 (stored string for legacy rows, rebuilt for compact rows)"""
+        return road_address_of(self)
+
+    @property
+    def jibun_address(self) -> str:
+        """전체 지번 주소 (stored string for legacy rows, rebuilt for compact rows)"""
+        return jibun_address_of(self)
+
+
+class AddressRegion(Base):
+    """
+    행정구역 사전 (시도/시군구/읍면동/리 - one row per distinct region, looked up by name).
+    Holds the English names and codes once per region; address rows are not keyed to it.
+    """
+    __tablename__ = "address_region"
+
+    id = Column(Integer, primary_key=True)
+    si_nm = Column(String)
+    sgg_nm = Column(String)
+    emd_nm = Column(String)
+    ri_nm = Column(String, default="")          # '' = no 리 (keeps the unique index strict)
+    si_nm_eng = Column(String, nullable=True)   # Seoul
+    sgg_nm_eng = Column(String, nullable=True)  # Gangnam-gu
+    sido_cd = Column(Integer, nullable=True)
+    sgg_cd = Column(Integer, nullable=True)
+    emd_cd = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index('ix_region_names', 'si_nm', 'sgg_nm', 'emd_nm', 'ri_nm', unique=True),
+    )
+
+
+class AddressRoad(Base):
+    """도로명 사전 (one row per distinct road name, looked up by name - holds the English name)"""
+    __tablename__ = "address_road"
+
+    id = Column(Integer, primary_key=True)
+    road_nm = Column(String, unique=True)
+    road_nm_eng = Column(String, nullable=True, index=True)  # Teheran-ro
+    road_nm_eng_key = Column(String, nullable=True, index=True)  # fold_english(road_nm_eng): teheranro
+
 
 class AddressDetail(Base):
     """상세주소 (동/층/호)"""
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -18,6 +18,7 @@ class AddressResponse(AddressBase):
     sgg_nm: Optional[str] = None
     emd_nm: Optional[str] = None
     buld_nm: Optional[str] = None
+    detail_addr: Optional[str] = None
     status: str
     is_ai_corrected: bool = False
     error_message: Optional[str] = None
@@ -43,7 +44,15 @@ class NormalizationResult(BaseModel):
     buld_nm: Optional[str] = None
     bd_mgt_sn: Optional[str] = None
     bd_mgt_sn: Optional[str] = None
+    # 상세주소 (동/층/호) from the input, checked against address_detail
+    detail_address: Optional[str] = None  # validated parts in the stored spelling ('105동 2001호')
+    detail_status: Optional[str] = None   # verified / not_found / unverified / unknown (None = no detail in the input)
     is_ai_corrected: bool = False
     candidates: List[dict] = []
     
     message: str
+
+
+class BatchLookupRequest(BaseModel):
+    """Batch reverse lookup keys (도로명주소관리번호 or 우편번호)"""
+    keys: List[str] = Field(..., max_length=10000)
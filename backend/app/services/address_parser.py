@@ -0,0 +1,404 @@
+"""
+Address Parser (주소 토큰화/파싱)
+- One pass of precompiled rules turns a raw input into an immutable ParsedAddress
+  that LocalSearchService.search / _candidate_query / _fetch_rows / search_candidates all share.
+- parse_address() is memoized: repeated inputs (very common in order files) are parsed once.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# 특례시 매핑 (양방향)
+SPECIAL_CITY_MAP = {
+    "수원특례시": "수원시",
+    "용인특례시": "용인시",
+    "고양특례시": "고양시",
+    "창원특례시": "창원시",
+    # 역방향
+    "수원시": "수원특례시",
+    "용인시": "용인특례시",
+    "고양시": "고양특례시",
+    "창원시": "창원특례시",
+}
+
+# 시도명 매핑 (약어/별칭 포함)
+SIDO_MAP = {
+    "서울": "서울특별시", "서울특별시": "서울특별시",
+    "부산": "부산광역시", "부산광역시": "부산광역시",
+    "대구": "대구광역시", "대구광역시": "대구광역시",
+    "인천": "인천광역시", "인천광역시": "인천광역시",
+    "광주": "광주광역시", "광주광역시": "광주광역시",
+    "대전": "대전광역시", "대전광역시": "대전광역시",
+    "울산": "울산광역시", "울산광역시": "울산광역시",
+    "세종": "세종특별자치시", "세종시": "세종특별자치시", "세종특별자치시": "세종특별자치시",
+    "경기": "경기도", "경기도": "경기도",
+    "강원": "강원특별자치도", "강원도": "강원특별자치도", "강원특별자치도": "강원특별자치도",
+    "충북": "충청북도", "충청북도": "충청북도",
+    "충남": "충청남도", "충청남도": "충청남도",
+    "전북": "전북특별자치도", "전라북도": "전북특별자치도", "전북특별자치도": "전북특별자치도",
+    "전남": "전라남도", "전라남도": "전라남도",
+    "경북": "경상북도", "경상북도": "경상북도",
+    "경남": "경상남도", "경상남도": "경상남도",
+    "제주": "제주특별자치도", "제주도": "제주특별자치도", "제주특별자치도": "제주특별자치도"
+}
+SIDO_FULL_NAMES = frozenset(SIDO_MAP.values())
+# Alias lengths, longest first, so '제주제주시' splits as 제주 + 제주시 with dict lookups only
+SIDO_ALIAS_LENGTHS = sorted({len(a) for a in SIDO_MAP}, reverse=True)
+
+# Space insertion rules (applied in order; all precompiled)
+SPACE_RULES = [(re.compile(p), r) for p, r in [
+    (r'(특별자치시|특별자치도|특별시|광역시)', r'\1 '),
+    # 경기도, 충청북도 등 (province names only - '일도이동', '송도동' must stay intact)
+    (r'((?:경기|강원|충청북|충청남|전라북|전라남|경상북|경상남|제주)도)(?=[가-힣])', r'\1 '),
+    (r'([가-힣]+시)(?=[가-힣]+[구군동])', r'\1 '),  # XX시 다음에 구/군/동이 오면
+    (r'([가-힣]+구)(?=[가-힣])', r'\1 '),  # 남구, 해운대구 등
+    (r'([가-힣]+군)(?=[가-힣])', r'\1 '),
+    (r'([가-힣]+읍)(?=[가-힣])', r'\1 '),
+    (r'([가-힣]+면)(?=[가-힣])', r'\1 '),
+    (r'([가-힣]+리)(?=[가-힣]|\d)', r'\1 '),  # 하귀리1-1 → 하귀리 1-1
+    (r'([가-힣]+동)(?=[가-힣]+로|[가-힣]+길|\d)', r'\1 '),  # 동 다음에 로/길/숫자
+    # Do NOT split "로NN번길" -> it's often a single road name.
+    # Only split if it's "로" followed by digits NOT ending in "번길"
+    (r'([가-힣]+로)(\d+)(?!번길)', r'\1 \2'),
+    (r'([가-힣]+길)(\d+)', r'\1 \2'),
+    (r'([가-힣]+대로)(\d+)', r'\1 \2'),
+    # 304번 → 304 번, 101호 → 101 호 (numbered 동 names such as '역삼1동' stay intact)
+    (r'(?<![가-힣])(\d+)(번지?|호|동|층)', r'\1 \2'),
+]]
+
+# 한자어 숫자 (일도이동 -> 일도2동, 중앙동일가 -> 중앙동1가) - one pass for all numerals
+HANCHA_NUMBERS = {
+    "일": "1", "이": "2", "삼": "3", "사": "4", "오": "5",
+    "육": "6", "칠": "7", "팔": "8", "구": "9", "십": "10"
+}
+# 동/가 only: '봉은사로', '역삼로' are road names, not '봉은4로' / '역3로'
+HANCHA_RE = re.compile(r'([가-힣]+)([일이삼사오육칠팔구십])([동가])(?=\s|$|[0-9])')
+
+SPACES_RE = re.compile(r'\s+')
+BRACKET_RE = re.compile(r'\[([^\]]+)\]')
+SQUARE_BRACKETS_RE = re.compile(r'\[[^\]]+\]')
+ROUND_BRACKETS_RE = re.compile(r'\([^\)]+\)')
+BRACKET_SPLIT_RE = re.compile(r'(\[[^\]]+\]|\([^\)]+\))')  # odd pieces are bracket content
+BEONJI_RE = re.compile(r'(\d+(?:-\d+)?)\s*(?:번지|번)')
+BEONJI_ONLY_RE = re.compile(r'(\d+(?:-\d+)?)\s*번지')
+NUM_BEFORE_BRACKET_RE = re.compile(r'(\d+)\s*\[')
+NON_WORD_RE = re.compile(r'[^\w\s\-]')
+NUMBER_RE = re.compile(r'^\d+(?:-\d+)?$')
+NUMBER_PREFIX_RE = re.compile(r'^(\d+)(?:-(\d+))?')
+NUMBER_FULL_RE = re.compile(r'^(\d+)(?:-(\d+))?$')
+DETAIL_TOKEN_RE = re.compile(r'^\d+(?:동|호|층|단지)$')
+DETAIL_SUFFIXES = ("동", "호", "층")
+BUILDING_WORDS = ('아파트', '빌딩', '타워', '밸리', '센터')
+
+
+@dataclass(frozen=True)
+class RegionHints:
+    sido: str | None = None
+    sgg: str | None = None
+    emd: str | None = None
+    ri: str | None = None
+
+
+@dataclass(frozen=True)
+class ParsedAddress:
+    raw: str
+    canonical: str                      # after space insertion / 특례시 / 한자어 숫자 normalization
+    alt_sgg: str | None                 # 특례시 alternative name
+    # Bracket reference info ("[연동, 대림2차아파트]", "[구억리, 1159-0]")
+    ref_building_name: str | None
+    bracket_region: str | None              # 동/리/읍/면 named in the bracket
+    bracket_jibun: tuple[str, str] | None   # (emd or ri, lot number)
+    # Region hints over the whole input (brackets removed)
+    hints: RegionHints
+    # Road view: region names removed, 번지 stripped
+    tokens: tuple[str, ...]
+    road_hints: RegionHints             # hints left in `tokens` (used as exact-tier filters)
+    road_name: str | None
+    road_num: str | None                # '25' / '25-1'
+    # Generic view used by the LIKE / candidate searches (punctuation removed)
+    like_tokens: tuple[str, ...]
+    like_hints: RegionHints
+    is_jibun_likely: bool
+    detail_parts: tuple[str, ...]       # ('105동', '2001호')
+
+
+@lru_cache(maxsize=65536)
+def _space_token(token: str) -> str:
+    """SPACE_RULES over one whitespace-free token (no rule matches across a space)"""
+    for pattern, replacement in SPACE_RULES:
+        token = pattern.sub(replacement, token)
+    return token
+
+
+def insert_spaces(text: str) -> str:
+    """
+    Insert spaces in concatenated address strings.
+    e.g., "부산광역시남구수영로305" → "부산광역시 남구 수영로 305"
+    Token by token, so the rule passes run once per distinct token ('서울특별시', '테헤란로152', ...).
+    """
+    return SPACES_RE.sub(' ', " ".join(map(_space_token, text.split()))).strip()
+
+
+def normalize_special_city(text: str) -> tuple[str, str | None]:
+    """
+    Returns: (normalized_text, alternative_sgg)
+    - normalized_text: 검색어에서 특례시를 일반시로 변환
+    - alternative_sgg: DB 검색 시 사용할 대체 시군구명
+    """
+    alt_sgg = None
+    result = text
+    for special, normal in [
+        ("수원특례시", "수원시"),
+        ("용인특례시", "용인시"),
+        ("고양특례시", "고양시"),
+        ("창원특례시", "창원시"),
+    ]:
+        if special in text:
+            result = text.replace(special, normal)
+            alt_sgg = special
+        elif normal in text:
+            alt_sgg = special  # DB에는 특례시로 저장되어 있을 수 있음
+    return result, alt_sgg
+
+
+def normalize_hancha_numbers(text: str) -> str:
+    """한자어 숫자 표현(일동, 이동...)을 아라비아 숫자로 변환 (단어 끝이거나 공백, 숫자 앞인 경우만)"""
+    return HANCHA_RE.sub(lambda m: f"{m.group(1)}{HANCHA_NUMBERS[m.group(2)]}{m.group(3)}", text)
+
+
+def is_sido_token(t: str) -> bool:
+    """'서울', '서울특별시', '서울시', '부산시' ..."""
+    if t in SIDO_MAP or t in SIDO_FULL_NAMES or t == "주특별자치도":
+        return True
+    return t.endswith('시') and t[:-1] in SIDO_MAP and SIDO_MAP[t[:-1]].endswith('시')
+
+
+@lru_cache(maxsize=65536)
+def _token_region(t: str) -> tuple[str | None, str | None, str | None, str | None, str | None]:
+    """
+    Region names carried by one token: (ri, sido, glued sgg, sgg, emd).
+    'glued sgg' comes from an alias + 시군구 token ('제주제주시') and overrides an earlier sgg.
+    """
+    ri = t if t.endswith('리') and len(t) > 1 and not t[0].isdigit() else None
+    # 도로명은 제외 (예: 세종대로에서 '세종'이 시도로 인식되는 것 방지)
+    if t.endswith('로') or t.endswith('길'):
+        return ri, None, None, None, None
+
+    # 1. 시도 검색 (exact alias, then alias + 시군구 glued: '제주제주시')
+    full_name = SIDO_MAP.get(t)
+    if full_name:
+        return ri, full_name, None, None, None
+    for n in SIDO_ALIAS_LENGTHS:
+        alias = t[:n]
+        if n < len(t) and alias in SIDO_MAP:
+            rem = t[n:]
+            if rem == '시':
+                # '서울시', '부산시' name the metropolitan city itself ('제주시' is a 시군구)
+                if SIDO_MAP[alias].endswith('시'):
+                    return ri, SIDO_MAP[alias], None, None, None
+            elif rem.endswith('시') or rem.endswith('군') or rem.endswith('구'):
+                return ri, SIDO_MAP[alias], rem, None, None
+            break
+    # Typo correction (e.g. "주특별자치도" -> "제주특별자치도")
+    if t == "주특별자치도":
+        return ri, "제주특별자치도", None, None, None
+
+    # 2. 시군구/읍면동 검색
+    if len(t) > 1:
+        if t.endswith('시') or t.endswith('군') or t.endswith('구'):
+            if t not in SIDO_FULL_NAMES and "특별" not in t and "광역" not in t:
+                return ri, None, None, t, None
+        elif t.endswith('읍') or t.endswith('면') or t.endswith('동'):
+            if not t[0].isdigit():
+                return ri, None, None, None, t
+    return ri, None, None, None, None
+
+
+def _fold_region(regions) -> RegionHints:
+    """Hints over classified tokens: first 리/시군구/읍면동, last 시도 (glued 시군구 wins)"""
+    sido_hint = sgg_hint = emd_hint = ri_hint = None
+    for ri, sido, glued_sgg, sgg, emd in regions:
+        ri_hint = ri_hint or ri
+        sido_hint = sido or sido_hint
+        sgg_hint = glued_sgg or sgg_hint or sgg
+        emd_hint = emd_hint or emd
+    return RegionHints(sido_hint, sgg_hint, emd_hint, ri_hint)
+
+
+def parse_region_hints(tokens) -> RegionHints:
+    """토큰 목록에서 시도/시군구/읍면동/리 힌트를 추출"""
+    return _fold_region(map(_token_region, tokens))
+
+
+def _parse_bracket(canonical: str) -> tuple[str | None, str | None, tuple[str, str] | None]:
+    """Bracket reference info: building name, 동/리 name and/or (emd|ri, lot number)"""
+    bracket_match = BRACKET_RE.search(canonical)
+    if not bracket_match:
+        return None, None, None
+
+    ref_building_name = None
+    bracket_jibun = None
+    bracket_content = bracket_match.group(1)
+    if ',' in bracket_content:
+        parts = [p.strip() for p in bracket_content.split(',')]
+        # Building name: a part that looks like one, else the last part
+        for p in parts:
+            if any(w in p for w in BUILDING_WORDS):
+                ref_building_name = p
+                break
+        if not ref_building_name and len(parts) > 1:
+            last = parts[-1]
+            if not NUMBER_RE.match(last) and not last.endswith(('동', '리', '읍', '면')):
+                ref_building_name = last
+
+        # Jibun: "[구억리, 1159-0]"
+        jb_emd = None
+        jb_num = None
+        for p in parts:
+            if p.endswith('리') or p.endswith('동') or p.endswith('읍') or p.endswith('면'):
+                jb_emd = p
+            if NUMBER_RE.match(p):
+                jb_num = p
+        if jb_emd and jb_num:
+            # Normalize -0 to just the main number (e.g. 486-0 -> 486)
+            if jb_num.endswith('-0'):
+                jb_num = jb_num[:-2]
+            bracket_jibun = (jb_emd, jb_num)
+        return ref_building_name, jb_emd, bracket_jibun
+    # Single item in bracket - could be dong or building
+    if '동' not in bracket_content or '아파트' in bracket_content:
+        ref_building_name = bracket_content.strip()
+        return ref_building_name, None, None
+    return None, bracket_content.strip(), None
+
+
+def _has_korean(text: str) -> bool:
+    return any('가' <= c <= '힣' for c in text)
+
+
+def _parse_road(tokens: list[str]) -> tuple[str | None, str | None]:
+    """'Road Name' and 'Building Number' from the road view tokens"""
+    road_num = None
+    road_name = None
+
+    # Look for pattern like "연화로 25"
+    for i, token in enumerate(tokens):
+        if token.endswith('로') or token.endswith('길'):
+            road_name = token
+            if i + 1 < len(tokens):
+                # Extract number (handle "25" or "25-1" or "25동" etc)
+                num_match = NUMBER_PREFIX_RE.match(tokens[i + 1])
+                if num_match:
+                    road_num = f"{num_match.group(1)}-{num_match.group(2)}" if num_match.group(2) else num_match.group(1)
+                    break
+
+    # Fallback: first numeric token that is not a detail part ('105 동', '2001 호')
+    if not road_num:
+        for i, token in enumerate(tokens):
+            num_match = NUMBER_FULL_RE.match(token)
+            if num_match and not (i + 1 < len(tokens) and tokens[i + 1] in DETAIL_SUFFIXES):
+                road_num = f"{num_match.group(1)}-{num_match.group(2)}" if num_match.group(2) else num_match.group(1)
+                break
+
+    for i, t in enumerate(tokens):
+        if t.endswith('로') or t.endswith('길'):
+            # If starts with digit (e.g. '1로', '3길'), merge with previous token!
+            if t[0].isdigit() and i > 0:
+                prev = tokens[i - 1]
+                if not (prev.endswith('시') or prev.endswith('구') or prev.endswith('군')):
+                    # e.g. '디지털' + '1로' -> '디지털1로'
+                    road_name = prev + t
+                    # Maybe merge one more time? (e.g. '가산' + '디지털1로')
+                    if i > 1:
+                        prev2 = tokens[i - 2]
+                        if not (prev2.endswith('시') or prev2.endswith('구') or prev2.endswith('군')) and _has_korean(prev2):
+                            road_name = prev2 + road_name
+            else:
+                road_name = t
+        elif road_name and not road_num:
+            if NUMBER_RE.match(t):
+                road_num = t
+    return road_name, road_num
+
+
+def _detail_parts(tokens: tuple[str, ...]) -> tuple[str, ...]:
+    """'105 동 2001 호' (split by insert_spaces) or '1단지' -> ('105동', '2001호', '1단지')"""
+    parts = []
+    for i, t in enumerate(tokens):
+        if DETAIL_TOKEN_RE.match(t):
+            parts.append(t)
+        elif t.isdigit() and i + 1 < len(tokens) and tokens[i + 1] in DETAIL_SUFFIXES:
+            parts.append(t + tokens[i + 1])
+    return tuple(parts)
+
+
+def _like_tokens(canonical: str) -> tuple[tuple[str, ...], list[bool]]:
+    """Generic view tokens (punctuation removed, hyphens kept) and whether each came from a bracket"""
+    tokens, bracketed = [], []
+    for i, segment in enumerate(BRACKET_SPLIT_RE.split(canonical)):
+        text = BEONJI_ONLY_RE.sub(r'\1', NON_WORD_RE.sub(' ', segment))
+        for t in text.split():
+            tokens.append(t)
+            bracketed.append(i % 2 == 1)
+    return tuple(tokens), bracketed
+
+
+@lru_cache(maxsize=8192)
+def parse_address(raw: str) -> ParsedAddress:
+    # 0-A. Normalization
+    canonical = insert_spaces(raw)
+    canonical, alt_sgg = normalize_special_city(canonical)
+    canonical = normalize_hancha_numbers(canonical)
+
+    # 0-B. Bracket reference info
+    ref_building_name, bracket_region, bracket_jibun = _parse_bracket(canonical)
+
+    # 0-C. Region names: every token classified once, the three views fold the same classes
+    #      (like_hints: all tokens / hints: outside brackets / road_hints: what the road view keeps)
+    like_tokens, bracketed = _like_tokens(canonical)
+    regions = [_token_region(t) for t in like_tokens]
+    outside = [(t, r) for t, r, b in zip(like_tokens, regions, bracketed) if not b]
+    hints = _fold_region(r for _, r in outside)
+    like_hints = _fold_region(regions)
+
+    # 1. Road view: remove bracket content, then redundant region names
+    clean = SQUARE_BRACKETS_RE.sub(' ', canonical)
+    clean = ROUND_BRACKETS_RE.sub(' ', clean)
+    removed = []
+    for name in (hints.sido, hints.sgg):
+        if name:
+            stripped = re.sub(f'\\s{re.escape(name)}\\s', ' ', f' {clean} ', count=1).strip()
+            if stripped != clean.strip():
+                removed.append(name)
+            clean = stripped
+    clean = BEONJI_RE.sub(r'\1', clean)
+    clean = NUM_BEFORE_BRACKET_RE.sub(r'\1 ', clean)
+    tokens = SPACES_RE.sub(' ', clean).strip().split()
+    road_name, road_num = _parse_road(tokens)
+    road_regions = []
+    for t, r in outside:
+        if t in removed:
+            removed.remove(t)  # first occurrence only, like the substitution above
+        else:
+            road_regions.append(r)
+    road_hints = _fold_region(road_regions)
+
+    is_jibun_likely = any(t.endswith(("동", "리", "가", "읍", "면")) for t in like_tokens)
+
+    return ParsedAddress(
+        raw=raw,
+        canonical=canonical,
+        alt_sgg=alt_sgg,
+        ref_building_name=ref_building_name,
+        bracket_region=bracket_region,
+        bracket_jibun=bracket_jibun,
+        hints=hints,
+        tokens=tuple(tokens),
+        road_hints=road_hints,
+        road_name=road_name,
+        road_num=road_num,
+        like_tokens=like_tokens,
+        like_hints=like_hints,
+        is_jibun_likely=is_jibun_likely,
+        detail_parts=_detail_parts(like_tokens),
+    )
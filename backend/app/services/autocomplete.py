@@ -0,0 +1,113 @@
+"""
+Autocomplete Index (자동완성 인덱스)
+- Sorted array of normalized names (road / building / emd) searched with bisect.
+- One entry per (name, sido, sgg) with the number of addresses it covers,
+  which is used as the ranking weight.
+"""
+import heapq
+import sys
+from array import array
+from bisect import bisect_left
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.memory_index import MemoryIndex, register_index
+from app.utils.normalize import normalize_building_key
+
+KINDS = ("road", "building", "emd")
+
+
+class AutocompleteIndex(MemoryIndex):
+    name = "autocomplete"
+    SCAN_LIMIT = 50000  # max entries scored per keystroke (very short prefixes)
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        self.keys: list[str] = []           # normalized name, sorted
+        self.names: list[str] = []          # display name
+        self.kinds = array('b')             # index into KINDS
+        self.counts = array('i')            # addresses covered
+        self.region_ids = array('H')
+        self.regions: list[tuple[str, str]] = []
+
+    def _build(self, db: Session):
+        region_ids: dict[tuple[str, str], int] = {}
+        entries = []
+        sources = (
+            (0, AddressMaster.road_nm),
+            (1, AddressMaster.buld_nm),
+            (2, AddressMaster.emd_nm),
+        )
+        for kind, col in sources:
+            rows = db.query(col, AddressMaster.si_nm, AddressMaster.sgg_nm, func.count(AddressMaster.id)) \
+                .filter(col != None, col != "") \
+                .group_by(col, AddressMaster.si_nm, AddressMaster.sgg_nm)
+            for name, si, sgg, count in rows:
+                key = normalize_building_key(name)
+                if not key:
+                    continue
+                region = (si or "", sgg or "")
+                rid = region_ids.get(region)
+                if rid is None:
+                    rid = region_ids[region] = len(self.regions)
+                    self.regions.append((sys.intern(region[0]), sys.intern(region[1])))
+                entries.append((key, kind, name, count, rid))
+
+        entries.sort()
+        for key, kind, name, count, rid in entries:
+            self.keys.append(key)
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.counts.append(count)
+            self.region_ids.append(rid)
+
+    def _dump(self) -> dict:
+        return {
+            "keys": self.keys, "names": self.names, "kinds": self.kinds,
+            "counts": self.counts, "region_ids": self.region_ids, "regions": self.regions
+        }
+
+    def _restore(self, state: dict):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def complete(self, prefix: str, limit: int = 10, kind: str | None = None,
+                 sido: str | None = None) -> list[dict]:
+        """
+        Ranked completions for a (space-insensitive) prefix.
+        Ranking: exact match first, then addresses covered (desc), then shorter names.
+        """
+        key = normalize_building_key(prefix)
+        if not key:
+            return []
+        kind_code = KINDS.index(kind) if kind in KINDS else None
+
+        lo = bisect_left(self.keys, key)
+        hi = min(bisect_left(self.keys, key + "\uffff"), lo + self.SCAN_LIMIT)
+
+        def candidates():
+            for i in range(lo, hi):
+                if kind_code is not None and self.kinds[i] != kind_code:
+                    continue
+                if sido and not self.regions[self.region_ids[i]][0].startswith(sido):
+                    continue
+                yield (self.keys[i] == key, self.counts[i], -len(self.keys[i]), -i)
+
+        results = []
+        for _, count, _, neg_i in heapq.nlargest(limit, candidates()):
+            i = -neg_i
+            si, sgg = self.regions[self.region_ids[i]]
+            results.append({
+                "text": self.names[i],
+                "type": KINDS[self.kinds[i]],
+                "si_nm": si,
+                "sgg_nm": sgg,
+                "count": count
+            })
+        return results
+
+
+autocomplete_index = register_index(AutocompleteIndex())
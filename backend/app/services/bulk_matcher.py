@@ -0,0 +1,99 @@
+"""
+Set-based Exact Matching (대량 정제 일괄 매칭)
+- Bulk chunks are pre-parsed into (road_nm, buld_mainsn, buld_subsn, sido, sgg) keys,
+  loaded into a temporary staging table with one executemany, and resolved with a
+  single join against address_master (ix_addr_search) instead of several queries per row.
+- Only unambiguous hits are taken: exactly one building for the row after its region
+  hints. Everything else (no road/number, unknown hints, several buildings, English
+  input) is left to the row-wise LocalSearchService path.
+"""
+from sqlalchemy import Column, Integer, MetaData, String, Table, and_, insert, or_, select, text
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.schemas.address import NormalizationResult
+from app.services.address_parser import ParsedAddress
+from app.services.english_index import is_english_address
+from app.services.gazetteer import gazetteer
+from app.services.local_search import LocalSearchService, ROW_COLUMNS
+
+# Session-local table, never part of Base.metadata (upgrade_schema does not create it)
+_stage_metadata = MetaData()
+bulk_stage = Table(
+    "bulk_stage", _stage_metadata,
+    Column("row_no", Integer),
+    Column("road_nm", String),
+    Column("buld_mainsn", Integer),
+    Column("buld_subsn", Integer),
+    Column("sido", String),
+    Column("sgg", String),
+)
+
+CREATE_STAGE_SQL = text(
+    "CREATE TEMPORARY TABLE IF NOT EXISTS bulk_stage "
+    "(row_no INTEGER, road_nm VARCHAR, buld_mainsn INTEGER, buld_subsn INTEGER, sido VARCHAR, sgg VARCHAR)"
+)
+
+
+def _stage_keys(service: LocalSearchService, row_no: int, parsed: ParsedAddress) -> list[dict]:
+    """Staging rows for one parsed input ([] = not an exact-match candidate)"""
+    if not parsed.road_name or is_english_address(parsed.raw):
+        return []
+    nums = service._split_road_num(parsed.road_num)
+    if not nums:
+        return []
+
+    hints = parsed.hints
+    if gazetteer.is_ready:
+        region = gazetteer.resolve(hints)
+        # A hint the gazetteer does not know could still sway the row-wise scorer
+        if (hints.sido and not region.sido) or (hints.sgg and not region.sgg_names):
+            return []
+        sido, sggs = region.sido, region.sgg_names or (None,)
+    elif hints.sido or hints.sgg:
+        return []
+    else:
+        sido, sggs = None, (None,)
+
+    main, sub = nums
+    roads = {parsed.road_name, parsed.road_name.replace(" ", "")}
+    return [
+        {"row_no": row_no, "road_nm": road, "buld_mainsn": main, "buld_subsn": sub, "sido": sido, "sgg": sgg}
+        for road in sorted(roads) for sgg in sggs
+    ]
+
+
+def match_exact(db: Session, parsed_rows: list[ParsedAddress]) -> dict[int, NormalizationResult]:
+    """
+    {row index: result} for the rows with exactly one building on their road / number / region.
+    One executemany + one join per call; the staging rows are rolled back afterwards.
+    """
+    service = LocalSearchService(db)
+    stage_rows = [key for i, parsed in enumerate(parsed_rows) for key in _stage_keys(service, i, parsed)]
+    if not stage_rows:
+        return {}
+
+    matches: dict[int, dict] = {}  # row index -> {address id: row}
+    try:
+        db.execute(CREATE_STAGE_SQL)
+        db.execute(insert(bulk_stage), stage_rows)
+        stmt = (
+            select(bulk_stage.c.row_no, *ROW_COLUMNS)
+            .join_from(bulk_stage, AddressMaster, and_(
+                AddressMaster.road_nm == bulk_stage.c.road_nm,
+                AddressMaster.buld_mainsn == bulk_stage.c.buld_mainsn,
+                AddressMaster.buld_subsn == bulk_stage.c.buld_subsn,
+            ))
+            .where(
+                or_(bulk_stage.c.sido.is_(None), AddressMaster.si_nm == bulk_stage.c.sido),
+                or_(bulk_stage.c.sgg.is_(None), AddressMaster.sgg_nm == bulk_stage.c.sgg),
+            )
+        )
+        for row in db.execute(stmt):
+            matches.setdefault(row.row_no, {})[row.id] = row
+    finally:
+        db.rollback()
+
+    return {
+        i: service._to_result(next(iter(found.values())))
+        for i, found in matches.items() if len(found) == 1
+    }
@@ -0,0 +1,183 @@
+"""
+Bulk Normalization Workers (대량 정제 프로세스 풀)
+- A bulk job is cut into chunks of BULK_CHUNK_ROWS addresses, and each chunk is
+  normalized by a worker process. Every worker has its own DB connection pool and
+  loads the in-memory indexes from the snapshots the parent process wrote before
+  starting the pool (the columnar snapshot is a shared mmap). Workers never build.
+- A reload of the master table retires the pool; the next job starts fresh workers
+  once the parent has rebuilt the snapshots.
+- Chunk results come back in submission order, a bounded number of chunks in flight,
+  so the job can report progress and stop between chunks when it is cancelled.
+- BULK_WORKERS=1 keeps the old single-thread behaviour (no pool).
+"""
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator
+from app.core.config import settings
+from app.services.memory_index import register_invalidation_hook, warm_up_indexes
+
+# Columns normalize_chunk adds to every input row (result CSV header, in this order)
+RESULT_COLUMNS = ("refined_address", "road_address", "zip_code", "si_nm", "sgg_nm", "buld_nm",
+                  "detail_address", "detail_status", "status", "error_info")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def worker_count() -> int:
+    return settings.BULK_WORKERS or os.cpu_count() or 1
+
+
+def _init_worker():
+    """Runs once per worker process: own connections, indexes from the parent's snapshots"""
+    from app.db.session import engine
+    engine.dispose(close=False)
+    from app.db.fulltext import ensure_building_fts
+    import app.services.local_search  # noqa: F401 (registers the search indexes)
+    ensure_building_fts()  # already created by the parent: only marks it usable here
+    warm_up_indexes(build=False)
+
+
+def normalize_chunk(raws: list[str]) -> list[dict]:
+    """
+    Normalize one chunk of addresses -> result rows (same order).
+    Exact hits come from one staging-table join (bulk_matcher), the rest go through
+    the row-wise pipeline; details are validated as one batch.
+    """
+    from app.api.endpoints.address import _normalize_logic
+    from app.services.address_parser import parse_address
+    from app.services.bulk_matcher import match_exact
+    from app.services.detail_validator import detail_parts, validate_details
+    from app.db.session import SessionLocal
+
+    parsed_rows = [parse_address(raw) for raw in raws]
+    exact = {}
+    if settings.BULK_STAGING_MATCH:
+        db = SessionLocal()
+        try:
+            exact = match_exact(db, parsed_rows)
+        except Exception as e:
+            print(f"[BULK] Staging match failed, row-wise only: {e}")
+        finally:
+            db.close()
+
+    rows = []
+    pending = []  # (row index, mgmt_no, detail parts)
+    for i, raw in enumerate(raws):
+        res = exact.get(i) or _normalize_logic(raw, bulk_mode=False, check_detail=False)
+        if res.success:
+            status_val = "success"
+            err_val = "AI 보정 완료" if res.is_ai_corrected else ""
+        else:
+            status_val = "fail"
+            err_val = res.message if res.message else "검색 실패"
+        rows.append({
+            "refined_address": res.refined_address,
+            "road_address": res.road_address,
+            "zip_code": res.zip_code,
+            "si_nm": res.si_nm,
+            "sgg_nm": res.sgg_nm,
+            "buld_nm": res.buld_nm,
+            "detail_address": None,
+            "detail_status": None,
+            "status": status_val,
+            "error_info": err_val
+        })
+        parts = detail_parts(parsed_rows[i].detail_parts)
+        if res.success and parts:
+            pending.append((len(rows) - 1, res.bd_mgt_sn, parts))
+
+    # One set-based address_detail lookup per chunk instead of one query per row
+    if pending:
+        db = SessionLocal()
+        try:
+            validated = validate_details(db, [(mgmt_no, parts) for _, mgmt_no, parts in pending])
+            for (i, _, _), (detail, status) in zip(pending, validated):
+                rows[i]["detail_address"] = detail
+                rows[i]["detail_status"] = status
+        except Exception as e:
+            print(f"Detail Validation Error: {e}")
+        finally:
+            db.close()
+    return rows
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    """Shared pool (started on first use; workers stay warm between jobs)"""
+    global _pool
+    workers = worker_count()
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Snapshots first, so the workers only load them (waits for a running rebuild)
+            warm_up_indexes()
+            # spawn: no fork of a process that already has server threads and open connections
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            print(f"[BULK] Started {workers} worker processes")
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _retire_pool() -> None:
+    """Master table reloaded: workers hold the old indexes (running chunks still finish)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
+            print("[BULK] Worker processes retired (address data reloaded)")
+
+
+register_invalidation_hook(_retire_pool)
+
+
+def normalize_chunks(chunks: Iterable[list[str]], is_cancelled: Callable[[], bool]) -> Iterator[list[dict]]:
+    """
+    Result rows per chunk, in input order.
+    Stops (and drops the queued chunks) as soon as is_cancelled() turns true.
+    """
+    pool = _get_pool()
+    if pool is None:
+        for chunk in chunks:
+            if is_cancelled():
+                return
+            yield normalize_chunk(chunk)
+        return
+
+    in_flight = deque()
+    max_in_flight = worker_count() * 2
+    try:
+        for chunk in chunks:
+            if is_cancelled():
+                return
+            if chunk:
+                in_flight.append(pool.submit(normalize_chunk, chunk))
+            else:
+                # Nothing new to normalize (every row was a duplicate): keep the order, skip the pool
+                done = Future()
+                done.set_result([])
+                in_flight.append(done)
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            if is_cancelled():
+                return
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
@@ -0,0 +1,107 @@
+"""
+Candidate Scorer (후보 점수화)
+- LocalSearchService fetches one candidate set per query (road / lot number predicates
+  OR-ed into a single SELECT, broad address text / building name predicates with the
+  typed region first) and ranks it here.
+- The old fallback tiers (exact road -> fuzzy road -> building -> region-relaxed LIKE)
+  became feature weights: every candidate gets a 0/1 feature vector and the score
+  is one matrix-vector product over the whole candidate set.
+"""
+from dataclasses import dataclass
+import numpy as np
+from app.utils.normalize import normalize_building_key
+
+FEATURES = (
+    "road_exact",    # road_nm equals the parsed road name        (was: exact tier)
+    "road_partial",  # road_nm contains the parsed road name      (was: fuzzy road tier)
+    "text",          # address stem matched the free-text tokens  (_candidate_query text predicate)
+    "building",      # building name contains the building hint   (was: building tiers)
+    "main",          # buld_mainsn matches
+    "sub",           # buld_subsn matches
+    "jibun_main",    # jibun_main matches
+    "jibun_sub",     # jibun_sub matches
+    "emd",           # emd_nm matches
+    "ri",            # ri_nm matches
+    "sido",          # si_nm matches       (was: region filters, relaxed tier by tier)
+    "sgg",           # sgg_nm matches
+)
+WEIGHTS = np.array([100, 60, 40, 30, 50, 10, 50, 10, 20, 10, 15, 25], dtype=np.float32)
+F = {name: i for i, name in enumerate(FEATURES)}
+
+
+@dataclass(frozen=True)
+class QueryFeatures:
+    """What the query claims about the address it refers to"""
+    road_names: frozenset[str] = frozenset()
+    road_name: str | None = None
+    main: int | None = None
+    sub: int | None = None
+    jibun_main: int | None = None
+    jibun_sub: int | None = None
+    emd_names: frozenset[str] = frozenset()
+    ri_names: frozenset[str] = frozenset()
+    sido: str | None = None
+    sgg_names: frozenset[str] = frozenset()
+    sgg_hint: str | None = None       # raw hint, substring semantics while the gazetteer is loading
+    text_roads: frozenset[str] = frozenset()   # road_nm values whose stem matched the text tokens
+    text_emds: frozenset[str] = frozenset()    # emd_nm values whose stem matched the text tokens
+    text_main: int | None = None               # number after the text tokens (building or lot number)
+    building_key: str | None = None
+
+
+def _features(q: QueryFeatures, r) -> list[int]:
+    road = r.road_nm or ""
+    building_key = r.buld_nm_key or normalize_building_key(r.buld_nm)
+    main_ok = q.main is not None and r.buld_mainsn == q.main
+    jibun_main_ok = q.jibun_main is not None and r.jibun_main == q.jibun_main
+    if q.sgg_names:
+        sgg_ok = r.sgg_nm in q.sgg_names
+    else:
+        sgg_ok = bool(q.sgg_hint) and q.sgg_hint in (r.sgg_nm or "")
+    return [
+        road in q.road_names,
+        bool(q.road_name) and q.road_name in road and road not in q.road_names,
+        q.text_main is not None and (
+            (road in q.text_roads and r.buld_mainsn == q.text_main)
+            or (r.emd_nm in q.text_emds and r.jibun_main == q.text_main)
+        ),
+        bool(q.building_key) and q.building_key in building_key,
+        main_ok,
+        main_ok and q.sub is not None and (r.buld_subsn or 0) == q.sub,
+        jibun_main_ok,
+        jibun_main_ok and q.jibun_sub is not None and (r.jibun_sub or 0) == q.jibun_sub,
+        r.emd_nm in q.emd_names,
+        bool(r.ri_nm) and r.ri_nm in q.ri_names,
+        bool(q.sido) and (r.si_nm or "").startswith(q.sido),
+        sgg_ok,
+    ]
+
+
+def rank_candidates(q: QueryFeatures, rows: list) -> list[tuple[float, object]]:
+    """
+    Score and filter candidate rows (Core row tuples / columnar rows), best first (ties keep id order).
+    A candidate is only accepted if one of the old tiers would have matched it:
+    road + building number, address text + number, 동/리 + lot number, or building name
+    (+ number, when one was typed).
+    """
+    if not rows:
+        return []
+    X = np.array([_features(q, r) for r in rows], dtype=np.float32)
+    scores = X @ WEIGHTS
+
+    has = X.astype(bool)
+    road_any = has[:, F["road_exact"]] | has[:, F["road_partial"]]
+    if q.main is None:
+        # No building number typed: only an exact road name counts
+        road_ok = has[:, F["road_exact"]]
+    else:
+        road_ok = road_any & has[:, F["main"]]
+    place_ok = (has[:, F["emd"]] | has[:, F["ri"]]) & has[:, F["jibun_main"]]
+    building_ok = has[:, F["building"]]
+    if q.main is not None or q.jibun_main is not None:
+        # A typed number must agree with the building as well
+        building_ok = building_ok & (has[:, F["main"]] | has[:, F["jibun_main"]])
+    accepted = road_ok | has[:, F["text"]] | place_ok | building_ok
+
+    order = sorted(np.flatnonzero(accepted), key=lambda i: (-scores[i], rows[i].id))
+    return [(float(scores[i]), rows[i]) for i in order]
@@ -0,0 +1,313 @@
+"""
+Columnar Address Snapshot (메모리 매핑 컬럼 스냅샷)
+- Exports address_master into NumPy column files:
+    numbers    : int32 arrays (NULL -> -1 for the lot numbers, 0 for codes)
+    dict_<col> : int32 codes + one string table per low-cardinality column (si/sgg/emd/ri/road...)
+    heap_<col> : int64 offsets + one UTF-8 byte heap (+ NULL mask) per high-cardinality column
+                 (road_full_addr / jibun_full_addr: stored strings of legacy rows, NULL on compact rows)
+- The build streams address_master in yield_per batches into arrays preallocated from the
+  row count of the data signature (column files in the staging directory), and appends the
+  heap bytes to their files per batch - no per-row Python lists of the whole table.
+- The files are opened read-only with mmap (np.load(mmap_mode='r')), so hydrating a
+  candidate row is a few array reads instead of an ORM object, and every uvicorn worker
+  shares the same OS page cache instead of warming SQLite separately.
+- One directory per data signature (columnar/<count>_<max id>/), written to a temp
+  directory and renamed, so concurrent workers never see a half-written snapshot.
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.local_address import AddressMaster
+from app.services.memory_index import MemoryIndex, data_signature, register_index
+from app.utils.address_format import road_address_of, jibun_address_of
+
+INT_COLUMNS = ("id", "buld_mainsn", "buld_subsn", "jibun_main", "jibun_sub", "sido_cd", "sgg_cd", "emd_cd")
+NULLABLE_INTS = {"jibun_main", "jibun_sub"}  # NULL stored as -1
+DICT_COLUMNS = ("si_nm", "sgg_nm", "emd_nm", "ri_nm", "road_nm", "zip_no", "is_basement")
+HEAP_COLUMNS = ("mgmt_no", "buld_nm", "buld_nm_key", "road_full_addr", "jibun_full_addr")
+
+
+def _encode_heap(values: list[str | None]) -> tuple[np.ndarray, np.ndarray]:
+    """Strings -> (int64 offsets [n + 1], uint8 UTF-8 heap). None is stored as an empty string."""
+    encoded = [(v or "").encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    heap = np.frombuffer(b"".join(encoded), dtype=np.uint8) if encoded else np.zeros(0, dtype=np.uint8)
+    return offsets, heap
+
+
+def _decode(offsets: np.ndarray, heap: np.ndarray, i: int) -> str:
+    return heap[offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+
+
+def _new_array(directory: str | None, name: str, dtype, length: int) -> np.ndarray:
+    """Preallocated build array: a writable .npy mapping in the staging directory (or memory)"""
+    if directory is None:
+        return np.zeros(length, dtype=dtype)
+    return np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                     dtype=dtype, shape=(length,))
+
+
+def _open_heap(path: str) -> np.ndarray:
+    """Raw UTF-8 heap file -> read-only uint8 mapping (np.memmap cannot map an empty file)"""
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+class _HeapWriter:
+    """One heap column during the build: offsets / NULL mask preallocated, bytes appended per batch"""
+
+    def __init__(self, directory: str | None, column: str, length: int):
+        self.path = os.path.join(directory, f"heap_{column}.heap.bin") if directory else None
+        self.file = open(self.path, "wb") if self.path else io.BytesIO()
+        self.offsets = _new_array(directory, f"heap_{column}.offsets", np.int64, length + 1)
+        self.nulls = _new_array(directory, f"heap_{column}.null", bool, length)
+        self.size = 0
+
+    def add(self, start: int, values) -> None:
+        encoded = [(v or "").encode("utf-8") for v in values]
+        end = start + len(encoded)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        self.offsets[start + 1:end + 1] = self.size + np.cumsum(lengths)
+        self.nulls[start:end] = [v is None for v in values]
+        self.file.write(b"".join(encoded))
+        self.size += int(lengths.sum())
+
+    def finish(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.path is None:
+            heap = np.frombuffer(self.file.getvalue(), dtype=np.uint8)
+            self.file.close()
+            return self.offsets, heap
+        self.file.close()
+        return self.offsets, _open_heap(self.path)
+
+
+class ColumnarRow:
+    """Read-only address row backed by the column arrays (same attribute names as AddressMaster)"""
+    __slots__ = ("id", "si_nm", "sgg_nm", "emd_nm", "ri_nm", "road_nm", "buld_mainsn", "buld_subsn",
+                 "jibun_main", "jibun_sub", "zip_no", "is_basement", "mgmt_no", "buld_nm", "buld_nm_key",
+                 "sido_cd", "sgg_cd", "emd_cd", "road_full_addr", "jibun_full_addr")
+
+    @property
+    def road_address(self) -> str:
+        return road_address_of(self)
+
+    @property
+    def jibun_address(self) -> str:
+        return jibun_address_of(self)
+
+
+class ColumnarStore(MemoryIndex):
+    name = "columnar"
+    SNAPSHOT_VERSION = 2
+    BATCH_ROWS = 50000
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        self.ints: dict[str, np.ndarray] = {}
+        self.codes: dict[str, np.ndarray] = {}
+        self.dicts: dict[str, list[str | None]] = {}
+        self.heaps: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self.nulls: dict[str, np.ndarray] = {}  # heap column -> bool mask of NULL values
+        self._staging: str | None = None        # column files of the last build (until saved)
+
+    # --- Build (streamed into preallocated arrays, then published by _save_snapshot) ---
+    def _build(self, db: Session):
+        signature = data_signature(db)
+        count = signature[0]
+        staging = None
+        if self.snapshot_path():
+            staging = f"{self._signature_dir(signature)}.tmp{os.getpid()}"
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+        self._staging = staging
+
+        ints = {c: _new_array(staging, f"int_{c}", np.int32, count) for c in INT_COLUMNS}
+        codes = {c: _new_array(staging, f"dict_{c}", np.int32, count) for c in DICT_COLUMNS}
+        values = {c: {} for c in DICT_COLUMNS}
+        heaps = {c: _HeapWriter(staging, c, count) for c in HEAP_COLUMNS}
+        names = INT_COLUMNS + DICT_COLUMNS + HEAP_COLUMNS
+        stmt = (select(*(getattr(AddressMaster, c) for c in names))
+                .order_by(AddressMaster.id).execution_options(yield_per=self.BATCH_ROWS))
+
+        filled = 0
+        try:
+            for batch in db.execute(stmt).partitions():
+                end = filled + len(batch)
+                if end > count:
+                    raise RuntimeError("address_master changed during the build")
+                columns = dict(zip(names, zip(*batch)))
+                for c in INT_COLUMNS:
+                    null = -1 if c in NULLABLE_INTS else 0
+                    ints[c][filled:end] = [null if v is None else v for v in columns[c]]
+                for c in DICT_COLUMNS:
+                    table = values[c]
+                    codes[c][filled:end] = [table.setdefault(v, len(table)) for v in columns[c]]
+                for c in HEAP_COLUMNS:
+                    heaps[c].add(filled, columns[c])
+                filled = end
+            if filled != count:
+                raise RuntimeError("address_master changed during the build")
+            self.heaps = {c: heap.finish() for c, heap in heaps.items()}
+        except Exception:
+            for heap in heaps.values():
+                heap.file.close()
+            self._staging = None
+            if staging:
+                shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.ints = ints
+        self.codes = codes
+        self.dicts = {c: [sys.intern(v) if v else v for v in table] for c, table in values.items()}
+        self.nulls = {c: heaps[c].nulls for c in HEAP_COLUMNS}
+
+    # --- Column files (replace the pickled snapshot of MemoryIndex) ---
+    def snapshot_path(self) -> str | None:
+        if not settings.INDEX_SNAPSHOT_DIR:
+            return None
+        return os.path.join(settings.INDEX_SNAPSHOT_DIR, self.name)
+
+    def _signature_dir(self, signature: tuple[int, int]) -> str:
+        return os.path.join(self.snapshot_path(), f"{signature[0]}_{signature[1]}")
+
+    def _save_snapshot(self, signature: tuple[int, int]) -> None:
+        base = self.snapshot_path()
+        tmp, self._staging = self._staging, None
+        if not base or not tmp:
+            return  # no snapshot dir: keep the in-memory arrays
+        target = self._signature_dir(signature)
+        try:
+            # The build already wrote the int / code / heap files; add the string tables + meta
+            for arr in (*self.ints.values(), *self.codes.values(), *self.nulls.values(),
+                        *(offsets for offsets, _ in self.heaps.values())):
+                if isinstance(arr, np.memmap):
+                    arr.flush()
+            for c in DICT_COLUMNS:
+                offsets, heap = _encode_heap(self.dicts[c])
+                np.save(os.path.join(tmp, f"dict_{c}.offsets.npy"), offsets)
+                np.save(os.path.join(tmp, f"dict_{c}.heap.npy"), heap)
+            with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"version": self.SNAPSHOT_VERSION, "signature": list(signature),
+                           "rows": int(len(self.ints["id"])),
+                           "none_values": {c: self.dicts[c].index(None) if None in self.dicts[c] else -1
+                                           for c in DICT_COLUMNS}}, f)
+            try:
+                os.rename(tmp, target)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)  # another worker finished first
+            # Older signatures are stale (open mmaps stay valid until their workers reload)
+            for name in os.listdir(base):
+                path = os.path.join(base, name)
+                if path != target and ".tmp" not in name:
+                    shutil.rmtree(path, ignore_errors=True)
+            # Switch from the build mappings to the shared read-only mmap (keep them if that fails)
+            staged = (self.ints, self.codes, self.dicts, self.heaps, self.nulls)
+            if not self._load_snapshot(signature):
+                self.ints, self.codes, self.dicts, self.heaps, self.nulls = staged
+        except Exception as e:
+            shutil.rmtree(tmp, ignore_errors=True)
+            print(f"[WARN] {self.name}: failed to save column files: {e}")
+
+    def _load_snapshot(self, signature: tuple[int, int]) -> bool:
+        if not self.snapshot_path():
+            return False
+        path = self._signature_dir(signature)
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            return False
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != self.SNAPSHOT_VERSION:
+                print(f"[INDEX] {self.name}: snapshot is stale, rebuilding")
+                return False
+
+            def load(name):
+                return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+
+            self.ints = {c: load(f"int_{c}") for c in INT_COLUMNS}
+            self.codes = {c: load(f"dict_{c}") for c in DICT_COLUMNS}
+            self.dicts = {}
+            for c in DICT_COLUMNS:
+                offsets, heap = load(f"dict_{c}.offsets"), load(f"dict_{c}.heap")
+                table = [sys.intern(_decode(offsets, heap, i)) for i in range(len(offsets) - 1)]
+                none_code = meta["none_values"].get(c, -1)
+                if none_code >= 0:
+                    table[none_code] = None
+                self.dicts[c] = table
+            self.heaps = {c: (load(f"heap_{c}.offsets"), _open_heap(os.path.join(path, f"heap_{c}.heap.bin")))
+                          for c in HEAP_COLUMNS}
+            self.nulls = {c: load(f"heap_{c}.null") for c in HEAP_COLUMNS}
+            return True
+        except Exception as e:
+            print(f"[WARN] {self.name}: failed to open column files: {e}")
+            self._reset()
+            return False
+
+    def invalidate(self) -> None:
+        """Drop the mapping; the files stay until a snapshot for the new data replaces them"""
+        with self.lock:
+            self.is_ready = False
+            self.signature = None
+            self._reset()
+
+    # --- Lookups ---
+    def fetch(self, ids: list[int]) -> list[ColumnarRow] | None:
+        """
+        Rows for the given AddressMaster ids (same order, ids not in the snapshot skipped).
+        Returns None when the snapshot is not usable (caller falls back to a SQL select).
+        """
+        if not self.is_ready:
+            return None
+        id_col = self.ints["id"]
+        wanted = np.asarray(ids, dtype=np.int64)
+        positions = np.searchsorted(id_col, wanted)
+        in_range = positions < len(id_col)
+        found = np.zeros(len(wanted), dtype=bool)
+        found[in_range] = id_col[positions[in_range]] == wanted[in_range]
+        positions = positions[found]
+        if not len(positions):
+            return []
+
+        # One fancy-indexed gather per column, then plain Python objects
+        columns = {}
+        for c in INT_COLUMNS:
+            values = self.ints[c][positions].tolist()
+            if c in NULLABLE_INTS:
+                values = [None if v < 0 else v for v in values]
+            columns[c] = values
+        for c in DICT_COLUMNS:
+            table = self.dicts[c]
+            columns[c] = [table[code] for code in self.codes[c][positions].tolist()]
+        for c in HEAP_COLUMNS:
+            offsets, heap = self.heaps[c]
+            starts = offsets[positions].tolist()
+            ends = offsets[positions + 1].tolist()
+            nulls = self.nulls[c][positions].tolist()
+            columns[c] = [None if null else heap[a:b].tobytes().decode("utf-8")
+                          for a, b, null in zip(starts, ends, nulls)]
+
+        rows = []
+        names = list(columns)
+        for values in zip(*(columns[c] for c in names)):
+            r = ColumnarRow()
+            for c, v in zip(names, values):
+                setattr(r, c, v)
+            rows.append(r)
+        return rows
+
+
+columnar_store = ColumnarStore()
+if settings.SEARCH_ROW_BACKEND == "columnar":
+    register_index(columnar_store)
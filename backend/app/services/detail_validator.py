@@ -0,0 +1,115 @@
+"""
+Detail Address Validation (상세주소 동/층/호 검증)
+- Keeps the 동/층/호 parts of the input ("105동 2001호") and checks them against
+  address_detail for the matched building (mgmt_no).
+- Set-based: one `mgmt_no IN (...)` query per chunk of buildings (ix_detail_search),
+  so a bulk job validates thousands of rows with a handful of queries.
+"""
+import re
+from dataclasses import dataclass
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressDetail
+
+IN_CHUNK = 500  # mgmt_no values per IN (well below SQLite's variable limit)
+DETAIL_KEY_RE = re.compile(r'(동|층|호)$')
+
+VERIFIED = "verified"      # the building has this 동/호
+NOT_FOUND = "not_found"    # the building has detail records, none of them match
+UNKNOWN = "unknown"        # no detail records for the building (단독주택 등)
+UNVERIFIED = "unverified"  # nothing the input named could be compared (e.g. only 층, records without 층)
+
+
+@dataclass(frozen=True)
+class DetailParts:
+    dong: str | None = None    # '105동'
+    floor: str | None = None   # '5층'
+    ho: str | None = None      # '2001호'
+
+    def __bool__(self):
+        return bool(self.dong or self.floor or self.ho)
+
+    @property
+    def text(self) -> str:
+        return " ".join(p for p in (self.dong, self.floor, self.ho) if p)
+
+
+def detail_parts(parts: tuple[str, ...]) -> DetailParts:
+    """ParsedAddress.detail_parts ('105동', '2001호', '1단지') -> DetailParts"""
+    found = {}
+    for p in parts:
+        suffix = p[-1]
+        if suffix in ("동", "층", "호"):
+            found.setdefault(suffix, p)
+    return DetailParts(dong=found.get("동"), floor=found.get("층"), ho=found.get("호"))
+
+
+def _key(value: str | None) -> str:
+    """'105동' / '105' / ' 105 동' -> '105'"""
+    return DETAIL_KEY_RE.sub('', (value or "").replace(" ", ""))
+
+
+def _compare(parts: DetailParts, dong: str | None, floor: str | None, ho: str | None) -> int | None:
+    """Number of input parts checked against one record, None when one of them differs"""
+    checked = 0
+    if parts.dong:
+        if _key(parts.dong) != _key(dong):
+            return None
+        checked += 1
+    if parts.ho:
+        if _key(parts.ho) != _key(ho):
+            return None
+        checked += 1
+    # 층 is often omitted in the records: only checked when both sides have it
+    if parts.floor and floor:
+        if _key(parts.floor) != _key(floor):
+            return None
+        checked += 1
+    return checked
+
+
+def validate_details(db: Session, items: list[tuple[str | None, DetailParts]]) -> list[tuple[str | None, str | None]]:
+    """
+    Batch validation: [(mgmt_no, parts)] -> [(validated detail string, status)] in the same order.
+    Rows without a building or without detail parts get (None, None).
+    """
+    wanted = sorted({mgmt_no for mgmt_no, parts in items if mgmt_no and parts})
+    records: dict[str, list[tuple]] = {}
+    for i in range(0, len(wanted), IN_CHUNK):
+        chunk = wanted[i:i + IN_CHUNK]
+        stmt = select(
+            AddressDetail.mgmt_no, AddressDetail.dong, AddressDetail.floor, AddressDetail.ho
+        ).where(AddressDetail.mgmt_no.in_(chunk))
+        for mgmt_no, dong, floor, ho in db.execute(stmt):
+            records.setdefault(mgmt_no, []).append((dong, floor, ho))
+
+    results = []
+    for mgmt_no, parts in items:
+        if not mgmt_no or not parts:
+            results.append((None, None))
+            continue
+        building = records.get(mgmt_no)
+        if not building:
+            results.append((None, UNKNOWN))
+            continue
+        compared = [(_compare(parts, *r), r) for r in building]
+        match = next((r for checked, r in compared if checked), None)
+        if match is None:
+            # A record without a mismatch that checked nothing does not confirm the input
+            unchecked = any(checked == 0 for checked, _ in compared)
+            results.append((None, UNVERIFIED if unchecked else NOT_FOUND))
+        else:
+            # The parts the input named, in the stored spelling ('105 동' -> '105동')
+            dong, floor, ho = match
+            validated = DetailParts(
+                dong=dong if parts.dong else None,
+                floor=(floor or parts.floor) if parts.floor else None,
+                ho=ho if parts.ho else None,
+            )
+            results.append((validated.text, VERIFIED))
+    return results
+
+
+def validate_detail(db: Session, mgmt_no: str | None, parts: DetailParts) -> tuple[str | None, str | None]:
+    """Single-row form of validate_details"""
+    return validate_details(db, [(mgmt_no, parts)])[0]
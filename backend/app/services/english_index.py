@@ -0,0 +1,168 @@
+"""
+English Address Index (영문 주소 사전)
+- Folded English names -> stored Korean names, built from the road / region dictionary
+  tables (address_road.road_nm_eng, address_region.si_nm_eng / sgg_nm_eng).
+- Folding drops case, hyphens, spaces and punctuation, so 'Teheran-ro', 'TEHERAN RO'
+  and 'teheranro' are one key. The same fold_english is stored in address_road.road_nm_eng_key,
+  so the SQL fallback while the index loads matches exactly what the index matches.
+- LocalSearchService translates English input ("Teheran-ro 152, Gangnam-gu, Seoul")
+  into Korean road names + building number here, and the regular indexed
+  (road_nm, buld_mainsn) lookup returns the Korean canonical address.
+"""
+import re
+import sys
+from dataclasses import dataclass
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressRegion, AddressRoad
+from app.services.memory_index import MemoryIndex, register_index
+from app.utils.normalize import fold_english
+
+ENGLISH_TOKEN_RE = re.compile(r'[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*')
+LATIN_WORD_RE = re.compile(r'[A-Za-z]{2,}')
+NUMBER_FULL_RE = re.compile(r'^(\d+)(?:-(\d+))?$')
+REGION_SUFFIXES = ("si", "do", "gu", "gun")  # 'Gangnam-gu' is also matched by 'Gangnam'
+MAX_ROAD_TOKENS = 5  # 'Gasan digital 1-ro' = 3 tokens
+
+
+def is_english_address(text: str) -> bool:
+    """Latin-script input without any Hangul (goes through the English path)"""
+    return not any('가' <= c <= '힣' for c in text) and bool(LATIN_WORD_RE.search(text))
+
+
+def _region_stem(key: str) -> str | None:
+    for suffix in REGION_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix) + 1:
+            return key[:-len(suffix)]
+    return None
+
+
+@dataclass(frozen=True)
+class EnglishAddress:
+    """English input translated to stored Korean names"""
+    road_eng: str | None = None
+    road_names: tuple[str, ...] = ()   # Korean road_nm values with that English name
+    main: int | None = None
+    sub: int | None = None
+    sido: str | None = None
+    sgg_names: tuple[str, ...] = ()
+
+
+class EnglishIndex(MemoryIndex):
+    name = "english"
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        # folded English name -> stored Korean names
+        self.roads: dict[str, tuple[str, ...]] = {}
+        self.sidos: dict[str, str] = {}
+        self.sggs: dict[str, tuple[tuple[str, str], ...]] = {}  # -> (si_nm, sgg_nm)
+
+    def _build(self, db: Session):
+        roads: dict[str, set[str]] = {}
+        for road, road_eng in db.query(AddressRoad.road_nm, AddressRoad.road_nm_eng).filter(AddressRoad.road_nm_eng != None):
+            key = fold_english(road_eng)
+            if key and road:
+                roads.setdefault(key, set()).add(road)
+
+        sidos: dict[str, str] = {}
+        sggs: dict[str, set[tuple[str, str]]] = {}
+        rows = db.query(
+            AddressRegion.si_nm, AddressRegion.sgg_nm, AddressRegion.si_nm_eng, AddressRegion.sgg_nm_eng
+        ).filter(AddressRegion.si_nm_eng != None).distinct()
+        for si, sgg, si_eng, sgg_eng in rows:
+            si = sys.intern(si or "")
+            for key in (fold_english(si_eng), _region_stem(fold_english(si_eng))):
+                if key:
+                    sidos.setdefault(key, si)
+            if sgg and sgg_eng:
+                region = (si, sys.intern(sgg))
+                # 'Suwon-si Paldal-gu': the full name and each part ('Paldal-gu')
+                keys = {fold_english(sgg_eng)} | {fold_english(p) for p in sgg_eng.split()}
+                keys |= {_region_stem(k) for k in keys}
+                for key in keys:
+                    if key:
+                        sggs.setdefault(key, set()).add(region)
+
+        self.roads = {key: tuple(sorted(names)) for key, names in roads.items()}
+        self.sidos = sidos
+        self.sggs = {key: tuple(sorted(regions)) for key, regions in sggs.items()}
+
+    def _dump(self) -> dict:
+        return {"roads": self.roads, "sidos": self.sidos, "sggs": self.sggs}
+
+    def _restore(self, state: dict):
+        self.roads = state["roads"]
+        self.sidos = state["sidos"]
+        self.sggs = state["sggs"]
+
+    # --- Lookups ---
+    def road_names(self, db: Session, keys: set[str]) -> dict[str, tuple[str, ...]]:
+        """Folded key -> Korean road names (indexed road_nm_eng_key lookup while the index loads)"""
+        if self.is_ready:
+            return {k: self.roads[k] for k in keys if k in self.roads}
+        found: dict[str, set[str]] = {}
+        rows = db.query(AddressRoad.road_nm, AddressRoad.road_nm_eng_key).filter(
+            AddressRoad.road_nm_eng_key.in_(sorted(keys))
+        )
+        for road, key in rows:
+            found.setdefault(key, set()).add(road)
+        return {k: tuple(sorted(v)) for k, v in found.items()}
+
+    def parse(self, db: Session, raw: str) -> EnglishAddress:
+        """
+        'Teheran-ro 152, Gangnam-gu, Seoul' / '152 Teheran-ro Gangnam-gu Seoul' / 'Seoul Gangnam-gu Teheran-ro 152-1'
+        Road = the longest token span whose folded form is a known English road name,
+        building number = the number right after it (or right before it, Western order),
+        region = any remaining token that names a sido / sgg.
+        """
+        tokens = ENGLISH_TOKEN_RE.findall(raw)
+        spans = {}
+        for i in range(len(tokens)):
+            for j in range(i + 1, min(i + MAX_ROAD_TOKENS, len(tokens)) + 1):
+                key = fold_english("".join(tokens[i:j]))
+                if key and not key.isdigit():
+                    spans.setdefault(key, []).append((i, j))
+        roads = self.road_names(db, set(spans))
+
+        def number(k):
+            m = NUMBER_FULL_RE.match(tokens[k]) if 0 <= k < len(tokens) else None
+            return (int(m.group(1)), int(m.group(2) or 0)) if m else None
+
+        best = None  # (has number, span length, -start)
+        for key, names in roads.items():
+            for i, j in spans[key]:
+                nums = number(j) or number(i - 1)
+                rank = (nums is not None, j - i, -i)
+                if best is None or rank > best[0]:
+                    best = (rank, key, names, (i, j), nums)
+        if best is None:
+            return EnglishAddress()
+        _, key, names, (start, end), nums = best
+
+        sido, sgg_regions = None, set()
+        if self.is_ready:
+            for k, t in enumerate(tokens):
+                if start <= k < end:
+                    continue
+                key_t = fold_english(t)
+                if key_t in self.sidos:
+                    sido = sido or self.sidos[key_t]
+                elif key_t in self.sggs:
+                    sgg_regions.update(self.sggs[key_t])
+        if sido:
+            sgg_regions = {r for r in sgg_regions if r[0] == sido}
+        main, sub = nums or (None, None)
+        return EnglishAddress(
+            road_eng=" ".join(tokens[start:end]),
+            road_names=names,
+            main=main,
+            sub=sub,
+            sido=sido,
+            sgg_names=tuple(sorted({sgg for _, sgg in sgg_regions})),
+        )
+
+
+english_index = register_index(EnglishIndex())
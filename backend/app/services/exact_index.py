@@ -0,0 +1,113 @@
+"""
+Exact-Match Index (도로명 + 건물번호 정확 일치 인덱스)
+- Resident index keyed by (road_nm, buld_mainsn, buld_subsn) -> AddressMaster ids.
+- Per road name, keys are packed into a sorted int64 array and searched with bisect,
+  which keeps ~6.4M rows at ~14 bytes each instead of one dict entry per row.
+"""
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.memory_index import MemoryIndex, register_index
+
+SUB_BITS = 16  # buld_subsn < 65536
+
+
+def _pack(main: int, sub: int) -> int:
+    return (main << SUB_BITS) | sub
+
+
+class ExactMatchIndex(MemoryIndex):
+    name = "exact_match"
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        # { road_nm: (packed keys 'q', row ids 'i', region ids 'H') } sorted by packed key
+        self.roads: dict[str, tuple[array, array, array]] = {}
+        # region id -> (si_nm, sgg_nm)
+        self.regions: list[tuple[str, str]] = []
+
+    def _build(self, db: Session):
+        region_ids: dict[tuple[str, str], int] = {}
+        staging: dict[str, tuple[array, array, array]] = {}
+
+        rows = db.query(
+            AddressMaster.road_nm, AddressMaster.buld_mainsn, AddressMaster.buld_subsn,
+            AddressMaster.id, AddressMaster.si_nm, AddressMaster.sgg_nm
+        ).yield_per(50000)
+        for road, main, sub, row_id, si, sgg in rows:
+            if not road or main is None:
+                continue
+            region = (si or "", sgg or "")
+            rid = region_ids.get(region)
+            if rid is None:
+                rid = len(self.regions)
+                region_ids[region] = rid
+                self.regions.append((sys.intern(region[0]), sys.intern(region[1])))
+            bucket = staging.get(road)
+            if bucket is None:
+                bucket = (array('q'), array('i'), array('H'))
+                staging[sys.intern(road)] = bucket
+            bucket[0].append(_pack(main, sub or 0))
+            bucket[1].append(row_id)
+            bucket[2].append(rid)
+
+        # Sort each road bucket by packed key (then id, to keep DB order within a key)
+        for road, (keys, ids, regs) in staging.items():
+            order = sorted(range(len(keys)), key=lambda i: (keys[i], ids[i]))
+            self.roads[road] = (
+                array('q', (keys[i] for i in order)),
+                array('i', (ids[i] for i in order)),
+                array('H', (regs[i] for i in order)),
+            )
+
+    def _dump(self) -> dict:
+        return {"roads": self.roads, "regions": self.regions}
+
+    def _restore(self, state: dict):
+        self.roads = state["roads"]
+        self.regions = state["regions"]
+
+    def lookup(self, road_names: list[str], main: int, sub: int | None = 0,
+               sido_hint: str | None = None, sgg_hints: tuple[str, ...] = (),
+               sgg_names: tuple[str, ...] | None = None, limit: int = 10) -> list[int]:
+        """
+        Return AddressMaster ids for (road, main, sub) without touching the DB.
+        - sub=None matches any sub number.
+        - sido_hint: prefix match on si_nm (same as si_nm LIKE 'sido%')
+        - sgg_hints: substring match on sgg_nm, any of them (same as sgg_nm LIKE '%sgg%')
+        - sgg_names: exact sgg_nm values (validated by the gazetteer)
+        """
+        lo_key = _pack(main, sub or 0)
+        hi_key = _pack(main, 0xFFFF) if sub is None else lo_key
+
+        region_ok: dict[int, bool] = {}
+        found = []
+        for road in road_names:
+            bucket = self.roads.get(road)
+            if not bucket:
+                continue
+            keys, ids, regs = bucket
+            for i in range(bisect_left(keys, lo_key), bisect_right(keys, hi_key)):
+                rid = regs[i]
+                ok = region_ok.get(rid)
+                if ok is None:
+                    si, sgg = self.regions[rid]
+                    ok = (not sido_hint or si.startswith(sido_hint)) and \
+                         (not sgg_hints or any(h in sgg for h in sgg_hints)) and \
+                         (sgg_names is None or sgg in sgg_names)
+                    region_ok[rid] = ok
+                if ok:
+                    found.append(ids[i])
+        found.sort()
+        return found[:limit]
+
+    def has_road(self, road_name: str) -> bool:
+        return road_name in self.roads
+
+
+exact_index = register_index(ExactMatchIndex())
@@ -0,0 +1,219 @@
+"""
+Administrative Gazetteer (행정구역 사전: 시도 → 시군구 → 읍면동 → 리)
+- Built from the road code file (개선_도로명코드_전체분) plus the distinct regions in
+  AddressMaster (the code file has no 리 names).
+- Region hints guessed by the parser ('분당구', '우동', '구억리') are resolved with dict
+  lookups into the exact stored names, so the search filters can use equality / IN
+  instead of LIKE '%..%', and hints that do not exist anywhere are dropped.
+- Resolved names also carry their integer region codes (sido_cd / sgg_cd / emd_cd),
+  which hit the (code, road_nm, buld_mainsn) indexes.
+"""
+import re
+import sys
+from dataclasses import dataclass
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.address_parser import RegionHints, SPECIAL_CITY_MAP
+from app.services.memory_index import MemoryIndex, register_index
+
+# Renamed provinces: data imported before the rename still uses the old name
+SIDO_LEGACY = {
+    "강원특별자치도": "강원도",
+    "전북특별자치도": "전라북도",
+}
+
+# 한자어 숫자 <-> 아라비아 숫자 (법정동/리 이름 변형: 일도2동 <-> 일도이동)
+HANCHA_DIGITS = {"1": "일", "2": "이", "3": "삼", "4": "사", "5": "오",
+                 "6": "육", "7": "칠", "8": "팔", "9": "구", "10": "십"}
+NUMBERED_NAME_RE = re.compile(r'^([가-힣]+?)(\d+)([동가리])$')
+
+
+def name_variants(name: str) -> list[str]:
+    """'일도2동' -> ['일도2동', '일도이동'] (DB may store either form)"""
+    variants = {name}
+    m = NUMBERED_NAME_RE.match(name)
+    if m and m.group(2) in HANCHA_DIGITS:
+        variants.add(f"{m.group(1)}{HANCHA_DIGITS[m.group(2)]}{m.group(3)}")
+    return sorted(variants)
+
+
+@dataclass(frozen=True)
+class ResolvedRegion:
+    """
+    Region hints after validation.
+    resolved=True : sido is the stored si_nm, *_names are the exact stored values
+                    (None = no constraint for that level), *_cd(s) their region codes
+                    (None = codes not known yet, filter by name).
+    resolved=False: gazetteer not loaded yet - only the raw hints are available.
+    """
+    sido: str | None = None
+    sgg: str | None = None
+    emd: str | None = None
+    ri: str | None = None
+    sgg_names: tuple[str, ...] | None = None
+    emd_names: tuple[str, ...] | None = None
+    ri_names: tuple[str, ...] | None = None
+    sido_cd: int | None = None
+    sgg_cds: tuple[int, ...] | None = None
+    emd_cds: tuple[int, ...] | None = None
+    resolved: bool = False
+
+
+class Gazetteer(MemoryIndex):
+    name = "gazetteer"
+    SNAPSHOT_VERSION = 2
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        self.sidos: set[str] = set()
+        # sgg token ('성남시', '분당구', '성남시 분당구') -> stored sgg_nm values
+        self.sgg_index: dict[str, set[str]] = {}
+        # stored sgg_nm -> si_nm values, and back
+        self.sgg_sidos: dict[str, set[str]] = {}
+        self.sido_sggs: dict[str, set[str]] = {}
+        # emd / ri name -> stored sgg_nm values containing it
+        self.emd_index: dict[str, set[str]] = {}
+        self.ri_index: dict[str, set[str]] = {}
+        # region codes: si_nm -> sido_cd, (si_nm, sgg_nm) -> sgg_cd, (si_nm, sgg_nm, emd_nm) -> emd_cd
+        self.sido_codes: dict[str, int] = {}
+        self.sgg_codes: dict[tuple[str, str], int] = {}
+        self.emd_codes: dict[tuple[str, str, str], int] = {}
+
+    def _add(self, sido: str, sgg: str, emd: str, ri: str = "", sgg_cd: int = 0, emd_cd: int = 0):
+        if not sido:
+            return
+        sido = sys.intern(sido)
+        self.sidos.add(sido)
+        if sgg_cd:
+            self.sido_codes.setdefault(sido, sgg_cd // 1000)
+            self.sgg_codes.setdefault((sido, sgg), sgg_cd)
+        if emd_cd:
+            self.emd_codes.setdefault((sido, sgg, emd), emd_cd)
+        if not sgg:
+            return
+        sgg = sys.intern(sgg)
+        self.sgg_sidos.setdefault(sgg, set()).add(sido)
+        self.sido_sggs.setdefault(sido, set()).add(sgg)
+        self.sgg_index.setdefault(sgg, set()).add(sgg)
+        for part in sgg.split():
+            self.sgg_index.setdefault(part, set()).add(sgg)
+        if emd:
+            self.emd_index.setdefault(sys.intern(emd), set()).add(sgg)
+        if ri:
+            self.ri_index.setdefault(sys.intern(ri), set()).add(sgg)
+
+    def _build(self, db: Session):
+        from app.utils.import_address_data import load_road_code_map
+        # Stored rows first: their codes are the ones the region filters compare against
+        rows = db.query(
+            AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.emd_nm, AddressMaster.ri_nm,
+            AddressMaster.sgg_cd, AddressMaster.emd_cd
+        ).distinct()
+        for si, sgg, emd, ri, sgg_cd, emd_cd in rows:
+            self._add(si or "", sgg or "", emd or "", ri or "", sgg_cd or 0, emd_cd or 0)
+
+        for code, info in load_road_code_map().items():
+            sgg_cd = int(code[:5]) if code[:5].isdigit() else 0
+            self._add(info["sido"], info["sgg"], info["emd"], "", sgg_cd, info["emd_cd"])
+
+    def _dump(self) -> dict:
+        return {
+            "sidos": self.sidos, "sgg_index": self.sgg_index, "sgg_sidos": self.sgg_sidos,
+            "sido_sggs": self.sido_sggs, "emd_index": self.emd_index, "ri_index": self.ri_index,
+            "sido_codes": self.sido_codes, "sgg_codes": self.sgg_codes, "emd_codes": self.emd_codes
+        }
+
+    def _restore(self, state: dict):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    # --- Lookups ---
+    def resolve_sido(self, sido_hint: str | None) -> str | None:
+        if not sido_hint:
+            return None
+        if sido_hint in self.sidos:
+            return sido_hint
+        legacy = SIDO_LEGACY.get(sido_hint)
+        if legacy in self.sidos:
+            return legacy
+        return None
+
+    def sgg_names(self, sgg_hint: str | None, sido: str | None = None) -> tuple[str, ...] | None:
+        """Stored sgg_nm values named by the hint (특례시 ↔ 일반시 both), optionally within one sido"""
+        if not sgg_hint:
+            return None
+        names = set(self.sgg_index.get(sgg_hint, ()))
+        alt = SPECIAL_CITY_MAP.get(sgg_hint)
+        if alt:
+            names |= self.sgg_index.get(alt, set())
+        if sido:
+            names = {n for n in names if sido in self.sgg_sidos.get(n, ())}
+        return tuple(sorted(names)) or None
+
+    def sgg_names_in_sido(self, sido: str) -> tuple[str, ...]:
+        return tuple(sorted(self.sido_sggs.get(sido, ())))
+
+    def emd_names(self, emd_hint: str | None) -> tuple[str, ...] | None:
+        """Stored emd_nm spellings of the hint ('일도2동' -> ('일도이동',)), None if unknown"""
+        if not emd_hint:
+            return None
+        return tuple(v for v in name_variants(emd_hint) if v in self.emd_index) or None
+
+    def ri_names(self, ri_hint: str | None) -> tuple[str, ...] | None:
+        if not ri_hint:
+            return None
+        return tuple(v for v in name_variants(ri_hint) if v in self.ri_index) or None
+
+    def region_codes(self, sido: str | None, sgg_names: tuple[str, ...] | None,
+                     emd_names: tuple[str, ...] | None) -> tuple[int | None, tuple | None, tuple | None]:
+        """
+        (sido_cd, sgg_cds, emd_cds) for resolved names. A level is None when any of its
+        names has no code (rows not backfilled yet) so callers fall back to name equality.
+        """
+        sido_cd = self.sido_codes.get(sido) if sido else None
+
+        def codes(keys, table):
+            found = [table.get(k) for k in keys]
+            if not found or not all(found):
+                return None
+            return tuple(sorted(set(found)))
+
+        sgg_cds = emd_cds = None
+        if sgg_names:
+            sgg_cds = codes([(si, n) for n in sgg_names for si in self.sgg_sidos.get(n, ())
+                             if not sido or si == sido], self.sgg_codes)
+        if emd_names:
+            emd_cds = codes([(si, sgg, e) for e in emd_names for sgg in self.emd_index.get(e, ())
+                             if not sgg_names or sgg in sgg_names
+                             for si in self.sgg_sidos.get(sgg, ()) if not sido or si == sido], self.emd_codes)
+        return sido_cd, sgg_cds, emd_cds
+
+    def resolve(self, hints: RegionHints) -> ResolvedRegion:
+        """Validate parser hints against the gazetteer (unknown names are dropped)"""
+        if not self.is_ready:
+            return ResolvedRegion(hints.sido, hints.sgg, hints.emd, hints.ri)
+
+        sido = self.resolve_sido(hints.sido)
+        sgg_names = self.sgg_names(hints.sgg)
+        emd_names = self.emd_names(hints.emd)
+        ri_names = self.ri_names(hints.ri)
+        sido_cd, sgg_cds, emd_cds = self.region_codes(sido, sgg_names, emd_names)
+        return ResolvedRegion(
+            sido=sido,
+            sgg=hints.sgg if sgg_names else None,
+            emd=hints.emd if emd_names else None,
+            ri=hints.ri if ri_names else None,
+            sgg_names=sgg_names,
+            emd_names=emd_names,
+            ri_names=ri_names,
+            sido_cd=sido_cd,
+            sgg_cds=sgg_cds,
+            emd_cds=emd_cds,
+            resolved=True
+        )
+
+
+gazetteer = register_index(Gazetteer())
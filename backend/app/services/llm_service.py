@@ -14,10 +14,10 @@ class LLMService:
             api_key=self.api_key
         )
 
-    def correct_address(self, raw_text: str) -> str:
+    def correct_address(self, raw_text: str) -> str | None:
         """
         Ask LLM to correct the address.
-        Returns the corrected address string.
+        Returns the corrected address string, or None if the LLM could not be reached.
         """
         # Load Golden Test Cases as "Few-Shot Examples"
         from ..golden_test_cases import TEST_CASES
@@ -62,6 +62,6 @@ class LLMService:
             return corrected
         except Exception as e:
             print(f" [LLM] Error (Is Ollama running?): {e}")
-            return raw_text # Fallback to original if LLM fails
+            return None  # No answer - callers must not treat this as "uncorrectable"
 
 llm_service = LLMService()
@@ -1,660 +1,424 @@
 from sqlalchemy.orm import Session
 from app.models.local_address import AddressMaster
 from app.schemas.address import NormalizationResult
-from sqlalchemy import or_
+from sqlalchemy import and_, case, or_, select
+from app.services.exact_index import exact_index
+from app.services.ngram_index import ngram_index
+from app.services.gazetteer import gazetteer, name_variants, ResolvedRegion
+from app.services.road_speller import road_speller
+from app.services.english_index import english_index, is_english_address
+from app.services.columnar_store import columnar_store
+from app.core.config import settings
+from app.services.candidate_scorer import QueryFeatures, rank_candidates
+from app.utils.normalize import normalize_building_key
+from app.utils.address_format import road_address_of, jibun_address_of
+from app.db.fulltext import building_name_filter
+from app.services.address_parser import (
+    ParsedAddress, RegionHints, parse_address, is_sido_token, SIDO_MAP, SPECIAL_CITY_MAP,
+    NUMBER_RE, DETAIL_TOKEN_RE
+)
 import re
 
-class LocalSearchService:
-    # 특례시 매핑 (양방향)
-    SPECIAL_CITY_MAP = {
-        "수원특례시": "수원시",
-        "용인특례시": "용인시",
-        "고양특례시": "고양시",
-        "창원특례시": "창원시",
-        # 역방향
-        "수원시": "수원특례시",
-        "용인시": "용인특례시",
-        "고양시": "고양특례시",
-        "창원시": "창원특례시",
-    }
-
-    # 시도명 매핑 (약어/별칭 포함)
-    SIDO_MAP = {
-        "서울": "서울특별시", "서울특별시": "서울특별시",
-        "부산": "부산광역시", "부산광역시": "부산광역시",
-        "대구": "대구광역시", "대구광역시": "대구광역시",
-        "인천": "인천광역시", "인천광역시": "인천광역시",
-        "광주": "광주광역시", "광주광역시": "광주광역시",
-        "대전": "대전광역시", "대전광역시": "대전광역시",
-        "울산": "울산광역시", "울산광역시": "울산광역시",
-        "세종": "세종특별자치시", "세종시": "세종특별자치시", "세종특별자치시": "세종특별자치시",
-        "경기": "경기도", "경기도": "경기도",
-        "강원": "강원특별자치도", "강원도": "강원특별자치도", "강원특별자치도": "강원특별자치도",
-        "충북": "충청북도", "충청북도": "충청북도",
-        "충남": "충청남도", "충청남도": "충청남도",
-        "전북": "전북특별자치도", "전라북도": "전북특별자치도", "전북특별자치도": "전북특별자치도",
-        "전남": "전라남도", "전라남도": "전라남도",
-        "경북": "경상북도", "경상북도": "경상북도",
-        "경남": "경상남도", "경상남도": "경상남도",
-        "제주": "제주특별자치도", "제주도": "제주특별자치도", "제주특별자치도": "제주특별자치도"
-    }
-    
-    def _parse_region_hints(self, tokens: list[str]) -> tuple[str | None, str | None, str | None, str | None]:
-        """토큰 목록에서 시도/시군구/읍면동/리 힌트를 추출"""
-        sido_hint = None
-        sgg_hint = None
-        emd_hint = None
-        ri_hint = None
-
-        # Helper to find Ri (Rural village)
-        for t in tokens:
-            if t.endswith('리') and len(t) > 1 and not t[0].isdigit():
-                ri_hint = t
-                break
-
-        # 1. Detect Sido
-        for i, t in enumerate(tokens):
-            # 도로명은 제외 (예: 세종대로에서 '세종'이 시도로 인식되는 것 방지)
-            if t.endswith('로') or t.endswith('길') or t.endswith('대로'):
-                continue
-            
-            # 1. 시도 검색
-            found_sido = False
-            for alias, full_name in self.SIDO_MAP.items():
-                if t == alias or t.startswith(alias):
-                    if t == alias or t == full_name:
-                        sido_hint = full_name
-                        found_sido = True
-                        break
-                    elif len(t) > len(alias):
-                        # '제주제주시' 같은 경우 처리
-                        rem = t[len(alias):]
-                        if rem.endswith('시') or rem.endswith('군') or rem.endswith('구'):
-                            sido_hint = full_name
-                            sgg_hint = rem
-                            found_sido = True
-                            break
-            
-            # 1-2. Typo correction (e.g. "주특별자치도" -> "제주특별자치도")
-            if not found_sido and t == "주특별자치도":
-                sido_hint = "제주특별자치도"
-                found_sido = True
+# Columns read by the scorer, _to_result and _to_candidate.
+# Hot paths select these as plain row tuples (Core) instead of hydrating ORM entities.
+ROW_COLUMNS = (
+    AddressMaster.id, AddressMaster.mgmt_no, AddressMaster.si_nm, AddressMaster.sgg_nm,
+    AddressMaster.emd_nm, AddressMaster.ri_nm, AddressMaster.road_nm,
+    AddressMaster.buld_mainsn, AddressMaster.buld_subsn, AddressMaster.jibun_main, AddressMaster.jibun_sub,
+    AddressMaster.buld_nm, AddressMaster.buld_nm_key, AddressMaster.zip_no, AddressMaster.is_basement,
+    AddressMaster.road_full_addr, AddressMaster.jibun_full_addr,
+)
 
-            if found_sido:
-                continue
 
-            # 2. 시군구/읍면동 검색 (시도 검색 안 된 경우)
-            if len(t) > 1:
-                # Sgg check
-                if t.endswith('시') or t.endswith('군') or t.endswith('구'):
-                    if t not in self.SIDO_MAP.values() and "특별" not in t and "광역" not in t:
-                        if not sgg_hint: sgg_hint = t
-                # Emd check
-                elif t.endswith('읍') or t.endswith('면') or t.endswith('동'):
-                    if not t[0].isdigit() and not emd_hint:
-                        emd_hint = t
-        
-        return sido_hint, sgg_hint, emd_hint, ri_hint
-    
+class LocalSearchService:
+    SPECIAL_CITY_MAP = SPECIAL_CITY_MAP
+    SIDO_MAP = SIDO_MAP
+
     def __init__(self, db: Session):
         self.db = db
-    
-    def _normalize_special_city(self, text: str) -> tuple[str, str | None]:
-        """
-        Normalize special city names for search.
-        Returns: (normalized_text, alternative_sgg)
-        - normalized_text: 검색어에서 특례시를 일반시로 변환
-        - alternative_sgg: DB 검색 시 사용할 대체 시군구명
-        """
-        alt_sgg = None
-        result = text
-        
-        for special, normal in [
-            ("수원특례시", "수원시"),
-            ("용인특례시", "용인시"),
-            ("고양특례시", "고양시"),
-            ("창원특례시", "창원시"),
-        ]:
-            if special in text:
-                result = text.replace(special, normal)
-                alt_sgg = special
-            elif normal in text:
-                alt_sgg = special  # DB에는 특례시로 저장되어 있을 수 있음
-        
-        return result, alt_sgg
 
-    def _normalize_hancha_numbers(self, text: str) -> str:
+    @staticmethod
+    def _code_or_name(code_col, codes, name_col, names):
         """
-        한자어 숫자 표현(일동, 이동...)을 아라비아 숫자로 변환
-        예: 일도이동 -> 일도2동, 중앙동일가 -> 중앙동1가
+        Code IN filter that keeps rows without a code (0 / NULL, not backfilled yet)
+        when their stored name matches - both arms stay on the ix_addr_*_cd indexes.
         """
-        # (구역명)(한자숫자)(동/가/로) 패턴 매칭
-        # 예: 일도(이)(동) -> 일도2동
-        hancha_map = {
-            "일": "1", "이": "2", "삼": "3", "사": "4", "오": "5",
-            "육": "6", "칠": "7", "팔": "8", "구": "9", "십": "10"
-        }
-        
-        result = text
-        for kor, num in hancha_map.items():
-            # (글자들)(일/이/삼...)(동/가/로) 형태를 찾아서 변환
-            # 예: 일도이동 -> 일도2동, 중앙동일가 -> 중앙동1가, 종로이가 -> 종로2가
-            # 단어 끝이거나 공백, 숫자 앞인 경우만 변환
-            pattern = f"([가-힣]+){kor}([동가로])(?=\\s|$|[0-9])"
-            result = re.sub(pattern, f"\\g<1>{num}\\g<2>", result)
-            
-        return result
-
-    def _insert_spaces(self, text: str) -> str:
-        """
-        Insert spaces in concatenated address strings.
-        e.g., "부산광역시남구수영로305" → "부산광역시 남구 수영로 305"
-        """
-        # Even if has spaces, we might need to split some parts (e.g. '로304번')
-        result = text
-        
-        # Insert space AFTER these patterns (Korean administrative boundaries)
-        patterns = [
-            (r'(특별시)', r'\1 '),
-            (r'(광역시)', r'\1 '),
-            (r'(특별자치시)', r'\1 '),
-            (r'(특별자치도)', r'\1 '),
-            (r'([가-힣]+도)(?=[가-힣])', r'\1 '),  # 경기도, 충청북도 등
-            (r'([가-힣]+시)(?=[가-힣]+[구군동])', r'\1 '),  # XX시 다음에 구/군/동이 오면
-            (r'([가-힣]+구)(?=[가-힣])', r'\1 '),  # 남구, 해운대구 등
-            (r'([가-힣]+군)(?=[가-힣])', r'\1 '),
-            (r'([가-힣]+읍)(?=[가-힣])', r'\1 '),
-            (r'([가-힣]+면)(?=[가-힣])', r'\1 '),
-            (r'([가-힣]+리)(?=[가-힣]|\d)', r'\1 '),  # 하귀리1-1 → 하귀리 1-1
-            (r'([가-힣]+동)(?=[가-힣]+로|[가-힣]+길|\d)', r'\1 '),  # 동 다음에 로/길/숫자
-            # Do NOT split "로NN번길" -> it's often a single road name.
-            # Only split if it's "로" followed by digits NOT ending in "번길"
-            (r'([가-힣]+로)(\d+)(?!번길)', r'\1 \2'),  
-            (r'([가-힣]+길)(\d+)', r'\1 \2'),
-            (r'([가-힣]+대로)(\d+)', r'\1 \2'),
-            (r'(\d+)(번지?|호|동|층)', r'\1 \2'),  # 304번 → 304 번, 101호 → 101 호
-        ]
-        
-        for pattern, replacement in patterns:
-            result = re.sub(pattern, replacement, result)
-        
-        # Clean up multiple spaces
-        result = re.sub(r'\s+', ' ', result).strip()
-        
-        return result
+        uncoded = or_(code_col == 0, code_col.is_(None))
+        return or_(code_col.in_(codes), and_(uncoded, name_col.in_(names)))
 
-    def search(self, raw_query: str) -> NormalizationResult | None:
+    def _region_filter(self, q, region: ResolvedRegion, use_sido=True, use_sgg=True, use_emd=False):
         """
-        Search address in local DB using basic parsing and LIKE query.
-        This is much faster than external API.
+        Apply region hints to a query.
+        Validated hints (gazetteer loaded) -> equality / IN on the integer region codes
+        (ix_addr_*_cd) plus the stored names for rows without codes yet;
+        otherwise the raw hints as LIKE filters.
         """
-        # 0-A. Preprocess: Insert spaces in concatenated input
-        # e.g., "부산광역시남구수영로305" → "부산광역시 남구 수영로 305"
-        processed_query = self._insert_spaces(raw_query)
-        if processed_query != raw_query:
-            print(f"[DEBUG] Space insertion: '{raw_query}' → '{processed_query}'")
-        raw_query = processed_query
-        
-        # 0-A2. Normalize special cities (특례시 처리)
-        # e.g., "수원시" → also search "수원특례시"
-        raw_query, alt_sgg = self._normalize_special_city(raw_query)
-        if alt_sgg:
-            print(f"[DEBUG] Special city detected: alt_sgg='{alt_sgg}'")
-            
-        # 0-A3. Normalize Hancha numbers (일동 -> 1동)
-        raw_query = self._normalize_hancha_numbers(raw_query)
-        
-        # 0-B. Preprocess: Extract bracket content (reference info)
-        # Pattern: "[연동, 대림2차아파트]" or "(연동)" 
-        bracket_content = ""
-        ref_building_name = None
-        
-        # Extract [...] content
-        bracket_match = re.search(r'\[([^\]]+)\]', raw_query)
-        if bracket_match:
-            bracket_content = bracket_match.group(1)
-            # Try to extract building name from bracket (usually after comma)
-            if ',' in bracket_content:
-                parts = bracket_content.split(',')
-                for p in parts:
-                    p = p.strip()
-                    if '아파트' in p or '빌딩' in p or '타워' in p or '밸리' in p or '센터' in p:
-                        ref_building_name = p
-                        break
-                if not ref_building_name and len(parts) > 1:
-                    ref_building_name = parts[-1].strip()  # Last part is often building name
-            else:
-                # Single item in bracket - could be dong or building
-                if '동' not in bracket_content or '아파트' in bracket_content:
-                    ref_building_name = bracket_content.strip()
-            
-            # 0-B2. If bracket looks like Jibun (Contains 'Ri' or 'Dong' and Numbers)
-            # e.g., [구억리, 1159-0]
-            if ',' in bracket_content:
-                jb_parts = [p.strip() for p in bracket_content.split(',')]
-                jb_emd = None
-                jb_num = None
-                for p in jb_parts:
-                    if p.endswith('리') or p.endswith('동') or p.endswith('읍') or p.endswith('면'):
-                        jb_emd = p
-                    if re.match(r'^\d+(?:-\d+)?$', p):
-                        jb_num = p
-                
-                if jb_emd and jb_num:
-                    # Normalize -0 to just the main number (e.g. 486-0 -> 486)
-                    if jb_num.endswith('-0'):
-                        jb_num = jb_num[:-2]
-                        
-                    print(f"[DEBUG] Priority Jibun Search from bracket: {jb_emd} {jb_num}")
-                    # Try a quick search with this info
-                    q_jb = self.db.query(AddressMaster).filter(AddressMaster.jibun_full_addr.like(f"%{jb_emd}% {jb_num}%"))
-                    if sido_hint: q_jb = q_jb.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-                    if sgg_hint: q_jb = q_jb.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
-                    res_jb = q_jb.first()
-                    if res_jb:
-                        return self._to_result(res_jb)
-        
-        # Remove bracket content from query for cleaner parsing
-        clean_query = re.sub(r'\[[^\]]+\]', ' ', raw_query)
-        clean_query = re.sub(r'\([^\)]+\)', ' ', clean_query)  # Also remove ()
-        
-        # Clean redundant regional names (e.g. "제주시 ... 제주시")
-        # Find hints
-        sh, sgh, eh, rh = self._parse_region_hints(clean_query.split())
-        if sh: clean_query = re.sub(f'\\s{sh}\\s', ' ', f' {clean_query} ', count=1).strip()
-        if sgh: clean_query = re.sub(f'\\s{sgh}\\s', ' ', f' {clean_query} ', count=1).strip()
-        # Ensure we keep at least one mention if we just deleted everything, but actually _parse_region_hints
-        # already extracted them. Let's just normalize the query to avoid double counting.
-        
-        # Strip "번지" or "번" from numbers
-        clean_query = re.sub(r'(\d+(?:-\d+)?)\s*(?:번지|번)', r'\1', clean_query)
-        
-        # Handle numbers stuck to brackets: "25[연동]" -> "25 "
-        clean_query = re.sub(r'(\d+)\s*\[', r'\1 ', clean_query)
-        
-        # Clean up multiple spaces
-        clean_query = re.sub(r'\s+', ' ', clean_query).strip()
-        
-        # 1. Simple Parsing
-        tokens = clean_query.split()
-        if len(tokens) < 2:
-            # Try with ref_building_name if available
-            if ref_building_name:
-                return self._search_by_building_name(ref_building_name)
-            return None
-            
-        # Try to find 'Road Name' and 'Building Number'
-        road_num = None
-        road_name = None
-        
-        # Extract number from tokens (look for pattern like "연화로 25")
-        for i, token in enumerate(tokens):
-            # Check if this token ends with road suffix and next is number
-            if any(token.endswith(suffix) for suffix in ['로', '길', '대로']):
-                road_name = token
-                # Check next token for number
-                if i + 1 < len(tokens):
-                    next_token = tokens[i + 1]
-                    # Extract number (handle "25" or "25-1" or "25동" etc)
-                    num_match = re.match(r'^(\d+)(?:-(\d+))?', next_token)
-                    if num_match:
-                        # Preserve full number string including sub-number
-                        if num_match.group(2):
-                            road_num = f"{num_match.group(1)}-{num_match.group(2)}"
-                        else:
-                            road_num = num_match.group(1)
-                        break
-        
-        # Fallback: Check last numeric token
-        if not road_num:
-            for token in reversed(tokens):
-                num_match = re.match(r'^(\d+)(?:-(\d+))?$', token)
-                if num_match:
-                    # Preserve full number string
-                    if num_match.group(2):
-                        road_num = f"{num_match.group(1)}-{num_match.group(2)}"
-                    else:
-                        road_num = num_match.group(1)
-                    break
-        
-        # Extract road name (scan parts)
-        # Extract road name (scan parts)
-        # Also try to extract Region (Sido) and District (Sgg) for better filtering
-        # 1.1 Extract Region (Sido) and District (Sgg) for better filtering
-        sido_hint, sgg_hint, emd_hint, ri_hint = self._parse_region_hints(tokens)
-
-        # Helper to check if string contains Korean
-        def has_korean(text):
-            return any(ord('가') <= ord(c) <= ord('힣') for c in text)
-
-        for i, t in enumerate(tokens):
-            # Detect Road Name
-            if t.endswith('로') or t.endswith('길'):
-                # 1. If starts with digit (e.g. '1로', '3길'), merge with previous token!
-                if t[0].isdigit() and i > 0:
-                    # Check if previous token is NOT a Sigg/Sido
-                    prev = tokens[i-1]
-                    if not (prev.endswith('시') or prev.endswith('구') or prev.endswith('군')):
-                         # Merge! (e.g. '디지털' + '1로' -> '디지털1로')
-                         road_name = prev + t
-                         # Maybe merge one more time? (e.g. '가산' + '디지털1로')
-                         if i > 1:
-                             prev2 = tokens[i-2]
-                             if not (prev2.endswith('시') or prev2.endswith('구') or prev2.endswith('군')) and has_korean(prev2):
-                                 road_name = prev2 + road_name
+        if region.resolved:
+            if use_sido and region.sido:
+                if region.sido_cd:
+                    q = q.filter(self._code_or_name(
+                        AddressMaster.sido_cd, (region.sido_cd,), AddressMaster.si_nm, (region.sido,)))
                 else:
-                    road_name = t
-            
-            # Detect Road Num (Digits or Digits-Digits)
-            elif road_name and not road_num:
-                # Match strict number pattern 10 or 10-10
-                if re.match(r'^\d+(?:-\d+)?$', t):
-                    road_num = t
-                    print(f"[DEBUG] Assigned Num: {road_num} from token '{t}'")
-
-        # If no road name found, generic search is better to avoid matching 
-        # arbitrary roads by building number alone (especially common with Jibun addresses)
-        if not road_name:
-            return self._like_search(raw_query)
-
-        # [DEBUG]
-        print(f"[DEBUG] LocalSearch Parse: Road={road_name}, Num={road_num}, Sido={sido_hint}, Sgg={sgg_hint}")
-
-        # 2. Query Construction
-        query = self.db.query(AddressMaster)
-        
-        if road_name:
-            # Try Exact Match first
-            # Also try removing spaces from input road_name (e.g. '디지털 1로' -> '디지털1로')
-            clean_road = road_name.replace(" ", "")
-            if clean_road != road_name:
-                query = query.filter(or_(AddressMaster.road_nm == road_name, AddressMaster.road_nm == clean_road))
-            else:
-                query = query.filter(AddressMaster.road_nm == road_name)
-                
-        if road_num:
-            if isinstance(road_num, str) and '-' in road_num:
-                main_s, sub_s = road_num.split('-')
-                if main_s.isdigit() and sub_s.isdigit():
-                    query = query.filter(AddressMaster.buld_mainsn == int(main_s))
-                    query = query.filter(AddressMaster.buld_subsn == int(sub_s))
+                    q = q.filter(AddressMaster.si_nm == region.sido)
+            if use_sgg and region.sgg_names:
+                if region.sgg_cds:
+                    q = q.filter(self._code_or_name(
+                        AddressMaster.sgg_cd, region.sgg_cds, AddressMaster.sgg_nm, region.sgg_names))
                 else:
-                    # Fallback if weird format
-                    pass 
-            elif str(road_num).isdigit():
-                query = query.filter(AddressMaster.buld_mainsn == int(road_num))
-                # If user typed "10", strictly "10-0".
-                # But sometimes users omit sub 0.
-                query = query.filter(AddressMaster.buld_subsn == 0)
-        
-        # Apply Regional Filters if detected
-        if sido_hint:
-            query = query.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-        if sgg_hint:
+                    q = q.filter(AddressMaster.sgg_nm.in_(region.sgg_names))
+            if use_emd and region.emd_names:
+                if region.emd_cds:
+                    q = q.filter(self._code_or_name(
+                        AddressMaster.emd_cd, region.emd_cds, AddressMaster.emd_nm, region.emd_names))
+                else:
+                    q = q.filter(AddressMaster.emd_nm.in_(region.emd_names))
+            return q
+
+        if use_sido and region.sido:
+            q = q.filter(AddressMaster.si_nm.like(f"{region.sido}%"))
+        if use_sgg and region.sgg:
             # Handle special city mapping (특례시 ↔ 일반시)
-            alt_sgg_for_query = self.SPECIAL_CITY_MAP.get(sgg_hint)
-            if alt_sgg_for_query:
-                # Search both: 수원시 OR 수원특례시
-                query = query.filter(or_(
-                    AddressMaster.sgg_nm.like(f"%{sgg_hint}%"),
-                    AddressMaster.sgg_nm.like(f"%{alt_sgg_for_query}%")
+            alt_sgg = self.SPECIAL_CITY_MAP.get(region.sgg)
+            if alt_sgg:
+                q = q.filter(or_(
+                    AddressMaster.sgg_nm.like(f"%{region.sgg}%"),
+                    AddressMaster.sgg_nm.like(f"%{alt_sgg}%")
                 ))
             else:
-                query = query.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
+                q = q.filter(AddressMaster.sgg_nm.like(f"%{region.sgg}%"))
+        if use_emd and region.emd:
+            q = q.filter(AddressMaster.emd_nm.like(f"%{region.emd}%"))
+        return q
 
-        # Scoring Logic: Prioritize checks that match Sido/Sgg even if not explicitly filtered?
-        # For now, just trust the filter.
-            
-        results = query.limit(10).all()
-        
-        # 2-1. Retry with Fuzzy Search if Road Name Exact Match Failed
-        if not results and road_name:
-            # Maybe AI dropped a number (e.g. 가산디지털1로 -> 가산디지털로)
-            query_retry = self.db.query(AddressMaster)
-            if road_num:
-                if isinstance(road_num, str) and '-' in road_num:
-                    main_s, sub_s = road_num.split('-')
-                    if main_s.isdigit() and sub_s.isdigit():
-                        query_retry = query_retry.filter(AddressMaster.buld_mainsn == int(main_s))
-                        query_retry = query_retry.filter(AddressMaster.buld_subsn == int(sub_s))
-                elif str(road_num).isdigit():
-                    query_retry = query_retry.filter(AddressMaster.buld_mainsn == int(road_num))
-                    # Usually fuzzy search implies we might be loose, but number should be exact
-                    query_retry = query_retry.filter(AddressMaster.buld_subsn == 0)
-            
-            # Use LIKE '%road_name%' to catch '가산디지털1로' from '가산디지털로'
-            # But be careful not to match too widely.
-            query_retry = query_retry.filter(AddressMaster.road_nm.like(f"%{road_name}%"))
-            
-            if sido_hint:
-                query_retry = query_retry.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-            if sgg_hint:
-                query_retry = query_retry.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
-                
-            results = query_retry.limit(5).all()
-
-        # 2-2. Retry with Building Name Search (Last Resort)
-        if not results:
-             # If input was like "은마아파트" or "GS타워"
-             # Use ref_building_name from bracket if available
-             query_build = self.db.query(AddressMaster)
-             
-             # Prioritize ref_building_name from brackets
-             if ref_building_name:
-                 target_name = ref_building_name
-             elif road_name:
-                 target_name = road_name
-             else:
-                 target_name = raw_query.replace(" ", "")
-             
-             # Filter by Sido/Sgg if known
-             if sido_hint:
-                query_build = query_build.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-             if sgg_hint:
-                query_build = query_build.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
-             
-             # If we have road_num, also filter by it
-             if road_num:
-                 if isinstance(road_num, str) and '-' in road_num:
-                     main_s = road_num.split('-')[0]
-                     if main_s.isdigit():
-                         query_build = query_build.filter(AddressMaster.buld_mainsn == int(main_s))
-                 elif str(road_num).isdigit():
-                     query_build = query_build.filter(AddressMaster.buld_mainsn == int(road_num))
-                
-             query_build = query_build.filter(AddressMaster.buld_nm.like(f"%{target_name}%"))
-             results = query_build.limit(5).all()
-
-        if not results:
-             return self._like_search(raw_query)
-             
-        # 3. Handle Multiple Results
-        best = results[0]
+    MAX_CANDIDATES = 300  # rows fetched per query before scoring
+    WILDCARD_RE = re.compile(r'(\d+|일|이|삼|사|오|육|칠|팔|구|십)')
+
+    def search(self, query: str | ParsedAddress) -> NormalizationResult | None:
+        """
+        Search address in local DB.
+        One candidate fetch (selective road / lot number predicates OR-ed into a single SELECT,
+        broad address text / building name predicates region-first), then in-process scoring
+        instead of sequential fallback queries.
+        Accepts a raw string or an already parsed address (parse once, reuse everywhere).
+        """
+        parsed = query if isinstance(query, ParsedAddress) else parse_address(query)
+        if parsed.canonical != parsed.raw:
+            print(f"[DEBUG] Normalized: '{parsed.raw}' → '{parsed.canonical}'")
+        if parsed.alt_sgg:
+            print(f"[DEBUG] Special city detected: alt_sgg='{parsed.alt_sgg}'")
+
+        english = is_english_address(parsed.raw)
+        features, predicates, broad = self._english_query(parsed.raw) if english else self._candidate_query(parsed)
+        print(f"[DEBUG] LocalSearch Parse{' (English)' if english else ''}: Road={features.road_name}, Num={features.main}, "
+              f"Jibun={features.jibun_main}, Building={features.building_key}, "
+              f"Sido={features.sido}, Sgg={features.sgg_names or features.sgg_hint}")
+        if not predicates and not broad:
+            return None
+
+        rows = self._fetch_rows(predicates, broad, self._region_rank(features))
+        ranked = rank_candidates(features, rows)
+        if not ranked:
+            return None
+
+        best_score, best = ranked[0]
         final_res = self._to_result(best)
+        typed_roads = (features.road_name, (features.road_name or "").replace(" ", ""))
+        if english:
+            final_res.message = f"Matched via Local DB (English: {features.road_name} → {best.road_nm})"
+        elif features.road_name and best.road_nm in features.road_names and best.road_nm not in typed_roads:
+            final_res.message = f"Matched via Local DB (Road Spelling Fixed: {features.road_name} → {best.road_nm})"
         
         # Populate candidates if more than 1 result
-        if len(results) > 1:
-            cands = []
-            for r in results: # Include the best one too? Yes, usually.
-                cands.append({
-                    "road": r.road_nm,
-                    "main": r.buld_mainsn,
-                    "full": r.road_full_addr,
-                    "sido": r.si_nm,
-                    "sgg": r.sgg_nm,
-                    "id": r.id
-                })
-            final_res.candidates = cands
+        if len(ranked) > 1:
+            final_res.candidates = [{
+                "road": r.road_nm,
+                "main": r.buld_mainsn,
+                "full": road_address_of(r),
+                "sido": r.si_nm,
+                "sgg": r.sgg_nm,
+                "id": r.id,
+                "score": score
+            } for score, r in ranked[:5]]
             
         return final_res
 
-    def _like_search(self, raw: str):
-        # 1. Parse hints from raw text again just in case search logic bypassed parsing
-        emd_hint = None
-        
-        # Clean raw text properly FIRST
-        # Preserve hyphens for house numbers (e.g., 329-10)
-        clean_text = re.sub(r'[^\w\s\-]', ' ', raw).strip()
-        # Strip "번지" from tokens like "329-10번지"
-        clean_text = re.sub(r'(\d+(?:-\d+)?)\s*번지', r'\1', clean_text)
-        
-        while '  ' in clean_text: clean_text = clean_text.replace('  ', ' ')
-        tokens = clean_text.split()
-        
-        sido_hint, sgg_hint, emd_hint, ri_hint = self._parse_region_hints(tokens)
-
+    def _fetch_rows(self, predicates: list, broad: list = (), rank: list = ()) -> list:
+        """
+        Candidate rows, MAX_CANDIDATES per SELECT:
+        - predicates: selective keys (road + number, lot number, index ids), OR-ed into one SELECT
+        - broad: predicates that can match thousands of rows (building name, address text,
+          road without number), one SELECT each ordered by `rank` so the rows in the typed
+          region fill the limit first (other regions still come after them)
+        """
+        statements = [(or_(*predicates), ())] if predicates else []
+        statements += [(p, (*rank, AddressMaster.id)) for p in broad]
+        rows, seen = [], set()
+        for where, order_by in statements:
+            for row in self._select_rows(where, order_by):
+                if row.id not in seen:
+                    seen.add(row.id)
+                    rows.append(row)
+        return rows
+
+    def _select_rows(self, where, order_by=()) -> list:
+        """
+        Rows for one WHERE clause (pluggable backend, SEARCH_ROW_BACKEND):
+        - columnar: SQL returns ids only (index-only scans), rows come from the mmap column snapshot
+        - sql (or snapshot not ready): Core select of ROW_COLUMNS, rows come back as tuples
+        """
+        if settings.SEARCH_ROW_BACKEND == "columnar" and columnar_store.is_ready:
+            stmt = select(AddressMaster.id).where(where).order_by(*order_by).limit(self.MAX_CANDIDATES)
+            ids = self.db.execute(stmt).scalars().all()
+            rows = columnar_store.fetch(ids)
+            if rows is not None and len(rows) == len(ids):
+                return rows
+        return self.db.execute(select(*ROW_COLUMNS).where(where).order_by(*order_by).limit(self.MAX_CANDIDATES)).all()
+
+    def _region_rank(self, features: QueryFeatures) -> list:
+        """ORDER BY terms putting rows in the typed 시군구 / 시도 first (the scorer's region semantics)"""
+        conds = []
+        if features.sgg_names:
+            conds.append(AddressMaster.sgg_nm.in_(sorted(features.sgg_names)))
+        elif features.sgg_hint:
+            conds.append(AddressMaster.sgg_nm.like(f"%{features.sgg_hint}%"))
+        if features.sido:
+            conds.append(AddressMaster.si_nm.like(f"{features.sido}%"))
+        return [case((cond, 0), else_=1) for cond in conds]
+
+    def _split_road_num(self, road_num) -> tuple[int, int] | None:
+        """'25' -> (25, 0), '25-1' -> (25, 1), anything else -> None"""
+        if not road_num:
+            return None
+        if isinstance(road_num, str) and '-' in road_num:
+            main_s, sub_s = road_num.split('-')
+            if main_s.isdigit() and sub_s.isdigit():
+                return int(main_s), int(sub_s)
+            return None
+        if str(road_num).isdigit():
+            # If user typed "10", prefer "10-0".
+            return int(road_num), 0
+        return None
 
-        
-        is_jibun_likely = any(t.endswith("동") or t.endswith("리") or t.endswith("가") or t.endswith("읍") or t.endswith("면") for t in tokens)
+    def _place_names(self, hints: list[str], ri: bool = False) -> set[str]:
+        """Stored spellings of 동/리 hints (gazetteer-validated once it is loaded)"""
+        names = set()
+        for h in hints:
+            if gazetteer.is_ready:
+                names.update((gazetteer.ri_names(h) if ri else gazetteer.emd_names(h)) or ())
+            else:
+                names.update(name_variants(h))
+        return names
+
+    def _is_region_token(self, t: str, hints: RegionHints) -> bool:
+        if t in (hints.sido, hints.sgg, hints.ri) or is_sido_token(t):
+            return True
+        return gazetteer.is_ready and t in gazetteer.sgg_index
+
+    def _building_token(self, parsed: ParsedAddress) -> str | None:
+        """Longest leftover token that can be a building name ('두산위브', '우림라이온스밸리')"""
+        like_tokens = parsed.like_tokens
+        if len(like_tokens) == 1:
+            # Building-name-only input (even if it looks like a 리/동 name)
+            tokens = [t for t in like_tokens if not NUMBER_RE.match(t)]
+        else:
+            hints = parsed.like_hints
+            tokens = [
+                t for t in like_tokens
+                if not self._is_region_token(t, hints) and t != hints.emd and t != parsed.road_name
+                and not NUMBER_RE.match(t) and not DETAIL_TOKEN_RE.match(t)
+                and not t.endswith(('로', '길'))
+            ]
+        if not tokens:
+            return None
+        token = max(tokens, key=len)
+        return token if len(token) > 2 else None
 
-        # 2. Extract core tokens (up to the first number token)
-        # This helps ignore "tail" info like "101ho", "building name" etc.
+    def _text_pattern(self, parsed: ParsedAddress) -> tuple[str, str | None]:
+        """
+        Free-text part of the input as a LIKE-style pattern plus the first number
+        ('제주시 일두이동 486' -> ('일두%동', '486')). Region names are skipped at any position.
+        """
+        hints = parsed.like_hints
         core_tokens = []
-        for t in tokens:
-            # Skip ANY regional hints at any position to handle redundant inputs
-            if t == sido_hint or t == sgg_hint or t == ri_hint:
+        for t in parsed.like_tokens:
+            if self._is_region_token(t, hints):
                 continue
-            # Also check against SIDO_MAP aliases for safety
-            if t in self.SIDO_MAP or t in self.SIDO_MAP.values():
-                continue
-                
-            # If token is a number (e.g. 329-10)
-            if re.match(r'^\d+(?:-\d+)?$', t):
-                core_tokens.append(t)
-                break
-            
-            # To handle "일도2동" vs "일도이동", replace digits with %
-            # This makes "일도2동" -> "일도%동" or "일도이동" -> "일도%동"
-            clean_t = re.sub(r'(\d+|일|이|삼|사|오|육|칠|팔|구|십)', '%', t)
-            core_tokens.append(clean_t)
-        
-        if not core_tokens:
-            return None
-            
-        core_query_part = "%".join(core_tokens)
-        
-        # 3. Tiered Search
-        def try_search(use_sido=True, use_sgg=True, use_ri=True):
-            q = self.db.query(AddressMaster)
-            if use_sido and sido_hint:
-                q = q.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-            if use_sgg and sgg_hint:
-                q = q.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
-            
-            text_tokens = core_tokens[:-1]
-            if use_ri and ri_hint and ri_hint not in text_tokens:
-                # Normalize 'Ri' variations (1리, 일리 -> %리)
-                norm_ri = re.sub(r'(\d+|일|이|삼|사|오|육|칠|팔|구|십)리', '%리', ri_hint)
-                text_tokens.append(norm_ri)
-            
-            # If EMD hint is available and not in text_tokens, add it to broaden search
-            if emd_hint and emd_hint not in text_tokens:
-                 text_tokens.insert(0, emd_hint)
-            
-            text_part = "%".join(text_tokens)
-            num_part = core_tokens[-1] if core_tokens else ""
-            
-            if not num_part and not text_part: return None
-
-            if is_jibun_likely:
-                # 1. Strict number match (preceded by space AND ends with the number)
-                res = q.filter(AddressMaster.jibun_full_addr.like(f"%{text_part}% {num_part}")).first()
-                if not res:
-                    # 2. Fallback to loose match
-                    res = q.filter(AddressMaster.jibun_full_addr.like(f"%{text_part}% {num_part}%")).first()
-                if not res:
-                    res = q.filter(AddressMaster.road_full_addr.like(f"%{text_part}%{num_part}%")).first()
-            else:
-                # Road search preferred
-                res = q.filter(AddressMaster.road_full_addr.like(f"%{text_part}% {num_part}")).first()
-                if not res:
-                    res = q.filter(AddressMaster.road_full_addr.like(f"%{text_part}%{num_part}%")).first()
-                if not res:
-                    res = q.filter(AddressMaster.jibun_full_addr.like(f"%{text_part}%{num_part}%")).first()
-            return res
-
-        # Tiered Strategy:
-        # Full (Sido+Sgg+Ri) -> (Sido+Sgg) -> (Sgg only) -> (Global)
-        match = try_search(True, True, True)
-        if not match and ri_hint:
-            match = try_search(True, True, False) # Skip Ri (in case DB missing it)
-        if not match:
-            match = try_search(False, True, False) # Relax Sido
-        if not match:
-            match = try_search(False, False, False) # Global
-
-        if match:
-            return self._to_result(match)
-
-        # 3. Building Name Search (Smart Fallback)
-        # Filter tokens that are likely details (X동, X호, X단지 if preceded by number)
-        detail_patterns = [r'\d+동$', r'\d+호$', r'\d+층$', r'\d+단지$']
-        build_tokens = []
-        for t in tokens:
-            if t in [sido_hint, sgg_hint, emd_hint]: continue
-            if any(re.match(p, t) for p in detail_patterns): continue
-            # If it's the house number already used in try_search, skip it? 
-            # Actually build_tokens should be pure building names.
-            if re.match(r'^\d+(?:-\d+)?$', t): continue
-            build_tokens.append(t)
-        
-        if build_tokens:
-            def try_build_step(tokens_to_use):
-                query_str = "%".join(tokens_to_use)
-                print(f"[DEBUG] Building Search: query={query_str}, hints=({sido_hint}, {sgg_hint}, {emd_hint})")
-                
-                def run_q(use_sido=True, use_sgg=True, use_emd=True):
-                    from sqlalchemy import func
-                    q = self.db.query(AddressMaster)
-                    if use_sido and sido_hint: q = q.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-                    if use_sgg and sgg_hint: q = q.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
-                    if use_emd and emd_hint: q = q.filter(AddressMaster.emd_nm.like(f"%{emd_hint}%"))
-                    
-                    # Space-insensitive matching
-                    stripped = query_str.replace("%", "").replace(" ", "")
-                    if stripped:
-                        q = q.filter(func.replace(AddressMaster.buld_nm, ' ', '').like(f"%{stripped}%"))
-                        return q.first()
-                    return None
-
-                # Tiered region matching for building
-                m = run_q(True, True, True)
-                if not m: m = run_q(True, True, False)
-                if not m: m = run_q(False, True, False)
-                if not m: m = run_q(False, False, False)
-                return m
-
-            # Attempt 1: Full building name tokens
-            match = try_build_step(build_tokens)
-            if match: return self._to_result(match)
-            
-            # Attempt 2: If many tokens, try just the first 2 (often the main apartment name)
-            if len(build_tokens) > 2:
-                print(f"[DEBUG] Falling back to first 2 building tokens: {build_tokens[:2]}")
-                match = try_build_step(build_tokens[:2])
-                if match: return self._to_result(match)
-            
-            # Attempt 4: Search Only Building Name (Broadest)
-            # Only do this if we have a reasonably specific building name (length check?)
-            if len(build_name_query) > 2:
-                 print(f"[DEBUG] Relaxing ALL region filters...")
-                 match = try_build_search(False, False, False)
-                 if match: return self._to_result(match)
+            if NUMBER_RE.match(t):
+                return "%".join(core_tokens), t
+            # "일도2동" vs "일도이동" -> "일도%동"
+            core_tokens.append(self.WILDCARD_RE.sub('%', t))
+        return "%".join(core_tokens), None
 
-        return None
+    def _candidate_query(self, parsed: ParsedAddress) -> tuple[QueryFeatures, list, list]:
+        """
+        Everything the input says about the address, and the predicates that fetch every row
+        one of the old fallback tiers could have returned: selective ones and broad ones
+        (see _fetch_rows).
+        Region hints only order the broad fetches and score (never a hard filter).
+        """
+        hints = parsed.hints
+        region = gazetteer.resolve(hints)
+        predicates, broad = [], []
+
+        # 동/리 names (input + bracket reference)
+        emd_hints = [h for h in (hints.emd,) if h]
+        ri_hints = [h for h in (hints.ri,) if h]
+        if parsed.bracket_region:
+            (ri_hints if parsed.bracket_region.endswith('리') else emd_hints).append(parsed.bracket_region)
+        emd_names = self._place_names(emd_hints)
+        ri_names = self._place_names(ri_hints, ri=True)
+
+        # Numbers: building number after a road name, lot number after a 동/리
+        road_name = parsed.road_name
+        nums = self._split_road_num(parsed.road_num)
+        main = sub = jibun_main = jibun_sub = None
+        if nums and (road_name or not (emd_names or ri_names)):
+            main, sub = nums
+        if nums and not road_name:
+            jibun_main, jibun_sub = nums
+        if parsed.bracket_jibun:
+            jb_nums = self._split_road_num(parsed.bracket_jibun[1])
+            if jb_nums:
+                jibun_main, jibun_sub = jb_nums
+
+        # 1. Road name + building number (resident exact index, SQL while it loads)
+        road_names = set()
+        if road_name:
+            road_names = {road_name, road_name.replace(" ", "")}
+            if exact_index.is_ready and road_speller.is_ready and not any(map(exact_index.has_road, road_names)):
+                # Unknown road: nearest existing spellings by jamo edit distance ('기산디지털1로' -> '가산디지털1로')
+                fixes = road_speller.suggest(
+                    road_name,
+                    region.sido if region.resolved else None,
+                    frozenset(region.sgg_names) if region.resolved and region.sgg_names else None
+                )
+                if fixes:
+                    print(f"[DEBUG] Road spelling: '{road_name}' → {fixes}")
+                    road_names.update(fixes)
+            if main is None:
+                broad.append(AddressMaster.road_nm.in_(road_names))
+            else:
+                ids = exact_index.lookup(sorted(road_names), main, None, limit=self.MAX_CANDIDATES) \
+                    if exact_index.is_ready else None
+                if ids is None:
+                    predicates.append(and_(AddressMaster.road_nm.in_(road_names), AddressMaster.buld_mainsn == main))
+                elif ids:
+                    predicates.append(AddressMaster.id.in_(ids))
+
+                # Partial road name (AI dropped a number: 가산디지털로 -> 가산디지털1로)
+                keys = ngram_index.candidates("road", road_name) if ngram_index.is_ready else None
+                if keys is None:
+                    predicates.append(and_(AddressMaster.road_nm.like(f"%{road_name}%"), AddressMaster.buld_mainsn == main))
+                else:
+                    keys = [k for k in keys if k not in road_names]
+                    if keys:
+                        predicates.append(and_(AddressMaster.road_nm.in_(keys), AddressMaster.buld_mainsn == main))
+
+        # 2. 동/리 + lot number (equality on ix_addr_jibun)
+        if jibun_main is not None and (emd_names or ri_names):
+            conds = [AddressMaster.jibun_main == jibun_main]
+            if emd_names:
+                conds.append(AddressMaster.emd_nm.in_(sorted(emd_names)))
+            if ri_names:
+                conds.append(AddressMaster.ri_nm.in_(sorted(ri_names)))
+            if gazetteer.is_ready:
+                # Every sgg that has such a 동/리 - keeps the index prefix usable without a region hint
+                place_index = gazetteer.emd_index if emd_names else gazetteer.ri_index
+                sggs = set().union(*(place_index.get(n, ()) for n in (emd_names or ri_names)))
+                conds.append(AddressMaster.sgg_nm.in_(sorted(sggs)))
+            predicates.append(and_(*conds))
+
+        # 3. Free address text + number (e.g. '테헤란 152') through the n-gram stems
+        text_roads, text_emds = set(), set()
+        text_main = None
+        text_part, text_num = self._text_pattern(parsed)
+        text_nums = self._split_road_num(text_num)
+        if text_part.strip('%') and text_nums:
+            text_main = text_nums[0]
+            if ngram_index.is_ready:
+                for kind, found in (("road", text_roads), ("jibun", text_emds)):
+                    keys = ngram_index.candidates(kind, text_part, region.sido, region.sgg)
+                    if keys == [] and (region.sido or region.sgg):
+                        keys = ngram_index.candidates(kind, text_part)
+                    found.update(keys or ())
+            else:
+                # Index still loading: stem names from LIKE scans (full strings are not stored)
+                road_stem = AddressMaster.si_nm + " " + AddressMaster.sgg_nm + " " + AddressMaster.road_nm
+                jibun_stem = AddressMaster.si_nm + " " + AddressMaster.sgg_nm + " " + AddressMaster.emd_nm
+                text_roads.update(self.db.execute(
+                    select(AddressMaster.road_nm).distinct()
+                    .where(road_stem.like(f"%{text_part}%"), AddressMaster.buld_mainsn == text_main)
+                ).scalars())
+                text_emds.update(self.db.execute(
+                    select(AddressMaster.emd_nm).distinct()
+                    .where(jibun_stem.like(f"%{text_part}%"), AddressMaster.jibun_main == text_main)
+                ).scalars())
+            if text_roads:
+                broad.append(and_(AddressMaster.road_nm.in_(sorted(text_roads)), AddressMaster.buld_mainsn == text_main))
+            if text_emds:
+                broad.append(and_(AddressMaster.emd_nm.in_(sorted(text_emds)), AddressMaster.jibun_main == text_main))
+            if main is None and not road_name and not (emd_names or ri_names):
+                main, sub = text_nums
+
+        # 4. Building name (bracket reference first)
+        building = parsed.ref_building_name or self._building_token(parsed)
+        building_key = normalize_building_key(building) if building else None
+        if building_key and len(building_key) >= 2:
+            cond = building_name_filter(building)
+            numbers = [AddressMaster.buld_mainsn == main] if main is not None else []
+            if jibun_main is not None:
+                numbers.append(AddressMaster.jibun_main == jibun_main)
+            broad.append(and_(cond, or_(*numbers)) if numbers else cond)
+
+        features = QueryFeatures(
+            road_names=frozenset(road_names),
+            road_name=road_name,
+            main=main,
+            sub=sub,
+            jibun_main=jibun_main,
+            jibun_sub=jibun_sub,
+            emd_names=frozenset(emd_names),
+            ri_names=frozenset(ri_names),
+            sido=region.sido,
+            sgg_names=frozenset(region.sgg_names or ()),
+            sgg_hint=region.sgg,
+            text_roads=frozenset(text_roads),
+            text_emds=frozenset(text_emds),
+            text_main=text_main,
+            building_key=building_key,
+        )
+        return features, predicates, broad
 
-    def _search_by_building_name(self, building_name: str) -> NormalizationResult | None:
+    def _english_query(self, raw: str) -> tuple[QueryFeatures, list, list]:
         """
-        Search by building name only (used when only bracket content is available)
+        English input: English road name -> Korean road_nm values (english_index), then the same
+        (road_nm, buld_mainsn) lookup as the Korean road path. Region names only score.
         """
-        query = self.db.query(AddressMaster)
-        query = query.filter(AddressMaster.buld_nm.like(f"%{building_name}%"))
-        result = query.first()
-        if result:
-            return self._to_result(result)
-        return None
+        eng = english_index.parse(self.db, raw)
+        predicates, broad = [], []
+        if eng.road_names:
+            if eng.main is None:
+                broad.append(AddressMaster.road_nm.in_(eng.road_names))
+            else:
+                ids = exact_index.lookup(list(eng.road_names), eng.main, None, limit=self.MAX_CANDIDATES) \
+                    if exact_index.is_ready else None
+                if ids is None:
+                    predicates.append(and_(AddressMaster.road_nm.in_(eng.road_names), AddressMaster.buld_mainsn == eng.main))
+                elif ids:
+                    predicates.append(AddressMaster.id.in_(ids))
+
+        features = QueryFeatures(
+            road_names=frozenset(eng.road_names),
+            road_name=eng.road_eng,
+            main=eng.main,
+            sub=eng.sub,
+            sido=eng.sido,
+            sgg_names=frozenset(eng.sgg_names),
+        )
+        return features, predicates, broad
 
-    def _to_result(self, obj: AddressMaster) -> NormalizationResult:
+    def _to_result(self, obj) -> NormalizationResult:
+        """NormalizationResult from an address row (Core row tuple, columnar row or ORM object)"""
         road_str = f"{obj.si_nm} {obj.sgg_nm} {obj.road_nm} {obj.buld_mainsn}"
         if obj.buld_subsn > 0:
             road_str += f"-{obj.buld_subsn}"
@@ -663,16 +427,20 @@ class LocalSearchService:
         # If jibul_full_addr contains more detail than emd_nm (like Ri)
         # Try to find Ri in jibun_full_addr
         bracket_info = obj.emd_nm
-        # Look for the part after emd_nm that ends with '리'
-        ri_match = re.search(f"{obj.emd_nm}\\s+([가-힣]+리)", obj.jibun_full_addr)
-        if ri_match:
-            bracket_info = f"{obj.emd_nm} {ri_match.group(1)}"
+        if obj.ri_nm:
+            bracket_info = f"{obj.emd_nm} {obj.ri_nm}"
+        else:
+            # Rows without structured jibun columns: find Ri in the jibun address
+            # Look for the part after emd_nm that ends with '리'
+            ri_match = re.search(f"{obj.emd_nm}\\s+([가-힣]+리)", jibun_address_of(obj))
+            if ri_match:
+                bracket_info = f"{obj.emd_nm} {ri_match.group(1)}"
 
         return NormalizationResult(
             success=True,
             refined_address=f"{road_str} ({bracket_info})",
             road_address=road_str,
-            jibun_address=obj.jibun_full_addr, # FIXED: jibun_addr -> jibun_full_addr
+            jibun_address=jibun_address_of(obj),
             zip_code=obj.zip_no,
             si_nm=obj.si_nm,
             sgg_nm=obj.sgg_nm,
@@ -688,18 +456,8 @@ class LocalSearchService:
         Search for address candidates matching the query.
         Prioritizes: Road+Number > Building Name > Full text search
         """
-        # Apply space insertion for concatenated input
-        query = self._insert_spaces(query)
-        
-        # Apply Hancha number normalization
-        query = self._normalize_hancha_numbers(query)
-        
-        # Clean query
-        clean_query = re.sub(r'[^\w\s\-]', ' ', query).strip()
-        while '  ' in clean_query:
-            clean_query = clean_query.replace('  ', ' ')
-        
-        tokens = clean_query.split()
+        parsed = parse_address(query)
+        tokens = parsed.like_tokens
         if not tokens:
             return []
         
@@ -711,7 +469,8 @@ class LocalSearchService:
         detail_dong = None  # 201동 같은 상세주소
         building_name_hint = None
         
-        sido_hint, sgg_hint = self._parse_region_hints(tokens)
+        sido_hint, sgg_hint = parsed.like_hints.sido, parsed.like_hints.sgg
+        region = gazetteer.resolve(parsed.like_hints)
         
         for i, t in enumerate(tokens):
             # Road name detection (ends with 로/길/대로)
@@ -745,28 +504,18 @@ class LocalSearchService:
         
         # Strategy 1: Road Name + Number search (most precise)
         if road_name and road_num:
-            q = self.db.query(AddressMaster)
+            q = select(*ROW_COLUMNS)
             q = q.filter(AddressMaster.road_nm == road_name)
             q = q.filter(AddressMaster.buld_mainsn == road_num)
             
-            if sido_hint:
-                q = q.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-            if sgg_hint:
-                alt_sgg = self.SPECIAL_CITY_MAP.get(sgg_hint)
-                if alt_sgg:
-                    q = q.filter(or_(
-                        AddressMaster.sgg_nm.like(f"%{sgg_hint}%"),
-                        AddressMaster.sgg_nm.like(f"%{alt_sgg}%")
-                    ))
-                else:
-                    q = q.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
+            q = self._region_filter(q, region)
             
-            results = q.limit(limit * 5).all()
+            results = self.db.execute(q.limit(limit * 5)).all()
             
             # Deduplicate
             seen = set()
             for r in results:
-                key = f"{r.road_full_addr}|{r.buld_nm}"
+                key = f"{road_address_of(r)}|{r.buld_nm}"
                 if key not in seen:
                     seen.add(key)
                     candidates.append(self._to_candidate(r))
@@ -775,26 +524,16 @@ class LocalSearchService:
         
         # Strategy 2: Road Name only (if no number or Strategy 1 failed)
         if not candidates and road_name:
-            q = self.db.query(AddressMaster)
+            q = select(*ROW_COLUMNS)
             q = q.filter(AddressMaster.road_nm.like(f"%{road_name}%"))
             
-            if sido_hint:
-                q = q.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-            if sgg_hint:
-                alt_sgg = self.SPECIAL_CITY_MAP.get(sgg_hint)
-                if alt_sgg:
-                    q = q.filter(or_(
-                        AddressMaster.sgg_nm.like(f"%{sgg_hint}%"),
-                        AddressMaster.sgg_nm.like(f"%{alt_sgg}%")
-                    ))
-                else:
-                    q = q.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
+            q = self._region_filter(q, region)
             
-            results = q.limit(limit * 5).all()
+            results = self.db.execute(q.limit(limit * 5)).all()
             
             seen = set()
             for r in results:
-                key = f"{r.road_full_addr}"
+                key = road_address_of(r)
                 if key not in seen:
                     seen.add(key)
                     candidates.append(self._to_candidate(r))
@@ -803,22 +542,12 @@ class LocalSearchService:
         
         # Strategy 3: Building name search
         if not candidates and building_name_hint:
-            q = self.db.query(AddressMaster)
-            q = q.filter(AddressMaster.buld_nm.like(f"%{building_name_hint}%"))
+            q = select(*ROW_COLUMNS)
+            q = q.filter(building_name_filter(building_name_hint))
             
-            if sido_hint:
-                q = q.filter(AddressMaster.si_nm.like(f"{sido_hint}%"))
-            if sgg_hint:
-                alt_sgg = self.SPECIAL_CITY_MAP.get(sgg_hint)
-                if alt_sgg:
-                    q = q.filter(or_(
-                        AddressMaster.sgg_nm.like(f"%{sgg_hint}%"),
-                        AddressMaster.sgg_nm.like(f"%{alt_sgg}%")
-                    ))
-                else:
-                    q = q.filter(AddressMaster.sgg_nm.like(f"%{sgg_hint}%"))
+            q = self._region_filter(q, region)
             
-            results = q.limit(limit * 5).all()
+            results = self.db.execute(q.limit(limit * 5)).all()
             
             seen = set()
             for r in results:
@@ -840,10 +569,10 @@ class LocalSearchService:
             if search_tokens:
                 main_token = max(search_tokens, key=len)
                 
-                q = self.db.query(AddressMaster)
-                q = q.filter(AddressMaster.buld_nm.like(f"%{main_token}%"))
+                q = select(*ROW_COLUMNS)
+                q = q.filter(building_name_filter(main_token))
                 
-                results = q.limit(limit * 5).all()
+                results = self.db.execute(q.limit(limit * 5)).all()
                 
                 seen = set()
                 for r in results:
@@ -857,12 +586,12 @@ class LocalSearchService:
         print(f"[DEBUG] search_candidates: found {len(candidates)} candidates")
         return candidates
 
-    def _to_candidate(self, r: AddressMaster) -> dict:
-        """Convert AddressMaster to candidate dict"""
+    def _to_candidate(self, r) -> dict:
+        """Convert an address row (Core row tuple) to candidate dict"""
         return {
             "id": r.id,
-            "road_address": r.road_full_addr,
-            "jibun_address": r.jibun_full_addr,
+            "road_address": road_address_of(r),
+            "jibun_address": jibun_address_of(r),
             "building_name": r.buld_nm or "",
             "zip_code": r.zip_no,
             "si_nm": r.si_nm,
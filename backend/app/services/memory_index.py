@@ -0,0 +1,183 @@
+"""
+In-Memory Search Indexes (메모리 상주 검색 인덱스)
+- Common plumbing for indexes built from AddressMaster at startup.
+- Each index is persisted as a snapshot file and reloaded on the next startup
+  as long as the master table has not changed since the snapshot was taken.
+"""
+import os
+import pickle
+import threading
+import time
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.local_address import AddressMaster
+
+
+def data_signature(db: Session) -> tuple[int, int]:
+    """(row count, max id) of address_master - changes whenever the master table is reloaded"""
+    count, max_id = db.query(func.count(AddressMaster.id), func.max(AddressMaster.id)).one()
+    return int(count or 0), int(max_id or 0)
+
+
+class MemoryIndex:
+    """
+    Base class for resident indexes.
+    Subclasses implement _build / _reset, plus either _dump / _restore (state pickled by the
+    default _save_snapshot / _load_snapshot) or their own _save_snapshot / _load_snapshot
+    for a different file format (see ColumnarStore).
+    """
+    name = "memory_index"
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.is_ready = False
+        self.signature = None
+        self.built_at = None
+
+    # --- Subclass hooks ---
+    def _build(self, db: Session) -> None:
+        raise NotImplementedError
+
+    def _dump(self) -> dict:
+        """State for the default pickled snapshot"""
+        raise NotImplementedError
+
+    def _restore(self, state: dict) -> None:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    # --- Lifecycle ---
+    def snapshot_path(self) -> str | None:
+        if not settings.INDEX_SNAPSHOT_DIR:
+            return None
+        return os.path.join(settings.INDEX_SNAPSHOT_DIR, f"{self.name}.pkl")
+
+    def load_or_build(self, db: Session, signature: tuple[int, int] | None = None, build: bool = True) -> None:
+        """
+        Load the snapshot if it matches the current data, otherwise rebuild from the DB.
+        build=False only loads (bulk workers: the parent process writes the snapshots);
+        an index without a snapshot directory is still built.
+        """
+        signature = signature or data_signature(db)
+        with self.lock:
+            if self.is_ready and self.signature == signature:
+                return
+            start = time.time()
+            if self._load_snapshot(signature):
+                print(f"[INDEX] {self.name}: loaded snapshot in {time.time() - start:.1f}s")
+            elif not build and self.snapshot_path():
+                print(f"[INDEX] {self.name}: no current snapshot, using SQL fallbacks")
+                return
+            else:
+                self._reset()
+                self._build(db)
+                self._save_snapshot(signature)
+                print(f"[INDEX] {self.name}: built from DB in {time.time() - start:.1f}s")
+            self.signature = signature
+            self.built_at = time.time()
+            self.is_ready = True
+
+    def invalidate(self) -> None:
+        """Drop in-memory state and the snapshot (called after the master table is reloaded)"""
+        with self.lock:
+            self.is_ready = False
+            self.signature = None
+            self._reset()
+            path = self.snapshot_path()
+            if path and os.path.exists(path):
+                os.remove(path)
+
+    def _load_snapshot(self, signature: tuple[int, int]) -> bool:
+        path = self.snapshot_path()
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("version") != self.SNAPSHOT_VERSION or tuple(payload.get("signature", ())) != signature:
+                print(f"[INDEX] {self.name}: snapshot is stale, rebuilding")
+                return False
+            self._restore(payload["state"])
+            return True
+        except Exception as e:
+            print(f"[WARN] {self.name}: failed to load snapshot: {e}")
+            self._reset()
+            return False
+
+    def _save_snapshot(self, signature: tuple[int, int]) -> None:
+        path = self.snapshot_path()
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"  # per process: bulk workers may save concurrently
+            with open(tmp_path, "wb") as f:
+                pickle.dump({
+                    "version": self.SNAPSHOT_VERSION,
+                    "signature": signature,
+                    "state": self._dump()
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] {self.name}: failed to save snapshot: {e}")
+
+
+# Registered index singletons (warmed up together at startup)
+_registry: list[MemoryIndex] = []
+
+
+def register_index(index: MemoryIndex) -> MemoryIndex:
+    _registry.append(index)
+    return index
+
+
+_warm_up_lock = threading.Lock()
+
+
+def warm_up_indexes(build: bool = True) -> None:
+    """Build or load every registered index (indexes already current are skipped)"""
+    if not settings.MEMORY_INDEX_ENABLED:
+        print("[INDEX] Memory indexes disabled (MEMORY_INDEX_ENABLED=False)")
+        return
+    from app.db.session import SessionLocal
+    # One warm-up at a time (the startup warm-up and a post-import rebuild may overlap)
+    with _warm_up_lock:
+        db = SessionLocal()
+        try:
+            signature = data_signature(db)
+            for index in _registry:
+                try:
+                    index.load_or_build(db, signature, build=build)
+                except Exception as e:
+                    print(f"[ERROR] {index.name}: index build failed: {e}")
+        finally:
+            db.close()
+
+
+# Callbacks for other derived state (e.g. result caches) that must not outlive a reload
+_invalidation_hooks: list = []
+
+
+def register_invalidation_hook(hook) -> None:
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_indexes(rebuild: bool = True) -> threading.Thread | None:
+    """
+    Called after the master table is reloaded.
+    Searches use the SQL fallbacks until the background rebuild has finished.
+    """
+    for index in _registry:
+        index.invalidate()
+    for hook in _invalidation_hooks:
+        hook()
+    if not (rebuild and settings.MEMORY_INDEX_ENABLED):
+        return None
+    print("[INDEX] Rebuilding memory indexes in the background...")
+    thread = threading.Thread(target=warm_up_indexes, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,133 @@
+"""
+N-gram Inverted Index (전체주소 바이그램 역색인)
+- Replaces leading-wildcard LIKE scans in LocalSearchService._candidate_query / _fetch_rows.
+- Indexes the distinct address "stems" (full address minus the building / lot number):
+    road : "서울특별시 강남구 테헤란로"      -> road_nm
+    jibun: "제주특별자치도 서귀포시 안덕면 구억리" -> emd_nm
+  ~0.5M stems instead of ~6.4M rows keeps the posting lists small.
+- A LIKE pattern ('%일도%동%') is split into fragments, candidate stems are found by
+  intersecting the character-bigram posting lists, and only the road_nm / emd_nm values
+  of verified stems are handed to SQL as an indexed IN filter.
+"""
+import re
+import sys
+from array import array
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.memory_index import MemoryIndex, register_index
+from app.utils.address_format import format_jibun_address
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class _StemTable:
+    """Stems of one kind plus their bigram postings"""
+
+    def __init__(self):
+        self.texts: list[str] = []      # stems without spaces, the form the bigrams and fragments use
+        self.keys: list[str] = []       # road_nm or emd_nm used for the SQL IN filter
+        self.sido: list[str] = []
+        self.sgg: list[str] = []
+        self.postings: dict[str, array] = {}
+
+    def add(self, text: str, key: str, sido: str, sgg: str):
+        stem_id = len(self.texts)
+        text = text.replace(" ", "")
+        self.texts.append(text)
+        self.keys.append(sys.intern(key))
+        self.sido.append(sys.intern(sido))
+        self.sgg.append(sys.intern(sgg))
+        for gram in _bigrams(text):
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('i')
+            posting.append(stem_id)
+
+
+class NgramIndex(MemoryIndex):
+    name = "ngram"
+    MAX_CANDIDATES = 1000
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        self.tables = {"road": _StemTable(), "jibun": _StemTable()}
+
+    def _build(self, db: Session):
+        road = self.tables["road"]
+        rows = db.query(AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.road_nm).distinct()
+        for si, sgg, road_nm in rows:
+            if road_nm:
+                road.add(f"{si} {sgg} {road_nm}", road_nm, si or "", sgg or "")
+
+        # Jibun stems from the components (full jibun strings are not stored in the compact layout)
+        jibun = self.tables["jibun"]
+        seen = set()
+        rows = db.query(
+            AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.emd_nm, AddressMaster.ri_nm
+        ).distinct()
+        for si, sgg, emd, ri in rows:
+            if not emd:
+                continue
+            stem = format_jibun_address(si, sgg, emd, ri)
+            if stem in seen:
+                continue
+            seen.add(stem)
+            jibun.add(stem, emd, si or "", sgg or "")
+
+    def _dump(self) -> dict:
+        return {"tables": self.tables}
+
+    def _restore(self, state: dict):
+        self.tables = state["tables"]
+
+    def candidates(self, kind: str, text_part: str, sido_hint: str | None = None,
+                   sgg_hint: str | None = None) -> list[str] | None:
+        """
+        Distinct road_nm (kind='road') / emd_nm (kind='jibun') values whose stem matches
+        the LIKE-style text pattern (fragments joined by '%', in order).
+        Returns None when the pattern is not selective enough to use the index
+        (no fragment of 2+ chars, or too many candidates) - the caller then scans as before.
+        """
+        table = self.tables[kind]
+        fragments = [f for f in text_part.replace(" ", "").split("%") if f]
+        grams = set()
+        for f in fragments:
+            grams |= _bigrams(f)
+        if not grams:
+            return None
+
+        # Posting-list intersection, smallest list first
+        postings = []
+        for gram in grams:
+            posting = table.postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        stem_ids = set(postings[0])
+        for posting in postings[1:]:
+            stem_ids.intersection_update(posting)
+            if not stem_ids:
+                return []
+
+        # Verify fragment order on the candidates (LIKE '%a%b%' semantics)
+        verify = re.compile(".*".join(re.escape(f) for f in fragments))
+        keys = set()
+        for stem_id in stem_ids:
+            if sido_hint and not table.sido[stem_id].startswith(sido_hint):
+                continue
+            if sgg_hint and sgg_hint not in table.sgg[stem_id]:
+                continue
+            if verify.search(table.texts[stem_id]):
+                keys.add(table.keys[stem_id])
+                if len(keys) > self.MAX_CANDIDATES:
+                    return None
+        return sorted(keys)
+
+
+ngram_index = register_index(NgramIndex())
@@ -0,0 +1,85 @@
+"""
+Result Cache (정규화 결과 캐시)
+- Bounded in-process LRU cache with per-entry TTL and hit/miss counters.
+- result_cache holds successful NormalizationResults keyed by the canonical query
+  (after space insertion / 특례시 / 한자어 숫자 normalization), so "부산광역시남구수영로305"
+  and "부산광역시 남구 수영로 305" share one entry.
+- negative_cache remembers inputs that still failed after AI correction, keyed by
+  (LLM model, canonical query), so repeated garbage skips the LLM round-trip.
+- Both are cleared whenever the master table is reloaded (see memory_index.invalidate_indexes).
+"""
+import threading
+import time
+from collections import OrderedDict
+from app.core.config import settings
+from app.services.memory_index import register_invalidation_hook
+
+
+class TTLCache:
+    def __init__(self, name: str, max_size: int, ttl: float):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self.lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        if not self.enabled:
+            return
+        with self.lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+result_cache = TTLCache("result", settings.RESULT_CACHE_SIZE, settings.RESULT_CACHE_TTL)
+negative_cache = TTLCache("negative", settings.NEGATIVE_CACHE_SIZE, settings.NEGATIVE_CACHE_TTL)
+register_invalidation_hook(result_cache.clear)
+register_invalidation_hook(negative_cache.clear)
@@ -0,0 +1,76 @@
+"""
+Reverse Lookup (관리번호/우편번호 → 정제 주소 역조회)
+- Re-resolves stored keys without re-normalizing text: thousands of mgmt_no (bd_mgt_sn)
+  or zip_no values per request.
+- Chunked `IN` queries on the unique mgmt_no index / ix_address_master_zip_no, and
+  generators all the way down, so the endpoints can stream the records while memory
+  stays flat regardless of the batch size.
+"""
+from typing import Iterator
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.local_search import LocalSearchService, ROW_COLUMNS
+
+MGMT_NO_CHUNK = 500  # keys per IN (one row each)
+ZIP_CHUNK = 50       # a zip code covers up to a few hundred buildings
+
+
+def _record(service: LocalSearchService, key: str, row) -> dict:
+    result = service._to_result(row)
+    return {
+        "key": key,
+        "found": True,
+        "bd_mgt_sn": result.bd_mgt_sn,
+        "refined_address": result.refined_address,
+        "road_address": result.road_address,
+        "jibun_address": result.jibun_address,
+        "zip_code": result.zip_code,
+        "si_nm": result.si_nm,
+        "sgg_nm": result.sgg_nm,
+        "emd_nm": result.emd_nm,
+        "buld_nm": result.buld_nm,
+    }
+
+
+def _chunks(keys: list[str], size: int) -> Iterator[list[str]]:
+    for i in range(0, len(keys), size):
+        yield keys[i:i + size]
+
+
+def lookup_mgmt_nos(db: Session, keys: list[str]) -> Iterator[dict]:
+    """One record per key, in input order ({"key", "found": False} for unknown keys)"""
+    service = LocalSearchService(db)
+    for chunk in _chunks([k.strip() for k in keys], MGMT_NO_CHUNK):
+        wanted = sorted({k for k in chunk if k})
+        rows = {}
+        if wanted:
+            stmt = select(*ROW_COLUMNS).where(AddressMaster.mgmt_no.in_(wanted))
+            rows = {row.mgmt_no: row for row in db.execute(stmt)}
+        for key in chunk:
+            row = rows.get(key)
+            yield _record(service, key, row) if row is not None else {"key": key, "found": False}
+
+
+def lookup_zip_nos(db: Session, keys: list[str]) -> Iterator[dict]:
+    """Every building of each zip code (grouped by key, input order, duplicates once)"""
+    service = LocalSearchService(db)
+    unique = list(dict.fromkeys(k.strip() for k in keys))
+
+    for chunk in _chunks(unique, ZIP_CHUNK):
+        # Buffered per chunk of zip codes so the output follows the input key order
+        buffered: dict[str, list] = {}
+        wanted = [k for k in chunk if k]
+        if wanted:
+            stmt = (select(*ROW_COLUMNS)
+                    .where(AddressMaster.zip_no.in_(wanted))
+                    .order_by(AddressMaster.zip_no, AddressMaster.id))
+            for row in db.execute(stmt):
+                buffered.setdefault(row.zip_no, []).append(row)
+        for key in chunk:
+            rows = buffered.pop(key, None)
+            if not rows:
+                yield {"key": key, "found": False}
+                continue
+            for row in rows:
+                yield _record(service, key, row)
@@ -0,0 +1,170 @@
+"""
+Road-Name Speller (도로명 오타 교정)
+- BK-trees over the distinct road_nm values, keyed by their jamo decomposition, so that
+  '기산디지털1로' (ㅏ -> ㅣ) is one edit from '가산디지털1로' and '가산지디털1로' is two.
+- One tree per jamo length: a query within k edits only walks the trees of length ±k.
+- LocalSearchService asks it for corrections when the typed road name does not exist,
+  which fixes common typos deterministically before anything is sent to the LLM.
+"""
+import sys
+from sqlalchemy.orm import Session
+from app.models.local_address import AddressMaster
+from app.services.memory_index import MemoryIndex, register_index
+from app.utils.normalize import to_jamo
+
+
+def jamo_distance(peq: dict[str, int], m: int, text: str) -> int:
+    """
+    Levenshtein distance between a pattern and text (Myers' bit-parallel algorithm).
+    peq/m come from pattern_bits(pattern), so one query pattern is compared against
+    many tree nodes without rebuilding its bit masks.
+    """
+    if m == 0:
+        return len(text)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def pattern_bits(pattern: str) -> tuple[dict[str, int], int]:
+    peq: dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq, len(pattern)
+
+
+class RoadSpeller(MemoryIndex):
+    name = "road_speller"
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def _reset(self):
+        # BK-trees as flat lists: node i = (jamo key, road_nm, {distance: child node})
+        self.roots: dict[int, int] = {}  # jamo length -> root node
+        self.keys: list[str] = []
+        self.names: list[str] = []
+        self.children: list[dict[int, int]] = []
+        # road_nm -> region ids, region id -> (si_nm, sgg_nm)
+        self.road_regions: dict[str, tuple[int, ...]] = {}
+        self.regions: list[tuple[str, str]] = []
+
+    def _build(self, db: Session):
+        region_ids: dict[tuple[str, str], int] = {}
+        road_regions: dict[str, set[int]] = {}
+        rows = db.query(AddressMaster.road_nm, AddressMaster.si_nm, AddressMaster.sgg_nm).distinct()
+        for road, si, sgg in rows:
+            if not road:
+                continue
+            region = (si or "", sgg or "")
+            rid = region_ids.get(region)
+            if rid is None:
+                rid = len(self.regions)
+                region_ids[region] = rid
+                self.regions.append((sys.intern(region[0]), sys.intern(region[1])))
+            road_regions.setdefault(road, set()).add(rid)
+
+        self.road_regions = {sys.intern(road): tuple(sorted(rids)) for road, rids in road_regions.items()}
+        for road in sorted(self.road_regions):
+            self._insert(road)
+
+    def _insert(self, road: str) -> None:
+        key = to_jamo(road)
+        node_id = len(self.keys)
+        self.keys.append(key)
+        self.names.append(road)
+        self.children.append({})
+        node = self.roots.setdefault(len(key), node_id)
+        if node == node_id:
+            return
+        peq, m = pattern_bits(key)
+        while True:
+            d = jamo_distance(peq, m, self.keys[node])
+            if d == 0:
+                return  # same jamo string (cannot happen for distinct names)
+            child = self.children[node].get(d)
+            if child is None:
+                self.children[node][d] = node_id
+                return
+            node = child
+
+    def _dump(self) -> dict:
+        return {
+            "roots": self.roots, "keys": self.keys, "names": self.names, "children": self.children,
+            "road_regions": self.road_regions, "regions": self.regions
+        }
+
+    def _restore(self, state: dict):
+        self.roots = state["roots"]
+        self.keys = state["keys"]
+        self.names = state["names"]
+        self.children = state["children"]
+        self.road_regions = state["road_regions"]
+        self.regions = state["regions"]
+
+    @staticmethod
+    def max_distance(key: str) -> int:
+        """Edits tolerated for a jamo key: none for very short names ('중로'), 1 up to 8 jamo, then 2"""
+        if len(key) <= 4:
+            return 0
+        return 1 if len(key) <= 8 else 2
+
+    def within(self, road_name: str, max_distance: int) -> list[tuple[int, str]]:
+        """(distance, road_nm) for every road within max_distance jamo edits"""
+        key = to_jamo(road_name)
+        peq, m = pattern_bits(key)
+        found = []
+        stack = [self.roots[n] for n in range(m - max_distance, m + max_distance + 1) if n in self.roots]
+        while stack:
+            node = stack.pop()
+            d = jamo_distance(peq, m, self.keys[node])
+            if d <= max_distance:
+                found.append((d, self.names[node]))
+            for edge, child in self.children[node].items():
+                if d - max_distance <= edge <= d + max_distance:
+                    stack.append(child)
+        return found
+
+    def suggest(self, road_name: str, sido: str | None = None,
+                sgg_names: frozenset[str] | None = None, limit: int = 5) -> list[str]:
+        """
+        Closest existing road names for a road name that is not in the data.
+        - sido / sgg_names (validated by the gazetteer) keep only roads that exist there.
+        - Only the nearest distance is returned: '기산디지털1로' -> ['가산디지털1로'].
+        """
+        road_name = road_name.replace(" ", "")
+        tolerance = self.max_distance(to_jamo(road_name))
+        if tolerance == 0:
+            return []
+        best: dict[int, list[str]] = {}
+        for d, road in self.within(road_name, tolerance):
+            if d == 0:
+                continue
+            if sido or sgg_names:
+                regions = [self.regions[rid] for rid in self.road_regions.get(road, ())]
+                if not any((not sido or si == sido) and (not sgg_names or sgg in sgg_names)
+                           for si, sgg in regions):
+                    continue
+            best.setdefault(d, []).append(road)
+        if not best:
+            return []
+        return sorted(best[min(best)])[:limit]
+
+
+road_speller = register_index(RoadSpeller())
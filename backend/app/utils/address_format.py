@@ -0,0 +1,41 @@
+"""
+Address Formatting (주소 문자열 조립)
+- The compact store keeps only the address components; full road / jibun address
+  strings are rebuilt from them on demand (AddressMaster.road_address / jibun_address).
+"""
+
+
+def format_road_address(si_nm, sgg_nm, road_nm, buld_mainsn, buld_subsn=0, is_basement=None) -> str:
+    """'서울특별시 강남구 테헤란로 152', '... 152-1', '... 152 (지하)'"""
+    text = " ".join(p for p in (si_nm, sgg_nm, road_nm) if p)
+    if buld_mainsn is not None:
+        text += f" {buld_mainsn}"
+        if buld_subsn:
+            text += f"-{buld_subsn}"
+    if is_basement and is_basement != '0':
+        text += " (지하)"
+    return text
+
+
+def format_jibun_address(si_nm, sgg_nm, emd_nm, ri_nm=None, jibun_main=None, jibun_sub=0) -> str:
+    """'제주특별자치도 서귀포시 안덕면 구억리 1159', '서울특별시 강남구 역삼동 737-1'"""
+    text = " ".join(p for p in (si_nm, sgg_nm, emd_nm, ri_nm) if p)
+    if jibun_main:
+        text += f" {jibun_main}"
+        if jibun_sub:
+            text += f"-{jibun_sub}"
+    return text
+
+
+def road_address_of(row) -> str:
+    """Full road address of any address row (ORM object, Core row tuple or columnar row)"""
+    return getattr(row, "road_full_addr", None) or format_road_address(
+        row.si_nm, row.sgg_nm, row.road_nm, row.buld_mainsn, row.buld_subsn, row.is_basement
+    )
+
+
+def jibun_address_of(row) -> str:
+    """Full jibun address of any address row (ORM object, Core row tuple or columnar row)"""
+    return getattr(row, "jibun_full_addr", None) or format_jibun_address(
+        row.si_nm, row.sgg_nm, row.emd_nm, row.ri_nm, row.jibun_main, row.jibun_sub
+    )
@@ -1,14 +1,75 @@
+import codecs
+import csv
+import io
+import os
+import shutil
 import pandas as pd
-from io import StringIO, BytesIO
+from io import BytesIO
+from typing import Iterator
 from fastapi import UploadFile
 
-def read_csv_file(file: UploadFile) -> pd.DataFrame:
-    """Read UploadFile as Pandas DataFrame"""
-    content = file.file.read()
-    s = str(content, 'utf-8')
-    data = StringIO(s)
-    df = pd.read_csv(data)
-    return df
+COPY_BUFFER_BYTES = 1024 * 1024
+SNIFF_BYTES = 256 * 1024  # encoding detection sample
+
+
+def spool_upload(file: UploadFile, path: str) -> int:
+    """Copy the upload to a job file in fixed-size blocks (never the whole file in memory). Returns bytes written."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    file.file.seek(0)
+    with open(path, "wb") as out:
+        shutil.copyfileobj(file.file, out, COPY_BUFFER_BYTES)
+        return out.tell()
+
+
+def detect_encoding(path: str) -> str:
+    """utf-8-sig (BOM) / utf-8 / cp949 (Excel on Korean Windows) from the first block of the file"""
+    with open(path, "rb") as f:
+        sample = f.read(SNIFF_BYTES)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Incremental: a multi-byte character cut at the end of the sample is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def read_csv_header(path: str, encoding: str) -> list[str]:
+    return list(pd.read_csv(path, encoding=encoding, nrows=0).columns)
+
+
+def count_csv_rows(path: str, encoding: str) -> int:
+    """Data rows (quoted newlines and blank lines handled like pandas), one streaming pass"""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        rows = sum(1 for row in csv.reader(f) if row)
+    return max(rows - 1, 0)
+
+
+def iter_csv_chunks(path: str, encoding: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """DataFrames of chunk_rows rows, read lazily (values kept as the original text)"""
+    with pd.read_csv(path, encoding=encoding, chunksize=chunk_rows, dtype=str, keep_default_na=False) as reader:
+        yield from reader
+
+
+def read_csv_rows(path: str, columns: list[str], byte_offset: int, skip: int, limit: int) -> list[dict]:
+    """
+    `limit` records starting `skip` rows after a row boundary at byte_offset (UTF-8 file,
+    header already known). Only that window is read, whatever the file size.
+    """
+    rows = []
+    with open(path, "rb") as f:
+        f.seek(byte_offset)
+        text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        for i, values in enumerate(csv.reader(text)):
+            if i < skip:
+                continue
+            if len(rows) >= limit:
+                break
+            rows.append(dict(zip(columns, values)))
+        text.detach()
+    return rows
+
 
 def df_to_csv_bytes(df: pd.DataFrame) -> BytesIO:
     """Convert DataFrame back to CSV Bytes for download"""
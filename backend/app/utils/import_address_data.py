@@ -1,8 +1,14 @@
 import os
+import re
+import sys
 import glob
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.session import SessionLocal, engine
-from app.models.local_address import AddressMaster, AddressDetail
+from app.models.local_address import AddressMaster, AddressDetail, AddressRegion, AddressRoad
+from app.utils.normalize import normalize_building_key, fold_english
+from app.utils.address_format import format_road_address, format_jibun_address
 
 # Auto Create Tables
 AddressMaster.metadata.create_all(bind=engine)
@@ -21,9 +27,11 @@ def load_road_code_map():
         for line in f:
             cols = line.strip().split('|')
             if len(cols) < 5: continue
-            # Col Indices: 0:Code, 1:Road, 4:Sido, 6:Sgg, 8:Emd
+            # Col Indices: 0:Code, 1:Road, 4:Sido, 6:Sgg, 8:Emd, 11:Emd Code (법정동 3자리)
+            emd_code = cols[11].strip() if len(cols) > 11 else ""
             code_map[cols[0]] = {
-                "sido": cols[4], "sgg": cols[6], "road": cols[1], "emd": cols[8]
+                "sido": cols[4], "sgg": cols[6], "road": cols[1], "emd": cols[8],
+                "emd_cd": int(cols[0][:5] + emd_code) if (cols[0][:5] + emd_code).isdigit() and len(emd_code) == 3 else 0
             }
     print(f"[INIT] Loaded {len(code_map)} Road Codes.")
     return code_map
@@ -49,7 +57,7 @@ def load_extra_info(region_suffix):
 
 def load_jibun_info(region_suffix):
     """ 3. 지번 (Jibun Number + 법정동) """
-    # Map: { MgmtNo : { "jibun": "123-4", "emd": "하안동" } }
+    # Map: { MgmtNo : { "jibun": "123-4", "emd": "하안동", "ri": "", "main": 123, "sub": 4, "bjd": "4121010300" } }
     jibun_map = {}
     fpath = os.path.join(DATA_DIR, f"지번_{region_suffix}")
     if not os.path.exists(fpath): return {}
@@ -83,7 +91,10 @@ def load_jibun_info(region_suffix):
                 jibun_map[mgmt_no] = {
                     "jibun": jibun_str,
                     "emd": emd_name,
-                    "ri": ri_name
+                    "ri": ri_name,
+                    "main": main_no,
+                    "sub": sub_no,
+                    "bjd": cols[2].strip()
                 }
     return jibun_map
 
@@ -239,6 +250,260 @@ def load_all_detail_addresses(db):
     return total_count
 
 
+def parse_jibun_full_addr(si_nm, sgg_nm, emd_nm, jibun_full_addr):
+    """
+    Split a stored jibun_full_addr back into (ri, main, sub).
+    Format written by import_addresses: "{sido} {sgg} {emd}[ {ri}][ {main}[-{sub}]]"
+    Rows without a lot number get (ri, 0, 0) so they are not re-parsed.
+    """
+    prefix = f"{si_nm} {sgg_nm} {emd_nm}"
+    if not jibun_full_addr or not jibun_full_addr.startswith(prefix):
+        return None, 0, 0
+    ri, main, sub = None, 0, 0
+    for token in jibun_full_addr[len(prefix):].split():
+        m = re.match(r'^(\d+)(?:-(\d+))?$', token)
+        if m:
+            main, sub = int(m.group(1)), int(m.group(2) or 0)
+        elif token.endswith("리"):
+            ri = token
+    return ri, main, sub
+
+
+def region_codes(road_code: str, bjd_code: str = "", road_emd_cd: int = 0) -> dict:
+    """
+    Integer region codes for a row (0 = unknown)
+    - road_code: 12-digit 도로명코드 = 시군구코드(5) + 도로번호(7) -> sido_cd, sgg_cd
+    - bjd_code: 10-digit 법정동코드 = 시군구코드(5) + 읍면동(3) + 리(2) -> emd_cd (first 8 digits)
+    - road_emd_cd: emd code of the road (road code file) when the row has no 지번 entry
+    """
+    if len(bjd_code) >= 8 and bjd_code[:8].isdigit():
+        emd_cd = int(bjd_code[:8])
+    else:
+        emd_cd = road_emd_cd or 0
+    # Keep the hierarchy consistent: the 법정동 code decides the sgg when there is one
+    if emd_cd:
+        sgg_cd = emd_cd // 1000
+    else:
+        sgg_cd = int(road_code[:5]) if len(road_code) >= 5 and road_code[:5].isdigit() else 0
+    return {"sido_cd": sgg_cd // 1000, "sgg_cd": sgg_cd, "emd_cd": emd_cd}
+
+
+class DictionaryWriter:
+    """
+    Writes one address_region / address_road entry per distinct region / road name, keyed by
+    the Korean names (compact store: the English names live there instead of on every
+    address row). Address rows keep their name columns and do not reference the entries.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.regions = {
+            (r.si_nm, r.sgg_nm, r.emd_nm, r.ri_nm or ""): r.id for r in db.query(AddressRegion)
+        }
+        self.roads = {r.road_nm: r.id for r in db.query(AddressRoad)}
+        # Entries created without English names (filled in when a later row has them)
+        self.region_no_eng = {r.id for r in db.query(AddressRegion.id).filter(AddressRegion.si_nm_eng == None)}
+        self.road_no_eng = {r.id for r in db.query(AddressRoad.id).filter(AddressRoad.road_nm_eng == None)}
+
+    def add_region(self, si_nm, sgg_nm, emd_nm, ri_nm="", si_eng=None, sgg_eng=None, codes=None) -> None:
+        key = (si_nm or "", sgg_nm or "", emd_nm or "", ri_nm or "")
+        region_id = self.regions.get(key)
+        if region_id is None:
+            codes = codes or {}
+            region = AddressRegion(
+                si_nm=key[0], sgg_nm=key[1], emd_nm=key[2], ri_nm=key[3],
+                si_nm_eng=si_eng or None, sgg_nm_eng=sgg_eng or None,
+                sido_cd=codes.get("sido_cd"), sgg_cd=codes.get("sgg_cd"), emd_cd=codes.get("emd_cd")
+            )
+            self.db.add(region)
+            self.db.flush()
+            region_id = self.regions[key] = region.id
+            if not si_eng:
+                self.region_no_eng.add(region_id)
+        elif si_eng and region_id in self.region_no_eng:
+            self.db.query(AddressRegion).filter(AddressRegion.id == region_id).update(
+                {"si_nm_eng": si_eng, "sgg_nm_eng": sgg_eng or None}
+            )
+            self.region_no_eng.discard(region_id)
+
+    def add_road(self, road_nm, road_eng=None) -> None:
+        road_id = self.roads.get(road_nm)
+        if road_id is None:
+            road = AddressRoad(road_nm=road_nm, road_nm_eng=road_eng or None,
+                               road_nm_eng_key=fold_english(road_eng) or None)
+            self.db.add(road)
+            self.db.flush()
+            road_id = self.roads[road_nm] = road.id
+            if not road_eng:
+                self.road_no_eng.add(road_id)
+        elif road_eng and road_id in self.road_no_eng:
+            self.db.query(AddressRoad).filter(AddressRoad.id == road_id).update(
+                {"road_nm_eng": road_eng, "road_nm_eng_key": fold_english(road_eng) or None}
+            )
+            self.road_no_eng.discard(road_id)
+
+
+def _backfill(label, columns, pending_filter, compute, batch_size=50000):
+    """
+    Fill derived columns in id-ordered batches for rows imported by older versions.
+    compute(row) -> dict of column values (without id)
+    """
+    db = SessionLocal()
+    try:
+        pending = db.query(AddressMaster.id).filter(*pending_filter).count()
+        if not pending:
+            return 0
+        print(f"[MIGRATE] Backfilling {label} for {pending} rows...")
+
+        done = 0
+        last_id = 0
+        while True:
+            rows = db.query(AddressMaster.id, *columns).filter(
+                AddressMaster.id > last_id, *pending_filter
+            ).order_by(AddressMaster.id).limit(batch_size).all()
+            if not rows:
+                break
+            params = [{"id": row[0], **compute(row)} for row in rows]
+            assignments = ", ".join(f"{k} = :{k}" for k in params[0] if k != "id")
+            db.execute(text(f"UPDATE address_master SET {assignments} WHERE id = :id"), params)
+            db.commit()
+            last_id = rows[-1][0]
+            done += len(rows)
+            print(f"    -> Backfilled {done}/{pending} rows...")
+        return done
+    finally:
+        db.close()
+
+
+def backfill_jibun_columns():
+    """ri_nm / jibun_main / jibun_sub from jibun_full_addr"""
+    def compute(row):
+        ri, main, sub = parse_jibun_full_addr(row.si_nm, row.sgg_nm, row.emd_nm, row.jibun_full_addr)
+        return {"ri_nm": ri, "jibun_main": main, "jibun_sub": sub}
+
+    return _backfill(
+        "structured jibun columns",
+        [AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.emd_nm, AddressMaster.jibun_full_addr],
+        [AddressMaster.jibun_main == None, AddressMaster.jibun_full_addr != None],
+        compute
+    )
+
+
+def backfill_building_keys():
+    """buld_nm_key from buld_nm"""
+    return _backfill(
+        "building name keys",
+        [AddressMaster.buld_nm],
+        [AddressMaster.buld_nm_key == None, AddressMaster.buld_nm != None, AddressMaster.buld_nm != ""],
+        lambda row: {"buld_nm_key": normalize_building_key(row.buld_nm)}
+    )
+
+
+def backfill_region_codes():
+    """sido_cd / sgg_cd / emd_cd from the region names (name -> code maps of the road code file)"""
+    sgg_codes, emd_codes = {}, {}
+    for code, info in load_road_code_map().items():
+        if code[:5].isdigit():
+            sgg_codes.setdefault((info["sido"], info["sgg"]), int(code[:5]))
+        if info["emd_cd"]:
+            emd_codes.setdefault((info["sido"], info["sgg"], info["emd"]), info["emd_cd"])
+
+    def compute(row):
+        sgg_cd = sgg_codes.get((row.si_nm, row.sgg_nm or ""), 0)
+        emd_cd = emd_codes.get((row.si_nm, row.sgg_nm or "", row.emd_nm), 0)
+        # Unknown names get 0 so they are not scanned again on every startup
+        return {"sido_cd": sgg_cd // 1000, "sgg_cd": sgg_cd, "emd_cd": emd_cd}
+
+    return _backfill(
+        "region codes",
+        [AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.emd_nm],
+        [AddressMaster.sgg_cd == None],
+        compute
+    )
+
+
+def backfill_dictionaries(force: bool = False) -> int:
+    """
+    address_region / address_road for rows imported before the dictionary tables existed.
+    At startup only while the dictionaries are still empty; force=True (--compact) sweeps the
+    legacy rows again so no English name is lost when their copies are dropped.
+    """
+    db = SessionLocal()
+    try:
+        if not force and db.query(AddressRegion.id).first():
+            return 0
+        if not db.query(AddressMaster.id).first():
+            return 0
+        print("[MIGRATE] Building region / road dictionaries...")
+        writer = DictionaryWriter(db)
+        regions = db.query(
+            AddressMaster.si_nm, AddressMaster.sgg_nm, AddressMaster.emd_nm, AddressMaster.ri_nm,
+            AddressMaster.si_nm_eng, AddressMaster.sgg_nm_eng,
+            AddressMaster.sido_cd, AddressMaster.sgg_cd, AddressMaster.emd_cd
+        ).distinct()
+        for si, sgg, emd, ri, si_eng, sgg_eng, sido_cd, sgg_cd, emd_cd in regions.all():
+            writer.add_region(si, sgg, emd, ri, si_eng, sgg_eng,
+                              {"sido_cd": sido_cd, "sgg_cd": sgg_cd, "emd_cd": emd_cd})
+        for road, road_eng in db.query(AddressMaster.road_nm, AddressMaster.road_nm_eng).distinct().all():
+            if road:
+                writer.add_road(road, road_eng)
+        db.commit()
+        print(f"    -> {len(writer.regions)} regions, {len(writer.roads)} roads")
+        return len(writer.regions) + len(writer.roads)
+    finally:
+        db.close()
+
+
+def backfill_english_keys() -> int:
+    """address_road.road_nm_eng_key for dictionary entries written before the key column existed"""
+    db = SessionLocal()
+    try:
+        pending = db.query(AddressRoad.id, AddressRoad.road_nm_eng).filter(
+            AddressRoad.road_nm_eng != None, AddressRoad.road_nm_eng_key == None
+        ).all()
+        if not pending:
+            return 0
+        print(f"[MIGRATE] Backfilling English road keys for {len(pending)} roads...")
+        db.execute(text("UPDATE address_road SET road_nm_eng_key = :key WHERE id = :id"),
+                   [{"id": road_id, "key": fold_english(road_eng) or None} for road_id, road_eng in pending])
+        db.commit()
+        return len(pending)
+    finally:
+        db.close()
+
+
+def compact_address_store():
+    """
+    One-time conversion of rows imported before the compact layout (run manually:
+    python -m app.utils.import_address_data --compact).
+    Derivable strings (full addresses, English copies now in the dictionaries) are dropped
+    and the database file is vacuumed.
+    """
+    backfill_dictionaries(force=True)
+    db = SessionLocal()
+    try:
+        print("[COMPACT] Dropping derivable address strings...")
+        db.execute(text(
+            "UPDATE address_master SET is_basement = CASE WHEN road_full_addr LIKE '% (지하)' THEN '1' ELSE '0' END "
+            "WHERE is_basement IS NULL AND road_full_addr IS NOT NULL"
+        ))
+        result = db.execute(text(
+            "UPDATE address_master SET road_full_addr = NULL, jibun_full_addr = NULL, road_full_addr_eng = NULL, "
+            "si_nm_eng = NULL, sgg_nm_eng = NULL, road_nm_eng = NULL "
+            "WHERE jibun_main IS NOT NULL "
+            "AND (road_full_addr IS NOT NULL OR jibun_full_addr IS NOT NULL OR si_nm_eng IS NOT NULL)"
+        ))
+        db.commit()
+        print(f"[COMPACT] Compacted {result.rowcount} rows.")
+    finally:
+        db.close()
+
+    print("[COMPACT] Reclaiming free pages (VACUUM)...")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM" if engine.dialect.name == "sqlite" else "VACUUM FULL address_master"))
+    print("[COMPACT] Done.")
+
+
 def import_addresses():
     db = SessionLocal()
     try:
@@ -250,14 +515,17 @@ def import_addresses():
         
         # [DEBUG] Insert HARDCODED dummy for known test case "Juan-dong 110" -> "Juan-ro 122"
         # Only if not exists
-        chk = db.query(AddressMaster).filter(AddressMaster.jibun_full_addr == "인천광역시 미추홀구 주안동 110").first()
+        chk = db.query(AddressMaster).filter(
+            AddressMaster.sgg_nm == "미추홀구", AddressMaster.emd_nm == "주안동", AddressMaster.jibun_main == 110
+        ).first()
         if not chk:
             dummy = AddressMaster(
                 si_nm="인천광역시", sgg_nm="미추홀구", emd_nm="주안동",
                 road_nm="주안로", buld_mainsn=122, buld_subsn=0,
-                buld_nm="테스트빌딩", zip_no="22100",
+                buld_nm="테스트빌딩", buld_nm_key="테스트빌딩", zip_no="22100",
                 road_full_addr="인천광역시 미추홀구 주안로 122",
-                jibun_full_addr="인천광역시 미추홀구 주안동 110"
+                jibun_full_addr="인천광역시 미추홀구 주안동 110",
+                jibun_main=110, jibun_sub=0
             )
             db.add(dummy)
             db.commit()
@@ -268,6 +536,8 @@ def import_addresses():
         print(f"[INFO] Found {len(addr_files)} address files.")
         
         total_inserted = 0
+        compact = settings.COMPACT_ADDRESS_STORE
+        dictionary = DictionaryWriter(db)
         
         for fpath in addr_files:
             fname = os.path.basename(fpath)
@@ -319,7 +589,6 @@ def import_addresses():
                              buld_nm = cols[9].strip()
 
                     jibun_data = jibun_map.get(mgmt_no, {})
-                    jibun_num = jibun_data.get("jibun", "") if isinstance(jibun_data, dict) else jibun_data
                     
                     # Use legal dong from jibun file (accurate per address)
                     # Fall back to road_map emd if not available
@@ -334,19 +603,24 @@ def import_addresses():
                     road_eng = eng_data.get("road_eng", "")
                     full_eng = eng_data.get("full_eng", "")
                     
-                    # Construct Strings
-                    # Road Addr
-                    road_addr = f"{sido} {sgg} {road} {main_sn}"
-                    if sub_sn > 0: road_addr += f"-{sub_sn}"
-                    if is_basement != '0': road_addr += " (지하)"
-                    
-                    # Jibun Addr - now uses correct emd and optional ri
                     actual_ri = jibun_data.get("ri", "") if isinstance(jibun_data, dict) else ""
-                    jibun_addr = f"{sido} {sgg} {emd}"
-                    if actual_ri:
-                        jibun_addr += f" {actual_ri}"
-                    if jibun_num:
-                        jibun_addr += f" {jibun_num}"
+                    jibun_main = jibun_data.get("main") if isinstance(jibun_data, dict) else None
+                    jibun_sub = jibun_data.get("sub") if isinstance(jibun_data, dict) else None
+                    codes = region_codes(
+                        road_code,
+                        jibun_data.get("bjd", "") if isinstance(jibun_data, dict) else "",
+                        r_info.get("emd_cd", 0)
+                    )
+                    
+                    # Region / road dictionaries (English names live in address_region / address_road)
+                    dictionary.add_region(sido, sgg, emd, actual_ri, si_eng, sgg_eng, codes)
+                    dictionary.add_road(road, road_eng)
+
+                    # Construct Strings (compact store: rebuilt on demand, not stored)
+                    road_addr = jibun_addr = None
+                    if not compact:
+                        road_addr = format_road_address(sido, sgg, road, main_sn, sub_sn, is_basement)
+                        jibun_addr = format_jibun_address(sido, sgg, emd, actual_ri, jibun_main, jibun_sub)
                     
                     rec = AddressMaster(
                         mgmt_no=mgmt_no,   # 연계키 추가
@@ -357,14 +631,22 @@ def import_addresses():
                         buld_mainsn=main_sn,
                         buld_subsn=sub_sn,
                         buld_nm=buld_nm,   # Now populated!
+                        buld_nm_key=normalize_building_key(buld_nm) or None,
                         zip_no=zip_code,
+                        is_basement=is_basement,
                         road_full_addr=road_addr,
                         jibun_full_addr=jibun_addr,
-                        # English fields
-                        si_nm_eng=si_eng if si_eng else None,
-                        sgg_nm_eng=sgg_eng if sgg_eng else None,
-                        road_nm_eng=road_eng if road_eng else None,
-                        road_full_addr_eng=full_eng if full_eng else None
+                        # Structured jibun fields
+                        ri_nm=actual_ri if actual_ri else None,
+                        jibun_main=jibun_main,
+                        jibun_sub=jibun_sub,
+                        # Region codes (road code + 법정동 code)
+                        **codes,
+                        # English fields (legacy layout only)
+                        si_nm_eng=si_eng if si_eng and not compact else None,
+                        sgg_nm_eng=sgg_eng if sgg_eng and not compact else None,
+                        road_nm_eng=road_eng if road_eng and not compact else None,
+                        road_full_addr_eng=full_eng if full_eng and not compact else None
                     )
                     buffer.append(rec)
                     
@@ -387,6 +669,11 @@ def import_addresses():
             eng_map.clear()
 
         print(f"[SUCCESS] Total {total_inserted} address records imported.")
+
+        # Resident indexes / snapshots are now stale
+        if total_inserted:
+            from app.services.memory_index import invalidate_indexes
+            invalidate_indexes()
         
         # Import ALL detail addresses after main addresses are done
         print("\n[PHASE 2] Importing Detail Addresses...")
@@ -399,4 +686,7 @@ def import_addresses():
         db.close()
 
 if __name__ == "__main__":
-    import_addresses()
+    if "--compact" in sys.argv:
+        compact_address_store()
+    else:
+        import_addresses()
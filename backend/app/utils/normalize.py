@@ -0,0 +1,60 @@
+import re
+import unicodedata
+
+FOLD_RE = re.compile(r'[^a-z0-9]')
+
+
+def normalize_building_key(name: str | None) -> str:
+    """
+    Space-insensitive building-name key (건물명 검색 키)
+    NFKC (full-width -> half-width), whitespace removed, case-folded.
+    e.g. '우림 라이온스 밸리' -> '우림라이온스밸리', 'ＧＳ 타워' -> 'gs타워'
+    """
+    if not name:
+        return ""
+    return re.sub(r"\s+", "", unicodedata.normalize("NFKC", name)).casefold()
+
+
+def fold_english(text: str | None) -> str:
+    """
+    English name key (영문 주소 검색 키): lower case, anything but a-z / 0-9 dropped.
+    e.g. 'Gasan digital 1-ro' -> 'gasandigital1ro', 'TEHERAN RO' -> 'teheranro'
+    """
+    return FOLD_RE.sub('', (text or "").lower())
+
+
+def normalize_raw_key(text: str | None) -> str:
+    """
+    Duplicate key for raw address inputs (bulk dedup)
+    NFKC, runs of whitespace collapsed, ends trimmed - spelling is otherwise kept.
+    e.g. ' 서울  강남구 테헤란로１５２ ' -> '서울 강남구 테헤란로152'
+    """
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+# Hangul syllable -> jamo (초성/중성/종성), conjoining jamo block U+1100..
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG_BASE, JUNGSEONG_BASE, JONGSEONG_BASE = 0x1100, 0x1161, 0x11A7
+
+
+def to_jamo(text: str | None) -> str:
+    """
+    Decompose Hangul syllables into jamo so edit distance counts one-jamo typos as 1
+    e.g. '기산' -> ㄱㅣㅅㅏㄴ (5 jamo, one edit away from '가산'); other characters pass through.
+    """
+    if not text:
+        return ""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            code -= HANGUL_BASE
+            out.append(chr(CHOSEONG_BASE + code // 588))
+            out.append(chr(JUNGSEONG_BASE + (code % 588) // 28))
+            if code % 28:
+                out.append(chr(JONGSEONG_BASE + code % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
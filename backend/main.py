@@ -16,6 +16,9 @@ import threading
 def on_startup():
     # Setup Local DB
     AddressMaster.metadata.create_all(bind=engine)
+    # Add columns/indexes introduced after the DB file was created
+    from app.db.schema import upgrade_schema
+    upgrade_schema()
     
     def run_import_job():
         from app.db.session import SessionLocal
@@ -43,14 +46,17 @@ def on_startup():
     try:
         # AddressMaster is already imported at top level
         target = "인천광역시 미추홀구 주안동 110"
-        exists = db_test.query(AddressMaster).filter(AddressMaster.jibun_full_addr == target).first()
+        exists = db_test.query(AddressMaster).filter(
+            AddressMaster.sgg_nm == "미추홀구", AddressMaster.emd_nm == "주안동", AddressMaster.jibun_main == 110
+        ).first()
         if not exists:
             dummy = AddressMaster(
                 si_nm="인천광역시", sgg_nm="미추홀구", emd_nm="주안동",
                 road_nm="주안로", buld_mainsn=122, buld_subsn=0,
-                buld_nm="정답빌딩", zip_no="22100",
+                buld_nm="정답빌딩", buld_nm_key="정답빌딩", zip_no="22100",
                 road_full_addr="인천광역시 미추홀구 주안로 122",
-                jibun_full_addr=target
+                jibun_full_addr=target,
+                jibun_main=110, jibun_sub=0
             )
             db_test.add(dummy)
             db_test.commit()
@@ -75,7 +81,7 @@ def on_startup():
                 # [DEBUG] Check specific building
                 chk_build = db.query(AddressMaster).filter(AddressMaster.buld_nm.like("%우림라이온스밸리%")).first()
                 if chk_build:
-                    print(f"[DEBUG] Found '우림라이온스밸리' in DB! ID={chk_build.id}, RoadAddr={chk_build.road_full_addr}")
+                    print(f"[DEBUG] Found '우림라이온스밸리' in DB! ID={chk_build.id}, RoadAddr={chk_build.road_address}")
                 else:
                     print(f"[DEBUG] '우림라이온스밸리' NOT found in DB.")
         except Exception as e:
@@ -83,10 +89,35 @@ def on_startup():
         finally:
             db_test.close()
 
+    # Fill structured columns for rows imported by older versions (one-time)
+    from app.utils.import_address_data import (
+        backfill_jibun_columns, backfill_building_keys, backfill_region_codes, backfill_dictionaries,
+        backfill_english_keys
+    )
+    backfill_jibun_columns()
+    backfill_building_keys()
+    backfill_region_codes()
+    backfill_dictionaries()
+    backfill_english_keys()
+
+    # Building-name full-text index (FTS5 trigram / pg_trgm)
+    from app.db.fulltext import ensure_building_fts
+    ensure_building_fts()
+
+    # Warm up in-memory search indexes (snapshot load or full build)
+    # Searches fall back to SQL until each index reports ready.
+    from app.services.memory_index import warm_up_indexes
+    threading.Thread(target=warm_up_indexes, daemon=True).start()
+
     # Run in background to not block server
     # bg_thread = threading.Thread(target=run_import_job)
     # bg_thread.start()
 
+@app.on_event("shutdown")
+def on_shutdown():
+    from app.services.bulk_worker import shutdown_pool
+    shutdown_pool()
+
 app.include_router(address.router, prefix="/api/v1/address", tags=["Address"])
 
 @app.get("/")
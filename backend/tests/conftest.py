@@ -0,0 +1,124 @@
+"""
+Test setup: a throwaway SQLite database with the sample rows (tests/sample_data.py).
+The environment is set before any app module is imported (the engine is created at import).
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+TMP_DIR = tempfile.mkdtemp(prefix="spatialaddress_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP_DIR, 'test.db')}"
+os.environ["INDEX_SNAPSHOT_DIR"] = os.path.join(TMP_DIR, "index_snapshots")
+os.environ["BULK_SPOOL_DIR"] = os.path.join(TMP_DIR, "bulk_spool")
+os.environ["BULK_WORKERS"] = "1"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import app.utils.import_address_data as importer
+from app.db import fulltext
+from app.db.session import Base, SessionLocal, engine
+from app.models.local_address import AddressDetail, AddressMaster
+from app.services import memory_index
+from app.services.llm_service import llm_service
+from app.services.result_cache import negative_cache, result_cache
+from app.utils.normalize import normalize_building_key
+import app.services.local_search  # noqa: F401 (registers the search indexes)
+import sample_data
+
+# No road code file: the gazetteer is built from the stored rows only
+importer.DATA_DIR = os.path.join(TMP_DIR, "data")
+
+
+def _region_codes(row) -> dict:
+    """Stable fake codes (sido_cd = sgg_cd // 1000, like the real ones)"""
+    sidos = sorted({r[0] for r in sample_data.all_rows()})
+    sggs = sorted({(r[0], r[1]) for r in sample_data.all_rows()})
+    sgg_cd = (sidos.index(row[0]) + 11) * 1000 + sggs.index((row[0], row[1])) + 100
+    return {"sido_cd": sgg_cd // 1000, "sgg_cd": sgg_cd, "emd_cd": 0}
+
+
+def _load_sample_data():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        dictionary = importer.DictionaryWriter(db)
+        mgmt_nos = {}
+        for i, row in enumerate(sample_data.all_rows()):
+            si, sgg, emd, ri, road, main, sub, jibun_main, jibun_sub, buld_nm, zip_no = row
+            codes = _region_codes(row)
+            eng = sample_data.ENGLISH.get((si, sgg), (None, None))
+            mgmt_no = f"{codes['sgg_cd']}{i:014d}"
+            mgmt_nos[(road, main)] = mgmt_no
+            dictionary.add_region(si, sgg, emd, ri, *eng, codes)
+            dictionary.add_road(road, sample_data.ENGLISH.get(road))
+            db.add(AddressMaster(
+                mgmt_no=mgmt_no, si_nm=si, sgg_nm=sgg, emd_nm=emd, ri_nm=ri or None,
+                road_nm=road, buld_mainsn=main, buld_subsn=sub, jibun_main=jibun_main, jibun_sub=jibun_sub,
+                buld_nm=buld_nm, buld_nm_key=normalize_building_key(buld_nm) if buld_nm else None,
+                zip_no=zip_no, is_basement="0", **codes,
+            ))
+        for road, main, dong, floor, ho in sample_data.DETAILS:
+            db.add(AddressDetail(mgmt_no=mgmt_nos[(road, main)], dong=dong, floor=floor, ho=ho))
+        db.commit()
+    finally:
+        db.close()
+
+
+_load_sample_data()
+
+
+def reset_indexes():
+    for index in memory_index._registry:
+        with index.lock:
+            index.is_ready = False
+            index.signature = None
+            index._reset()
+    result_cache.clear()
+    negative_cache.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cleanup_tmp():
+    yield
+    engine.dispose()
+    shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def no_llm(monkeypatch):
+    """The LLM is never reachable in tests (None = not answered, nothing is negative-cached)"""
+    monkeypatch.setattr(llm_service, "correct_address", lambda raw: None)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def cold_indexes():
+    """Every resident index still loading (SQL fallbacks only)"""
+    reset_indexes()
+    fulltext._fts_ready = False
+    yield
+    reset_indexes()
+
+
+@pytest.fixture
+def warm_indexes():
+    """Every resident index loaded, building-name FTS available"""
+    reset_indexes()
+    fulltext.ensure_building_fts()
+    memory_index.warm_up_indexes()
+    yield
+    reset_indexes()
+    fulltext._fts_ready = False
+
+
+@pytest.fixture(params=["cold", "warm"])
+def index_state(request):
+    """Runs a test with the indexes loading and with them loaded"""
+    yield request.getfixturevalue(f"{request.param}_indexes")
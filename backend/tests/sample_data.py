@@ -0,0 +1,53 @@
+"""
+Sample address rows for the tests (compact layout: no stored full-address strings).
+(si_nm, sgg_nm, emd_nm, ri_nm, road_nm, buld_mainsn, buld_subsn, jibun_main, jibun_sub, buld_nm, zip_no)
+"""
+
+ADDRESSES = [
+    ("서울특별시", "강남구", "역삼동", "", "테헤란로", 152, 0, 737, 0, "강남파이낸스센터", "06236"),
+    ("서울특별시", "강남구", "삼성동", "", "봉은사로", 214, 0, 94, 0, None, "06171"),
+    ("서울특별시", "금천구", "가산동", "", "가산디지털1로", 168, 0, 371, 0, "우림라이온스밸리", "08507"),
+    ("서울특별시", "중구", "태평로1가", "", "세종대로", 110, 0, 31, 0, "서울특별시청", "04524"),
+    ("서울특별시", "중구", "태평로1가", "", "세종대로", 186, 0, 839, 0, None, "04520"),
+    ("서울특별시", "중구", "신당동", "", "다산로", 100, 0, 300, 0, "신당더샵아파트", "04595"),
+    ("경기도", "성남시 분당구", "백현동", "", "판교역로", 166, 0, 532, 0, "카카오판교아지트", "13529"),
+    ("경기도", "수원시 팔달구", "매산로1가", "", "덕영대로", 924, 0, 18, 0, "수원역", "16451"),
+    ("부산광역시", "해운대구", "우동", "", "해운대로", 620, 0, 1458, 0, "두산위브더제니스", "48093"),
+    ("제주특별자치도", "제주시", "일도이동", "", "중앙로", 25, 0, 486, 0, "대림2차아파트", "63221"),
+    ("대전광역시", "중구", "은행동", "", "중앙로", 25, 0, 50, 0, None, "34925"),
+    ("제주특별자치도", "서귀포시", "안덕면", "구억리", "구억로", 50, 0, 1159, 0, None, "63525"),
+    ("인천광역시", "미추홀구", "주안동", "", "주안로", 122, 0, 110, 0, "정답빌딩", "22100"),
+]
+
+# More '...아파트' buildings than LocalSearchService.MAX_CANDIDATES, all outside 중구 and
+# inserted first (lowest ids), so an unordered building-name fetch misses the 중구 one
+FILLER = [
+    ("제주특별자치도", "제주시", "노형동", "", "노연로", n, 0, 1000 + n, 0, f"노형{n}차아파트", "63100")
+    for n in range(1, 321)
+]
+
+DETAILS = [
+    # (road_nm, buld_mainsn, dong, floor, ho)
+    ("해운대로", 620, "105동", None, "2001호"),
+    ("해운대로", 620, "105동", None, "2002호"),
+]
+
+ENGLISH = {
+    # road_nm -> English name, (si_nm, sgg_nm) -> English names
+    "테헤란로": "Teheran-ro",
+    ("서울특별시", "강남구"): ("Seoul", "Gangnam-gu"),
+}
+
+
+def all_rows():
+    return FILLER + ADDRESSES
+
+
+def road_full_addr(row) -> str:
+    si, sgg, _, _, road, main, sub = row[:7]
+    return f"{si} {sgg} {road} {main}" + (f"-{sub}" if sub else "")
+
+
+def jibun_full_addr(row) -> str:
+    si, sgg, emd, ri, _, _, _, main, sub = row[:9]
+    return " ".join(p for p in (si, sgg, emd, ri) if p) + f" {main}" + (f"-{sub}" if sub else "")
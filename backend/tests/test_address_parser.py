@@ -0,0 +1,79 @@
+"""
+address_parser: token-wise space insertion and the region hints of the three views.
+"""
+import pytest
+from app.services.address_parser import (
+    SPACE_RULES, SPACES_RE, RegionHints, insert_spaces, parse_address, parse_region_hints,
+)
+
+
+def insert_spaces_whole_text(text: str) -> str:
+    """The rule passes over the whole string (the token-wise version must agree)"""
+    for pattern, replacement in SPACE_RULES:
+        text = pattern.sub(replacement, text)
+    return SPACES_RE.sub(' ', text).strip()
+
+
+@pytest.mark.parametrize("text", [
+    "부산광역시남구수영로305",
+    "서울특별시강남구테헤란로152",
+    "경기도수원시팔달구매산로1가 18",
+    "제주특별자치도제주시일도이동 486",
+    "제주시 애월읍하귀리1-1",
+    "강남구역삼동테헤란로152 101동1001호",
+    "세종특별자치시한누리대로2130",
+    "판교역로166번길 10 3층",
+    "  서울   중구  세종대로110  ",
+])
+def test_insert_spaces_matches_whole_text_passes(text):
+    assert insert_spaces(text) == insert_spaces_whole_text(text)
+
+
+def test_insert_spaces_splits_glued_address():
+    assert insert_spaces("부산광역시남구수영로305") == "부산광역시 남구 수영로 305"
+
+
+@pytest.mark.parametrize("tokens,expected", [
+    (["서울특별시", "강남구", "테헤란로", "152"], RegionHints("서울특별시", "강남구", None, None)),
+    (["서울시", "역삼1동"], RegionHints("서울특별시", None, "역삼1동", None)),
+    (["제주제주시", "일도2동"], RegionHints("제주특별자치도", "제주시", "일도2동", None)),
+    (["제주", "서귀포시", "안덕면", "구억리"], RegionHints("제주특별자치도", "서귀포시", "안덕면", "구억리")),
+    (["세종대로", "110"], RegionHints(None, None, None, None)),  # road names never give a 시도
+    (["주특별자치도", "제주시"], RegionHints("제주특별자치도", "제주시", None, None)),
+])
+def test_region_hints(tokens, expected):
+    assert parse_region_hints(tokens) == expected
+
+
+def test_glued_sgg_overrides_earlier_sgg():
+    assert parse_region_hints(["강남구", "제주제주시"]).sgg == "제주시"
+
+
+def test_bracket_names_only_in_like_hints():
+    parsed = parse_address("중앙로 25 [연동, 대림2차아파트]")
+    assert parsed.hints == RegionHints(None, None, None, None)
+    assert parsed.like_hints.emd == "연동"
+    assert parsed.road_name == "중앙로" and parsed.road_num == "25"
+    assert parsed.ref_building_name == "대림2차아파트"
+
+
+def test_road_hints_drop_names_removed_from_road_view():
+    parsed = parse_address("서울특별시 강남구 테헤란로 152")
+    assert parsed.hints == RegionHints("서울특별시", "강남구", None, None)
+    assert parsed.tokens == ("테헤란로", "152")
+    assert parsed.road_hints == RegionHints(None, None, None, None)
+    assert parsed.like_hints == parsed.hints
+
+
+def test_road_hints_keep_names_not_removed():
+    # Only the first '강남구' is stripped from the road view
+    parsed = parse_address("강남구 테헤란로 152 강남구")
+    assert parsed.tokens == ("테헤란로", "152", "강남구")
+    assert parsed.road_hints.sgg == "강남구"
+
+
+def test_hints_ignore_punctuation():
+    parsed = parse_address("강남구, 테헤란로 152 (역삼동)")
+    assert parsed.hints.sgg == "강남구"
+    assert parsed.hints.emd is None  # round bracket content is reference only
+    assert parsed.like_hints.emd == "역삼동"
@@ -0,0 +1,15 @@
+"""
+AutocompleteIndex: ranked prefix completions for road / building / 동 names.
+"""
+from app.services.autocomplete import autocomplete_index
+
+
+def test_complete(warm_indexes):
+    found = autocomplete_index.complete("테헤", kind="road")
+    assert [s["text"] for s in found] == ["테헤란로"]
+    assert found[0]["si_nm"] == "서울특별시"
+    assert [s["text"] for s in autocomplete_index.complete("우림 라이온스", kind="building")] == ["우림라이온스밸리"]
+    assert autocomplete_index.complete("노형", kind="building", limit=3)[0]["type"] == "building"
+    assert len(autocomplete_index.complete("노형", limit=3)) == 3
+    assert autocomplete_index.complete("테헤", sido="부산") == []
+    assert autocomplete_index.complete("") == []
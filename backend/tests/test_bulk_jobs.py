@@ -0,0 +1,182 @@
+"""
+Bulk jobs: BulkJobManager bookkeeping and the upload -> result file -> status / pages /
+events / download flow (in-process workers, BULK_WORKERS=1).
+"""
+import codecs
+import csv
+import io
+import json
+import os
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.endpoints import address
+from app.api.endpoints.address import BulkJobManager
+from app.core.config import settings
+from app.utils.normalize import normalize_raw_key
+
+
+def _expired_job(manager: BulkJobManager, tmp_path, running: bool) -> tuple[str, str]:
+    job_id = manager.create_job()
+    path = tmp_path / f"{job_id}.csv"
+    path.write_text("refined_address\n", encoding="utf-8")
+    manager.update_job(job_id, is_running=running, result_path=str(path),
+                       created_at=time.time() - manager.job_ttl - 1)
+    return job_id, str(path)
+
+
+def test_cleanup_removes_finished_jobs_with_their_files(tmp_path):
+    manager = BulkJobManager()
+    job_id, path = _expired_job(manager, tmp_path, running=False)
+    manager.create_job()
+    assert manager.get_job(job_id) is None
+    assert not os.path.exists(path)
+
+
+def test_cleanup_keeps_running_jobs_until_they_finish(tmp_path):
+    manager = BulkJobManager()
+    job_id, path = _expired_job(manager, tmp_path, running=True)
+    manager.create_job()
+    assert manager.get_job(job_id) is not None
+    assert os.path.exists(path)
+
+    manager.finish_job(job_id)
+    manager.create_job()
+    assert manager.get_job(job_id) is None
+    assert not os.path.exists(path)
+
+
+# --- Upload -> spooled result file -> status / pages / events / download ---
+PREFIX = "/api/v1/address"
+TEHERAN = "서울특별시 강남구 테헤란로 152 (역삼동)"
+PANGYO = "경기도 성남시 분당구 판교역로 166 (백현동)"
+# (input, refined_address) - rows 0 / 2 / 5 and 1 / 4 are duplicates after normalize_raw_key
+ROWS = [
+    ("서울특별시 강남구 테헤란로 152", TEHERAN),
+    ("판교역로 166", PANGYO),
+    ("  서울특별시  강남구 테헤란로 １５２ ", TEHERAN),
+    ("테헤란로 999", ""),
+    ("판교역로 166", PANGYO),
+    ("서울특별시 강남구 테헤란로 152", TEHERAN),
+]
+
+
+def test_normalize_raw_key():
+    assert normalize_raw_key("  서울특별시  강남구 테헤란로 １５２ ") == "서울특별시 강남구 테헤란로 152"
+    assert normalize_raw_key(None) == ""
+
+
+def _csv(rows, encoding="utf-8") -> bytes:
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["no", "주소"])
+    writer.writerows((i, raw) for i, (raw, _) in enumerate(rows))
+    return out.getvalue().encode(encoding)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "BULK_CHUNK_ROWS", 2)  # duplicates cross chunk boundaries
+    app = FastAPI()
+    app.include_router(address.router, prefix=PREFIX)
+    with TestClient(app) as c:
+        yield c
+
+
+def _run_job(client, body: bytes) -> str:
+    # TestClient runs the background task before the response returns
+    response = client.post(f"{PREFIX}/bulk-normalize", files={"file": ("input.csv", body, "text/csv")})
+    assert response.status_code == 200
+    return response.json()["job_id"]
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+def test_bulk_job_dedups_and_keeps_row_order(client, index_state, encoding):
+    job_id = _run_job(client, _csv(ROWS, encoding))
+
+    status = client.get(f"{PREFIX}/bulk-status/{job_id}").json()
+    assert status["is_running"] is False
+    assert (status["current_row"], status["total_rows"]) == (6, 6)
+    assert (status["success_rows"], status["failed_rows"]) == (5, 1)
+    assert status["normalized_rows"] == 3
+    assert status["dedup_ratio"] == 0.5
+
+    page = client.get(f"{PREFIX}/bulk-results/{job_id}", params={"offset": 0, "limit": 1000}).json()
+    assert [(r["주소"], r["refined_address"]) for r in page["rows"]] == ROWS
+    assert [r["no"] for r in page["rows"]] == [str(i) for i in range(6)]
+    assert page["has_more"] is False
+    assert not [name for name in os.listdir(settings.BULK_SPOOL_DIR) if name.startswith("upload_")]
+
+
+def test_dedup_key_limit_keeps_results(client, monkeypatch, index_state):
+    monkeypatch.setattr(settings, "BULK_DEDUP_MAX_KEYS", 1)
+    job_id = _run_job(client, _csv(ROWS))
+    page = client.get(f"{PREFIX}/bulk-results/{job_id}").json()
+    assert [r["refined_address"] for r in page["rows"]] == [refined for _, refined in ROWS]
+
+
+def test_bulk_results_pages(client, warm_indexes):
+    job_id = _run_job(client, _csv(ROWS))
+    seen, offset = [], 0
+    while True:
+        page = client.get(f"{PREFIX}/bulk-results/{job_id}", params={"offset": offset, "limit": 4}).json()
+        assert page["offset"] == offset and page["count"] <= 4
+        seen += [r["no"] for r in page["rows"]]
+        offset = page["next_offset"]
+        if not page["has_more"]:
+            break
+    assert seen == [str(i) for i in range(6)]
+    # Starting inside a chunk
+    page = client.get(f"{PREFIX}/bulk-results/{job_id}", params={"offset": 3, "limit": 2}).json()
+    assert [r["no"] for r in page["rows"]] == ["3", "4"]
+    assert client.get(f"{PREFIX}/bulk-results/unknown").status_code == 404
+
+
+def _events(text: str) -> list[tuple[str | None, str, dict]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields.get("id"), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_bulk_events_stream(client, warm_indexes):
+    job_id = _run_job(client, _csv(ROWS))
+    events = _events(client.get(f"{PREFIX}/bulk-events/{job_id}").text)
+    names = [name for _, name, _ in events]
+    assert names[0] == "progress" and names[-1] == "done"
+    rows = [r["no"] for _, name, data in events if name == "rows" for r in data["rows"]]
+    assert rows == [str(i) for i in range(6)]
+    assert events[-1][2]["count"] == 6 and events[-1][2]["download_url"].endswith(job_id)
+
+    # Reconnect: Last-Event-ID resumes after the rows already received
+    resumed = _events(client.get(f"{PREFIX}/bulk-events/{job_id}", headers={"Last-Event-ID": "4"}).text)
+    assert [r["no"] for _, name, data in resumed if name == "rows" for r in data["rows"]] == ["4", "5"]
+
+
+def test_bulk_download(client, warm_indexes):
+    job_id = _run_job(client, _csv(ROWS))
+    response = client.get(f"{PREFIX}/bulk-download/{job_id}")
+    assert response.status_code == 200
+    assert response.content.startswith(codecs.BOM_UTF8)
+    assert "refined_input.csv" in response.headers["content-disposition"]
+    records = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert [(r["주소"], r["refined_address"]) for r in records] == ROWS
+
+
+def test_header_only_upload_keeps_the_header(client, warm_indexes):
+    full = client.get(f"{PREFIX}/bulk-download/{_run_job(client, _csv(ROWS[:1]))}").content
+    job_id = _run_job(client, _csv([]))
+    status = client.get(f"{PREFIX}/bulk-status/{job_id}").json()
+    assert (status["is_running"], status["total_rows"]) == (False, 0)
+    content = client.get(f"{PREFIX}/bulk-download/{job_id}").content
+    assert content.startswith(codecs.BOM_UTF8)
+    assert content.decode("utf-8-sig") == full.decode("utf-8-sig").splitlines(keepends=True)[0]
+    assert client.get(f"{PREFIX}/bulk-results/{job_id}").json()["rows"] == []
+
+
+def test_download_waits_for_the_job(client):
+    job_id = address.bulk_job_manager.create_job()
+    assert client.get(f"{PREFIX}/bulk-download/{job_id}").status_code == 409
+    address.bulk_job_manager.finish_job(job_id)
@@ -0,0 +1,55 @@
+"""
+bulk_matcher.match_exact: one staging-table join resolves the unambiguous road + number rows.
+"""
+import pytest
+from sqlalchemy import text
+from app.services.address_parser import parse_address
+from app.services.bulk_matcher import match_exact
+from app.services.local_search import LocalSearchService
+
+
+def refined(db, inputs):
+    found = match_exact(db, [parse_address(raw) for raw in inputs])
+    return {i: res.refined_address for i, res in found.items()}
+
+
+def test_unique_hits_are_resolved(db, index_state):
+    inputs = ["테헤란로 152", "가산디지털 1로 168", "테헤란로 999", "판교역로 166 1동 101호"]
+    assert refined(db, inputs) == {
+        0: "서울특별시 강남구 테헤란로 152 (역삼동)",
+        1: "서울특별시 금천구 가산디지털1로 168 (가산동)",
+        3: "경기도 성남시 분당구 판교역로 166 (백현동)",
+    }
+
+
+def test_same_result_as_the_row_wise_search(db, warm_indexes):
+    raw = "분당구 판교역로 166"
+    assert match_exact(db, [parse_address(raw)])[0] == LocalSearchService(db).search(raw)
+
+
+def test_ambiguous_rows_are_left_to_the_row_wise_path(db, index_state):
+    # 중앙로 25 exists in 제주 and 대전
+    assert refined(db, ["중앙로 25"]) == {}
+
+
+def test_region_hint_narrows_the_join(db, warm_indexes):
+    assert refined(db, ["대전 중구 중앙로 25"]) == {0: "대전광역시 중구 중앙로 25 (은행동)"}
+
+
+@pytest.mark.parametrize("raw", [
+    "없는구 테헤란로 152",             # hint the gazetteer does not know
+    "Teheran-ro 152, Gangnam-gu, Seoul",  # English input
+    "우림라이온스밸리",                  # no road / number
+    "해운대구 우동 1458",               # lot number address
+])
+def test_rows_that_are_not_staged(db, warm_indexes, raw):
+    assert refined(db, [raw]) == {}
+
+
+def test_region_hints_are_not_staged_before_the_gazetteer_loads(db, cold_indexes):
+    assert refined(db, ["대전 중구 중앙로 25"]) == {}
+
+
+def test_staging_rows_are_rolled_back(db, index_state):
+    refined(db, ["테헤란로 152", "판교역로 166"])
+    assert db.execute(text("SELECT COUNT(*) FROM bulk_stage")).scalar() == 0
@@ -0,0 +1,53 @@
+"""
+Bulk worker pool: workers load the parent's snapshots and give the same rows as the
+in-process path.
+"""
+import os
+import pytest
+from app.core.config import settings
+from app.db import fulltext
+from app.services import bulk_worker, memory_index
+
+CHUNKS = [
+    ["서울특별시 강남구 테헤란로 152", "판교역로 166", "테헤란로 999"],
+    ["해운대구 우동 1458 두산위브 105동 2001호", "제주시 일도2동 486"],
+    [],
+    ["우림라이온스밸리"],
+]
+
+
+def worker_state() -> dict:
+    """Runs inside a worker process"""
+    return {
+        "pid": os.getpid(),
+        "fts_ready": fulltext._fts_ready,
+        "ready": {index.name: index.is_ready for index in memory_index._registry},
+    }
+
+
+@pytest.fixture
+def pool(monkeypatch, warm_indexes):
+    monkeypatch.setattr(settings, "BULK_WORKERS", 2)
+    bulk_worker.shutdown_pool()
+    yield bulk_worker._get_pool()
+    bulk_worker.shutdown_pool()
+
+
+def test_workers_load_snapshots_and_fts(pool):
+    state = pool.submit(worker_state).result(timeout=120)
+    assert state["pid"] != os.getpid()
+    assert state["fts_ready"]
+    assert all(state["ready"].values()), state["ready"]
+
+
+def test_pool_matches_in_process_rows(pool, monkeypatch):
+    pooled = list(bulk_worker.normalize_chunks(CHUNKS, lambda: False))
+    monkeypatch.setattr(settings, "BULK_WORKERS", 1)
+    assert pooled == [bulk_worker.normalize_chunk(chunk) for chunk in CHUNKS]
+    snapshot_files = os.listdir(settings.INDEX_SNAPSHOT_DIR)
+    assert not [name for name in snapshot_files if name.endswith(".tmp")]
+
+
+def test_reload_retires_the_pool(pool):
+    memory_index.invalidate_indexes().join()
+    assert bulk_worker._pool is None
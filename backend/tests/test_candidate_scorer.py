@@ -0,0 +1,101 @@
+"""
+candidate_scorer: feature vector and the acceptance rules that replaced the fallback tiers.
+"""
+from types import SimpleNamespace
+from app.services.candidate_scorer import F, FEATURES, QueryFeatures, _features, rank_candidates
+
+
+def row(id, road_nm="테헤란로", buld_mainsn=152, buld_subsn=0, jibun_main=737, jibun_sub=0,
+        si_nm="서울특별시", sgg_nm="강남구", emd_nm="역삼동", ri_nm=None, buld_nm=None):
+    return SimpleNamespace(id=id, road_nm=road_nm, buld_mainsn=buld_mainsn, buld_subsn=buld_subsn,
+                           jibun_main=jibun_main, jibun_sub=jibun_sub, si_nm=si_nm, sgg_nm=sgg_nm,
+                           emd_nm=emd_nm, ri_nm=ri_nm, buld_nm=buld_nm, buld_nm_key=None)
+
+
+def ids(q, rows):
+    return [r.id for _, r in rank_candidates(q, rows)]
+
+
+def active(q, r):
+    return {name for name, on in zip(FEATURES, _features(q, r)) if on}
+
+
+def test_feature_vector():
+    q = QueryFeatures(road_names=frozenset({"테헤란로"}), road_name="테헤란로", main=152, sub=0,
+                      sido="서울", sgg_names=frozenset({"강남구"}))
+    assert active(q, row(1)) == {"road_exact", "main", "sub", "sido", "sgg"}
+    assert active(q, row(2, road_nm="테헤란로7길")) == {"road_partial", "main", "sub", "sido", "sgg"}
+    assert len(FEATURES) == len(F)
+
+
+def test_road_and_number_rank_above_partial_road():
+    q = QueryFeatures(road_names=frozenset({"중앙로"}), road_name="중앙로", main=25)
+    rows = [row(1, road_nm="중앙로12길", buld_mainsn=25), row(2, road_nm="중앙로", buld_mainsn=25),
+            row(3, road_nm="중앙로", buld_mainsn=26)]
+    assert ids(q, rows) == [2, 1]
+
+
+def test_without_number_only_exact_road_counts():
+    q = QueryFeatures(road_names=frozenset({"중앙로"}), road_name="중앙로")
+    assert ids(q, [row(1, road_nm="중앙로12길"), row(2, road_nm="중앙로")]) == [2]
+
+
+def test_sub_number_breaks_ties():
+    q = QueryFeatures(road_names=frozenset({"테헤란로"}), road_name="테헤란로", main=152, sub=1)
+    assert ids(q, [row(1, buld_subsn=0), row(2, buld_subsn=1)]) == [2, 1]
+
+
+def test_lot_number_needs_a_place():
+    q = QueryFeatures(jibun_main=737, emd_names=frozenset({"역삼동"}))
+    assert ids(q, [row(1, emd_nm="삼성동"), row(2), row(3, jibun_main=738)]) == [2]
+
+
+def test_lot_number_with_ri():
+    q = QueryFeatures(jibun_main=1159, ri_names=frozenset({"구억리"}))
+    assert ids(q, [row(1, jibun_main=1159, ri_nm="구억리", emd_nm="안덕면")]) == [1]
+
+
+def test_building_name_must_agree_with_a_typed_number():
+    rows = [row(1, buld_nm="우림 라이온스밸리", buld_mainsn=168), row(2, buld_nm="라이온스타워", buld_mainsn=5)]
+    assert ids(QueryFeatures(building_key="라이온스"), rows) == [1, 2]
+    assert ids(QueryFeatures(building_key="라이온스", main=168), rows) == [1]
+
+
+def test_text_feature_uses_the_text_number():
+    """'태평로1가 839': the parsed road number (1) is not the lot number the text carries"""
+    rows = [row(1, road_nm="세종대로", buld_mainsn=110, emd_nm="태평로1가", jibun_main=31),
+            row(2, road_nm="세종대로", buld_mainsn=186, emd_nm="태평로1가", jibun_main=839)]
+    q = QueryFeatures(road_names=frozenset({"태평로"}), road_name="태평로", main=1,
+                      text_emds=frozenset({"태평로1가"}), text_main=839)
+    assert ids(q, rows) == [2]
+    assert "text" not in active(q, rows[0])
+    # No number after the text tokens: the text alone never accepts a row
+    assert ids(QueryFeatures(text_emds=frozenset({"태평로1가"})), rows) == []
+
+
+def test_text_feature_on_roads():
+    q = QueryFeatures(text_roads=frozenset({"가산디지털1로"}), text_main=168)
+    assert ids(q, [row(1, road_nm="가산디지털1로", buld_mainsn=168), row(2, road_nm="가산디지털1로")]) == [1]
+
+
+def test_region_features_order_candidates():
+    q = QueryFeatures(road_names=frozenset({"중앙로"}), road_name="중앙로", main=25, sido="대전")
+    rows = [row(1, road_nm="중앙로", buld_mainsn=25, si_nm="제주특별자치도"),
+            row(2, road_nm="중앙로", buld_mainsn=25, si_nm="대전광역시")]
+    assert ids(q, rows) == [2, 1]
+
+
+def test_sgg_hint_is_a_substring_while_the_gazetteer_loads():
+    q = QueryFeatures(sgg_hint="팔달")
+    assert _features(q, row(1, sgg_nm="수원시 팔달구"))[F["sgg"]]
+    q = QueryFeatures(sgg_hint="팔달", sgg_names=frozenset({"수원시 장안구"}))
+    assert not _features(q, row(1, sgg_nm="수원시 팔달구"))[F["sgg"]]
+
+
+def test_ties_keep_id_order():
+    q = QueryFeatures(road_names=frozenset({"중앙로"}), road_name="중앙로", main=25)
+    assert ids(q, [row(9, road_nm="중앙로", buld_mainsn=25), row(4, road_nm="중앙로", buld_mainsn=25)]) == [4, 9]
+
+
+def test_no_rows():
+    assert rank_candidates(QueryFeatures(main=1), []) == []
@@ -0,0 +1,110 @@
+"""
+ColumnarStore: column files per data signature, mmap rows equal to the SQL rows.
+"""
+import os
+import numpy as np
+import pytest
+from sqlalchemy import select
+from app.core.config import settings
+from app.models.local_address import AddressMaster
+from app.services.columnar_store import ColumnarStore, INT_COLUMNS, DICT_COLUMNS, HEAP_COLUMNS, columnar_store
+from app.services.local_search import LocalSearchService
+from app.services.memory_index import data_signature
+
+COLUMNS = INT_COLUMNS + DICT_COLUMNS + HEAP_COLUMNS
+
+
+@pytest.fixture
+def store(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "INDEX_SNAPSHOT_DIR", str(tmp_path))
+    store = ColumnarStore()
+    store.load_or_build(db)
+    return store
+
+
+def sql_rows(db, ids):
+    stmt = select(*(getattr(AddressMaster, c) for c in COLUMNS)).where(AddressMaster.id.in_(ids))
+    return {row.id: row for row in db.execute(stmt)}
+
+
+def vars_of(row):
+    return {c: getattr(row, c) for c in COLUMNS}
+
+
+def test_rows_match_sql(db, store):
+    ids = [r.id for r in db.query(AddressMaster.id).order_by(AddressMaster.id.desc()).limit(40)]
+    rows = store.fetch(ids)
+    assert [r.id for r in rows] == ids
+    expected = sql_rows(db, ids)
+    for r in rows:
+        assert vars_of(r) == dict(expected[r.id]._mapping)
+        assert r.road_address == AddressMaster(**dict(expected[r.id]._mapping)).road_address
+
+
+def test_nulls_and_missing_ids(db, store):
+    ri_row = db.query(AddressMaster).filter(AddressMaster.ri_nm != None).first()
+    plain = db.query(AddressMaster).filter(AddressMaster.ri_nm == None, AddressMaster.buld_nm == None).first()
+    rows = store.fetch([plain.id, 10 ** 9, ri_row.id, -1])
+    assert [r.id for r in rows] == [plain.id, ri_row.id]
+    assert rows[0].ri_nm is None and rows[0].buld_nm is None and rows[0].buld_nm_key is None
+    assert rows[1].ri_nm == ri_row.ri_nm
+    assert store.fetch([10 ** 9]) == []
+
+
+def test_snapshot_is_reopened_as_mmap(db, store, tmp_path):
+    signature = data_signature(db)
+    assert os.listdir(tmp_path / "columnar") == [f"{signature[0]}_{signature[1]}"]
+
+    reopened = ColumnarStore()
+    reopened.load_or_build(db, signature, build=False)  # a bulk worker: load only
+    assert reopened.is_ready
+    assert isinstance(reopened.ints["id"], np.memmap)
+    some_id = int(store.ints["id"][5])
+    assert vars_of(reopened.fetch([some_id])[0]) == vars_of(store.fetch([some_id])[0])
+    assert not reopened._load_snapshot((signature[0] + 1, signature[1]))
+
+
+@pytest.mark.parametrize("snapshot_dir", [True, False])
+def test_build_in_small_batches(db, tmp_path, monkeypatch, snapshot_dir):
+    """Batches that do not divide the row count; with and without column files"""
+    monkeypatch.setattr(settings, "INDEX_SNAPSHOT_DIR", str(tmp_path) if snapshot_dir else "")
+    monkeypatch.setattr(ColumnarStore, "BATCH_ROWS", 7)
+    built = ColumnarStore()
+    built.load_or_build(db)
+    ids = [r.id for r in db.query(AddressMaster.id).order_by(AddressMaster.id)]
+    expected = sql_rows(db, ids)
+    assert [vars_of(r) for r in built.fetch(ids)] == [dict(expected[i]._mapping) for i in ids]
+    assert isinstance(built.ints["id"], np.memmap) == snapshot_dir
+    assert not [name for name in os.listdir(tmp_path) if ".tmp" in name]
+
+
+@pytest.fixture
+def legacy_row(db):
+    """해운대로 620 as a pre-compact row: stored full strings that differ from the rebuilt ones"""
+    row = db.query(AddressMaster).filter_by(road_nm="해운대로", buld_mainsn=620).one()
+    row.road_full_addr = "부산광역시 해운대구 해운대로 620 (우동)"
+    row.jibun_full_addr = "부산광역시 해운대구 우동 1458번지"
+    db.commit()
+    yield row
+    row.road_full_addr = row.jibun_full_addr = None
+    db.commit()
+
+
+def test_legacy_rows_render_like_the_sql_backend(db, legacy_row, tmp_path, monkeypatch, warm_indexes):
+    monkeypatch.setattr(settings, "INDEX_SNAPSHOT_DIR", str(tmp_path))
+    columnar_store.invalidate()
+    columnar_store.load_or_build(db)
+    try:
+        results = {}
+        for backend in ("sql", "columnar"):
+            monkeypatch.setattr(settings, "SEARCH_ROW_BACKEND", backend)
+            results[backend] = LocalSearchService(db).search("해운대구 해운대로 620")
+        assert results["sql"].jibun_address == legacy_row.jibun_full_addr
+        assert results["columnar"] == results["sql"]
+    finally:
+        columnar_store.invalidate()
+
+
+def test_not_ready_falls_back(store):
+    store.invalidate()
+    assert store.fetch([1]) is None
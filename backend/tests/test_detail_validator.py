@@ -0,0 +1,43 @@
+"""
+Detail validation: 동/층/호 parts of the input against the building's address_detail records.
+"""
+import pytest
+from app.models.local_address import AddressDetail, AddressMaster
+from app.services.detail_validator import DetailParts, validate_detail, validate_details
+
+
+@pytest.fixture
+def mgmt_no(db):
+    """해운대로 620: 105동 2001호 / 2002호, recorded without 층"""
+    return db.query(AddressMaster.mgmt_no).filter_by(road_nm="해운대로", buld_mainsn=620).scalar()
+
+
+def test_verified_in_the_stored_spelling(db, mgmt_no):
+    assert validate_detail(db, mgmt_no, DetailParts(dong="105 동", ho="2001호")) == ("105동 2001호", "verified")
+    assert validate_detail(db, mgmt_no, DetailParts(dong="105동", floor="20층", ho="2002호")) == \
+        ("105동 20층 2002호", "verified")
+
+
+def test_not_found_and_unknown(db, mgmt_no):
+    other = db.query(AddressMaster.mgmt_no).filter_by(road_nm="테헤란로").scalar()
+    assert validate_details(db, [
+        (mgmt_no, DetailParts(dong="105동", ho="9999호")),
+        (other, DetailParts(ho="101호")),
+        (mgmt_no, DetailParts()),
+        (None, DetailParts(ho="101호")),
+    ]) == [(None, "not_found"), (None, "unknown"), (None, None), (None, None)]
+
+
+def test_floor_only_input_is_not_verified_by_records_without_floors(db, mgmt_no):
+    assert validate_detail(db, mgmt_no, DetailParts(floor="5층")) == (None, "unverified")
+
+
+def test_floor_only_input_is_checked_when_records_have_floors(db, mgmt_no):
+    db.add(AddressDetail(mgmt_no=mgmt_no, dong="106동", floor="5층", ho="501호"))
+    db.flush()
+    try:
+        assert validate_detail(db, mgmt_no, DetailParts(floor="5층")) == ("5층", "verified")
+        # The records without 층 cannot rule 7층 out either
+        assert validate_detail(db, mgmt_no, DetailParts(floor="7층")) == (None, "unverified")
+    finally:
+        db.rollback()
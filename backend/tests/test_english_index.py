@@ -0,0 +1,40 @@
+"""
+EnglishIndex: English input translated to the stored Korean road / region names.
+"""
+import pytest
+from app.services.english_index import EnglishIndex, english_index, fold_english, is_english_address
+from app.utils.import_address_data import DictionaryWriter
+
+
+def test_is_english_address():
+    assert is_english_address("Teheran-ro 152, Gangnam-gu, Seoul")
+    assert not is_english_address("테헤란로 152")
+    assert fold_english("Teheran-ro") == "teheranro"
+
+
+def test_parse(db, warm_indexes):
+    parsed = english_index.parse(db, "Teheran-ro 152, Gangnam-gu, Seoul")
+    assert parsed.road_names == ("테헤란로",)
+    assert (parsed.main, parsed.sub) == (152, 0)
+    assert parsed.sido == "서울특별시"
+    assert parsed.sgg_names == ("강남구",)
+
+
+@pytest.fixture
+def punctuated_road(db):
+    """A dictionary entry whose English name has punctuation the old SQL fold kept"""
+    DictionaryWriter(db).add_road("세종대로1길", "Sejong-daero 1(il)-gil")
+    db.flush()
+    yield "sejongdaero1ilgil"
+    db.rollback()
+
+
+def test_road_names_fold_the_same_while_loading(db, punctuated_road):
+    warm = EnglishIndex()
+    warm._build(db)
+    warm.is_ready = True
+    cold = EnglishIndex()
+    keys = {punctuated_road, "teheranro", "sejongdaero1(il)gil"}  # the last one: the old SQL fold
+    assert cold.road_names(db, keys) == warm.road_names(db, keys) == {
+        punctuated_road: ("세종대로1길",), "teheranro": ("테헤란로",)
+    }
@@ -0,0 +1,27 @@
+"""
+ExactMatchIndex: (road, building number) -> ids without touching the DB.
+"""
+from app.models.local_address import AddressMaster
+from app.services.exact_index import exact_index
+
+
+def address_id(db, road_nm, main, **filters):
+    return db.query(AddressMaster.id).filter_by(road_nm=road_nm, buld_mainsn=main, **filters).scalar()
+
+
+def test_lookup(db, warm_indexes):
+    teheran = address_id(db, "테헤란로", 152)
+    assert exact_index.lookup(["테헤란로"], 152) == [teheran]
+    assert exact_index.lookup(["테헤란로"], 152, sido_hint="서울") == [teheran]
+    assert exact_index.lookup(["테헤란로"], 152, sido_hint="부산") == []
+    assert exact_index.lookup(["테헤란로"], 999) == []
+    assert exact_index.has_road("테헤란로") and not exact_index.has_road("테헤란")
+
+
+def test_region_filters(db, warm_indexes):
+    jeju = address_id(db, "중앙로", 25, si_nm="제주특별자치도")
+    daejeon = address_id(db, "중앙로", 25, si_nm="대전광역시")
+    assert exact_index.lookup(["중앙로"], 25) == sorted([jeju, daejeon])
+    assert exact_index.lookup(["중앙로"], 25, sgg_hints=("제주",)) == [jeju]
+    assert exact_index.lookup(["중앙로"], 25, sgg_names=("중구",)) == [daejeon]
+    assert exact_index.lookup(["중앙로"], 25, sub=None, limit=1) == [min(jeju, daejeon)]
@@ -0,0 +1,30 @@
+"""
+Building-name full-text filter: the FTS5 trigram path finds the same rows as the key scan.
+"""
+import pytest
+from app.db import fulltext
+from app.models.local_address import AddressMaster
+from app.utils.normalize import normalize_building_key
+
+
+def building_ids(db, name):
+    return sorted(r.id for r in db.query(AddressMaster.id).filter(fulltext.building_name_filter(name)))
+
+
+def test_normalize_building_key():
+    assert normalize_building_key("우림 라이온스 밸리") == "우림라이온스밸리"
+    assert normalize_building_key("ＧＳ 타워") == "gs타워"
+    assert normalize_building_key(None) == ""
+
+
+@pytest.mark.parametrize("name", ["우림 라이온스", "두산위브", "노형12차", "더샵", "정답"])
+def test_fts_and_scan_agree(db, name):
+    fulltext._fts_ready = False
+    scanned = building_ids(db, name)
+    fulltext.ensure_building_fts()
+    try:
+        assert fulltext._fts_ready
+        assert building_ids(db, name) == scanned
+        assert scanned
+    finally:
+        fulltext._fts_ready = False
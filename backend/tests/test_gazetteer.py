@@ -0,0 +1,31 @@
+"""
+Gazetteer: parser region hints validated against the stored names and codes.
+"""
+from app.services.address_parser import RegionHints
+from app.services.gazetteer import gazetteer, name_variants
+
+
+def test_resolve(warm_indexes):
+    region = gazetteer.resolve(RegionHints("서울특별시", "강남구", "역삼동", None))
+    assert region.resolved
+    assert (region.sido, region.sgg_names, region.emd_names) == ("서울특별시", ("강남구",), ("역삼동",))
+    assert region.sido_cd is not None and region.sgg_cds and region.emd_cds is None  # emd codes unknown (0)
+
+
+def test_unknown_names_are_dropped(warm_indexes):
+    # Numbered 동 names match the stored hanja spelling
+    region = gazetteer.resolve(RegionHints(None, "없는구", "일도2동", None))
+    assert region.sgg is None and region.sgg_names is None
+    assert region.emd_names == ("일도이동",)
+    assert name_variants("일도2동") == ["일도2동", "일도이동"]
+
+
+def test_sgg_names_within_a_sido(warm_indexes):
+    assert gazetteer.sgg_names("중구") == ("중구",)
+    assert gazetteer.sgg_names("중구", sido="대전광역시") == ("중구",)
+    assert gazetteer.sgg_names("중구", sido="부산광역시") is None
+
+
+def test_hints_pass_through_while_loading(cold_indexes):
+    region = gazetteer.resolve(RegionHints("서울", "강남구", None, None))
+    assert not region.resolved and (region.sido, region.sgg) == ("서울", "강남구")
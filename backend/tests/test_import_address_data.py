@@ -0,0 +1,52 @@
+"""
+Importer helpers: region codes and the compact store conversion.
+"""
+from app.models.local_address import AddressMaster, AddressRegion, AddressRoad
+from app.utils.import_address_data import backfill_english_keys, compact_address_store, region_codes
+
+
+def test_region_codes_follow_the_beopjeongdong_code():
+    codes = region_codes("116803122001", "1168010100", 0)
+    assert codes == {"sido_cd": 11, "sgg_cd": 11680, "emd_cd": 11680101}
+
+
+def test_compact_moves_english_names_into_the_dictionaries(db):
+    legacy = AddressMaster(
+        mgmt_no="legacy-1", si_nm="서울특별시", sgg_nm="종로구", emd_nm="세종로", road_nm="사직로",
+        buld_mainsn=161, buld_subsn=0, jibun_main=1, jibun_sub=0,
+        road_full_addr="서울특별시 종로구 사직로 161 (지하)", jibun_full_addr="서울특별시 종로구 세종로 1",
+        si_nm_eng="Seoul", sgg_nm_eng="Jongno-gu", road_nm_eng="Sajik-ro",
+    )
+    db.add(legacy)
+    db.commit()
+    try:
+        compact_address_store()
+        db.expire_all()
+
+        row = db.get(AddressMaster, legacy.id)
+        assert row.road_full_addr is None and row.si_nm_eng is None and row.road_nm_eng is None
+        assert row.road_address == "서울특별시 종로구 사직로 161 (지하)"
+        assert row.jibun_address == "서울특별시 종로구 세종로 1"
+
+        road = db.query(AddressRoad).filter(AddressRoad.road_nm == "사직로").one()
+        assert (road.road_nm_eng, road.road_nm_eng_key) == ("Sajik-ro", "sajikro")
+        region = db.query(AddressRegion).filter(AddressRegion.sgg_nm == "종로구").one()
+        assert (region.si_nm_eng, region.sgg_nm_eng) == ("Seoul", "Jongno-gu")
+    finally:
+        db.query(AddressMaster).filter(AddressMaster.mgmt_no == "legacy-1").delete()
+        db.query(AddressRoad).filter(AddressRoad.road_nm == "사직로").delete()
+        db.query(AddressRegion).filter(AddressRegion.sgg_nm == "종로구").delete()
+        db.commit()
+
+
+def test_backfill_english_keys(db):
+    db.add(AddressRoad(road_nm="을지로", road_nm_eng="Eulji-ro"))
+    db.commit()
+    try:
+        assert backfill_english_keys() == 1
+        db.expire_all()
+        assert db.query(AddressRoad.road_nm_eng_key).filter(AddressRoad.road_nm == "을지로").scalar() == "euljiro"
+        assert backfill_english_keys() == 0
+    finally:
+        db.query(AddressRoad).filter(AddressRoad.road_nm == "을지로").delete()
+        db.commit()
@@ -0,0 +1,107 @@
+"""
+LocalSearchService.search golden queries (sample_data rows).
+Expected values are what the pre-index search (tiered fallback queries) returned for
+the same rows; inputs it could not handle are listed separately.
+"""
+import pytest
+from app.models.local_address import AddressMaster
+from app.services.address_parser import RegionHints
+from app.services.gazetteer import gazetteer
+from app.services.local_search import LocalSearchService
+
+# (input, refined_address of the baseline search)
+GOLDEN = [
+    ("서울특별시 강남구 테헤란로 152", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+    ("강남구 테헤란로 152", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+    ("서울 테헤란로 152", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+    ("테헤란로 152 10층", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+    ("가산디지털 1로 168", "서울특별시 금천구 가산디지털1로 168 (가산동)"),
+    ("분당구 판교역로 166", "경기도 성남시 분당구 판교역로 166 (백현동)"),
+    ("판교역로 166", "경기도 성남시 분당구 판교역로 166 (백현동)"),
+    ("판교역로 166 1동 101호", "경기도 성남시 분당구 판교역로 166 (백현동)"),
+    ("해운대구 우동 1458", "부산광역시 해운대구 해운대로 620 (우동)"),
+    ("해운대구 우동 1458 두산위브 105동 2001호", "부산광역시 해운대구 해운대로 620 (우동)"),
+    ("제주시 일도2동 486", "제주특별자치도 제주시 중앙로 25 (일도이동)"),
+    ("인천 미추홀구 주안동 110", "인천광역시 미추홀구 주안로 122 (주안동)"),
+    ("세종대로 110", "서울특별시 중구 세종대로 110 (태평로1가)"),
+    ("대전 중구 중앙로 25", "대전광역시 중구 중앙로 25 (은행동)"),
+    # 'N가' 동 + lot number (address text + number path)
+    ("중구 태평로1가 839", "서울특별시 중구 세종대로 186 (태평로1가)"),
+    ("서울 중구 태평로1가 839", "서울특별시 중구 세종대로 186 (태평로1가)"),
+    ("수원시 팔달구 매산로1가 18", "경기도 수원시 팔달구 덕영대로 924 (매산로1가)"),
+    # Building name matching more rows than MAX_CANDIDATES (the 중구 one has the highest id)
+    ("중구 더샵 아파트", "서울특별시 중구 다산로 100 (신당동)"),
+]
+
+# Inputs the baseline failed on (exceptions / no result) that resolve now
+IMPROVED = [
+    ("서울시 역삼1동 테헤란로 152", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+    ("성울특별시강남구봉은사로214", "서울특별시 강남구 봉은사로 214 (삼성동)"),
+    ("우림라이온스밸리", "서울특별시 금천구 가산디지털1로 168 (가산동)"),
+    ("제주시 일도이동 486", "제주특별자치도 제주시 중앙로 25 (일도이동)"),
+    ("제주 서귀포시 안덕면 [구억리, 1159-0]", "제주특별자치도 서귀포시 구억로 50 (안덕면 구억리)"),
+    ("중앙로 25 [연동, 대림2차아파트]", "제주특별자치도 제주시 중앙로 25 (일도이동)"),  # bracket building name
+    ("Teheran-ro 152, Gangnam-gu, Seoul", "서울특별시 강남구 테헤란로 152 (역삼동)"),
+]
+
+NOT_FOUND = ["테헤란로 999", "서울특별시청"]
+
+
+def refined(db, query):
+    result = LocalSearchService(db).search(query)
+    return result.refined_address if result else None
+
+
+@pytest.mark.parametrize("query,expected", GOLDEN + IMPROVED)
+def test_golden(db, index_state, query, expected):
+    assert refined(db, query) == expected
+
+
+@pytest.mark.parametrize("query", NOT_FOUND)
+def test_not_found(db, index_state, query):
+    assert refined(db, query) is None
+
+
+def test_ambiguous_road_lists_candidates(db, index_state):
+    result = LocalSearchService(db).search("중앙로 25")
+    assert result is not None
+    assert {c["sido"] for c in result.candidates} == {"제주특별자치도", "대전광역시"}
+
+
+def test_road_typo_fixed_by_speller(db, warm_indexes):
+    result = LocalSearchService(db).search("기산디지털1로 168")
+    assert result.refined_address == "서울특별시 금천구 가산디지털1로 168 (가산동)"
+    assert "Road Spelling Fixed" in result.message
+
+
+def test_lot_number_text_path_uses_text_number(db, index_state):
+    """The 'N가' token parses as road '태평로' + 1; the lot number after it must still match"""
+    result = LocalSearchService(db).search("중구 태평로1가 31")
+    assert result.road_address == "서울특별시 중구 세종대로 110"
+
+
+def test_broad_fetch_keeps_selective_rows(db, index_state):
+    """A road + number hit is not crowded out by hundreds of building-name rows"""
+    result = LocalSearchService(db).search("중앙로 25 아파트")
+    assert result.refined_address == "제주특별자치도 제주시 중앙로 25 (일도이동)"
+
+
+@pytest.fixture
+def uncoded_row(db):
+    """봉은사로 214 without region codes (not backfilled), 테헤란로 152 in the same 구 keeps them"""
+    row = db.query(AddressMaster).filter_by(road_nm="봉은사로", buld_mainsn=214).one()
+    codes = (row.sido_cd, row.sgg_cd)
+    row.sido_cd, row.sgg_cd = 0, None
+    db.commit()
+    yield row.id
+    row.sido_cd, row.sgg_cd = codes
+    db.commit()
+
+
+def test_region_filter_keeps_rows_without_codes(db, uncoded_row, warm_indexes):
+    region = gazetteer.resolve(RegionHints("서울특별시", "강남구", None, None))
+    assert region.sido_cd and region.sgg_cds
+    q = LocalSearchService(db)._region_filter(db.query(AddressMaster.id), region)
+    ids = {r.id for r in q}
+    assert uncoded_row in ids
+    assert ids == {r.id for r in db.query(AddressMaster.id).filter_by(si_nm="서울특별시", sgg_nm="강남구")}
@@ -0,0 +1,36 @@
+"""Resident index lifecycle: snapshots, invalidation after an import"""
+import os
+from app.services import memory_index
+from app.services.exact_index import exact_index
+from app.services.memory_index import data_signature, invalidate_indexes
+
+
+def test_snapshot_round_trip(db, warm_indexes):
+    ids = exact_index.lookup(["테헤란로"], 152)
+    assert ids
+    assert os.path.exists(exact_index.snapshot_path())
+
+    with exact_index.lock:
+        exact_index.is_ready = False
+        exact_index._reset()
+    exact_index.load_or_build(db)
+    assert exact_index.is_ready
+    assert exact_index.lookup(["테헤란로"], 152) == ids
+
+
+def test_stale_snapshot_is_rebuilt(db, warm_indexes):
+    with exact_index.lock:
+        exact_index.is_ready = False
+        exact_index._reset()
+    count, max_id = data_signature(db)
+    exact_index.load_or_build(db, (count + 1, max_id + 1))  # as if rows had been added
+    assert exact_index.signature == (count + 1, max_id + 1)
+    assert exact_index.lookup(["테헤란로"], 152)
+
+
+def test_invalidate_rebuilds_in_background(warm_indexes):
+    thread = invalidate_indexes()
+    assert thread is not None
+    thread.join(timeout=30)
+    assert all(index.is_ready for index in memory_index._registry)
+    assert exact_index.lookup(["테헤란로"], 152)
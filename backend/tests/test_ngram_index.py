@@ -0,0 +1,25 @@
+"""
+NgramIndex: road / 동 stems matching a LIKE-style pattern through bigram postings.
+"""
+from app.services.ngram_index import ngram_index
+
+
+def test_candidates(warm_indexes):
+    assert ngram_index.candidates("road", "가산디지털%1로") == ["가산디지털1로"]
+    assert ngram_index.candidates("road", "1로%가산") == []  # fragment order matters
+    assert ngram_index.candidates("road", "중앙", sido_hint="대전") == ["중앙로"]
+    assert ngram_index.candidates("road", "로") is None  # no bigram: not selective
+    assert ngram_index.candidates("road", "없는길") == []
+
+
+def test_jibun_candidates(warm_indexes):
+    assert ngram_index.candidates("jibun", "태평로1가") == ["태평로1가"]
+    assert ngram_index.candidates("jibun", "역삼", sgg_hint="강남") == ["역삼동"]
+    assert ngram_index.candidates("jibun", "역삼", sgg_hint="해운대") == []
+
+
+def test_fragments_spanning_a_space(warm_indexes):
+    # Stems are stored without spaces, so "강남구테헤란" matches "서울특별시 강남구 테헤란로"
+    assert ngram_index.candidates("road", "강남구테헤란") == ["테헤란로"]
+    assert ngram_index.candidates("road", "강남구%테헤란") == ["테헤란로"]
+    assert ngram_index.candidates("jibun", "안덕면구억리") == ["안덕면"]
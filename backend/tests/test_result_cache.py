@@ -0,0 +1,43 @@
+"""
+TTLCache (result / negative caches): LRU bound, per-entry TTL, counters, reload hook.
+"""
+from app.services import memory_index
+from app.services.result_cache import TTLCache, result_cache
+
+
+def test_lru_eviction():
+    cache = TTLCache("test", max_size=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # 'b' is now the least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    stats = cache.stats()
+    assert (stats["size"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 3, 1)
+    assert stats["hit_ratio"] == 0.75
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.services.result_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("test", max_size=10, ttl=5)
+    cache.put("a", 1)
+    now[0] += 4
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TTLCache("test", max_size=0, ttl=60)
+    cache.put("a", 1)
+    assert not cache.enabled and cache.get("a") is None
+    assert cache.stats()["misses"] == 0
+
+
+def test_reload_clears_the_caches():
+    result_cache.put("서울특별시 강남구 테헤란로 152", "cached")
+    memory_index.invalidate_indexes(rebuild=False)
+    assert result_cache.get("서울특별시 강남구 테헤란로 152") is None
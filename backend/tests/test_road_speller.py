@@ -0,0 +1,20 @@
+"""
+RoadSpeller: jamo-level BK-tree suggestions for road names that are not in the data.
+"""
+from app.services.road_speller import road_speller
+from app.utils.normalize import to_jamo
+
+
+def test_suggest(warm_indexes):
+    assert road_speller.suggest("기산디지털1로") == ["가산디지털1로"]
+    assert road_speller.suggest("기산디지털1로", sido="부산광역시") == []
+    assert road_speller.suggest("중로") == []  # too short to guess
+    assert road_speller.suggest("테헤란로") == []  # exact names are not suggestions
+
+
+def test_within():
+    assert len(to_jamo("기산")) == 5
+
+
+def test_within_distance(warm_indexes):
+    assert (1, "가산디지털1로") in road_speller.within("기산디지털1로", 1)
@@ -43,8 +43,8 @@ function App() {
 
   const [bulkData, setBulkData] = useState<{
     count: number;
-    results: any[];
-    csv_content: string;
+    results: any[];  // preview (first 100 rows)
+    download_url: string;
     filename: string;
   } | null>(null)
 
@@ -147,37 +147,74 @@ function App() {
       const jobId = response.data.job_id
       setCurrentJobId(jobId)
 
-      // 2. Poll for status
-      const poll = setInterval(async () => {
-        try {
-          const statusRes = await axios.get(`/api/v1/address/bulk-status/${jobId}`)
-          const statusData = statusRes.data
-
-          setBulkProgress({
-            current: statusData.current_row,
-            total: statusData.total_rows,
-            percent: statusData.progress_percent
+      const finishJob = async (done: { is_cancelled: boolean; count: number; download_url: string | null; filename: string | null }) => {
+        setBulkProcessing(false)
+        setLoading(false)
+
+        if (done.is_cancelled) {
+          setError('처리가 사용자에 의해 중단되었습니다.')
+        } else if (done.download_url) {
+          // Status is counters only; preview rows come from the paginated results endpoint
+          const page = await axios.get(`/api/v1/address/bulk-results/${jobId}`, { params: { offset: 0, limit: 100 } })
+          setBulkData({
+            count: done.count,
+            results: page.data.rows,
+            download_url: done.download_url,
+            filename: done.filename || 'refined.csv'
           })
+          alert(`처리 완료! ${done.count}건 정규화됨.`)
+        }
+      }
 
-          if (!statusData.is_running) {
+      // 2-B. Fallback: poll the counters-only status endpoint
+      const pollStatus = () => {
+        const poll = setInterval(async () => {
+          try {
+            const statusRes = await axios.get(`/api/v1/address/bulk-status/${jobId}`)
+            const statusData = statusRes.data
+
+            setBulkProgress({
+              current: statusData.current_row,
+              total: statusData.total_rows,
+              percent: statusData.progress_percent
+            })
+
+            if (!statusData.is_running) {
+              clearInterval(poll)
+              await finishJob({
+                is_cancelled: statusData.is_cancelled,
+                count: statusData.current_row,
+                download_url: statusData.download_url,
+                filename: statusData.filename
+              })
+            }
+          } catch (err) {
+            console.error('Polling error:', err)
             clearInterval(poll)
             setBulkProcessing(false)
             setLoading(false)
-
-            if (statusData.is_cancelled) {
-              setError('처리가 사용자에 의해 중단되었습니다.')
-            } else if (statusData.results_data) {
-              setBulkData(statusData.results_data)
-              alert(`처리 완료! ${statusData.results_data.count}건 정규화됨.`)
-            }
           }
-        } catch (err) {
-          console.error('Polling error:', err)
-          clearInterval(poll)
-          setBulkProcessing(false)
-          setLoading(false)
+        }, 800)
+      }
+
+      // 2. Progress pushed by the server (SSE, counters only - no result rows)
+      if (typeof EventSource === 'undefined') {
+        pollStatus()
+      } else {
+        const events = new EventSource(`/api/v1/address/bulk-events/${jobId}?rows=false`)
+        events.addEventListener('progress', (e) => {
+          const data = JSON.parse((e as MessageEvent).data)
+          setBulkProgress({ current: data.current_row, total: data.total_rows, percent: data.progress_percent })
+        })
+        events.addEventListener('done', (e) => {
+          events.close()
+          finishJob(JSON.parse((e as MessageEvent).data))
+        })
+        events.onerror = () => {
+          events.close()
+          pollStatus()
         }
-      }, 800)
+      }
 
     } catch (err: any) {
       console.error(err)
@@ -205,13 +242,9 @@ function App() {
   const downloadCsv = () => {
     if (!bulkData) return;
 
-    // Convert string to blob with UTF-8-BOM for Excel
-    const bom = new Uint8Array([0xEF, 0xBB, 0xBF]); // UTF-8 BOM
-    const blob = new Blob([bom, bulkData.csv_content], { type: 'text/csv;charset=utf-8' })
-
-    const url = window.URL.createObjectURL(blob)
+    // Streamed from the server's result file (UTF-8 with BOM for Excel)
     const link = document.createElement('a')
-    link.href = url
+    link.href = bulkData.download_url
     link.setAttribute('download', bulkData.filename)
     document.body.appendChild(link)
     link.click()
@@ -268,7 +301,7 @@ function App() {
       </div>
 
       <div className="card" style={{ marginTop: '1rem' }}>
-        <h3>Bulk Upload (대량 처리 - CSV, 최대 1,000건)</h3>
+        <h3>Bulk Upload (대량 처리 - CSV, UTF-8/CP949)</h3>
         <div className="input-row">
           <div className="address-input compact" style={{ color: '#888', display: 'flex', alignItems: 'center', flexDirection: 'column', gap: '0.5rem' }}>
             {bulkProcessing ? (